@@ -0,0 +1,131 @@
+"""
+Async Pipeline
+Overlaps reading documents from slow storage with running the Legal String
+Processor extractors on them.
+
+Reads run concurrently in threads, read documents wait in a bounded queue
+(so memory stays capped when extraction falls behind), and extraction runs
+in an executor so the event loop keeps reading meanwhile.
+"""
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from corpus_runner import DEFAULT_FIELDS, OPERATIONS, process_document
+
+def _read_text(path):
+    """Read a UTF-8 document."""
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+async def read_document(path):
+    """Read a document without blocking the event loop."""
+    return await asyncio.to_thread(_read_text, path)
+
+class SimulatedLatencyReader:
+    """Document reader that waits a fixed latency before each read.
+
+    Stands in for a slow network share in tests and benchmarks.
+    """
+
+    def __init__(self, latency):
+        if latency is None or latency < 0:
+            raise ValueError("Latency must be a non-negative number")
+        self.latency = latency
+
+    async def __call__(self, path):
+        await asyncio.sleep(self.latency)
+        return await read_document(path)
+
+    def read_blocking(self, path):
+        """Read the way a synchronous loop would, sleeping for the latency."""
+        time.sleep(self.latency)
+        return _read_text(path)
+
+async def run_pipeline(paths, ops=OPERATIONS, heading="SECTION", fields=DEFAULT_FIELDS,
+                       reader=read_document, concurrency=8, workers=4, queue_size=16,
+                       executor=None):
+    """Read and process every path, returning one result dict per path in order.
+
+    Up to concurrency reads are in flight, at most queue_size read documents
+    wait for extraction, and workers documents are extracted at a time in
+    executor (the loop's default thread pool when None; pass a
+    ProcessPoolExecutor to use several cores).  Read errors, including
+    files that are not UTF-8, are recorded under "read" in "errors" like
+    extractor errors.
+    """
+    if paths is None:
+        raise ValueError("Paths cannot be None")
+    if concurrency < 1 or workers < 1 or queue_size < 1:
+        raise ValueError("Concurrency, workers and queue size must be at least 1")
+    for op in ops:
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {op}")
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=queue_size)
+    results = {}
+    pending_paths = enumerate(paths)
+
+    async def read_all():
+        # Every reader pulls the next path from the shared iterator
+        for index, path in pending_paths:
+            try:
+                text = await reader(path)
+            except (OSError, UnicodeDecodeError) as e:
+                results[index] = {"id": path, "errors": {"read": str(e)}}
+                continue
+            # Waits while the queue is full, which holds back further reads
+            await queue.put((index, path, text))
+
+    async def process_all():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, path, text = item
+            if isinstance(executor, ProcessPoolExecutor):
+                call = (process_document,)
+            else:
+                # Executor threads do not inherit context variables, so run in
+                # a copy of this task's context (instrumentation lives there)
+                call = (contextvars.copy_context().run, process_document)
+            results[index] = await loop.run_in_executor(
+                executor, *call, path, text, ops, heading, fields)
+
+    readers = [asyncio.create_task(read_all()) for _ in range(concurrency)]
+    processors = [asyncio.create_task(process_all()) for _ in range(workers)]
+
+    async def finish_reading():
+        await asyncio.gather(*readers)
+        for _ in processors:
+            await queue.put(None)
+
+    try:
+        # Gathered together so a failing processor cannot leave readers
+        # blocked on a full queue
+        await asyncio.gather(finish_reading(), *processors)
+    finally:
+        for task in readers + processors:
+            task.cancel()
+
+    return [results[index] for index in range(len(results))]
+
+def process_files(paths, **kwargs):
+    """Run run_pipeline from synchronous code and return its results."""
+    return asyncio.run(run_pipeline(paths, **kwargs))
+
+def process_files_sequentially(paths, ops=OPERATIONS, heading="SECTION", fields=DEFAULT_FIELDS,
+                               read=_read_text):
+    """Read and process one document at a time, for comparison."""
+    results = []
+    for path in paths:
+        try:
+            text = read(path)
+        except (OSError, UnicodeDecodeError) as e:
+            results.append({"id": path, "errors": {"read": str(e)}})
+            continue
+        results.append(process_document(path, text, ops, heading, fields))
+    return results
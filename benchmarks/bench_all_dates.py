@@ -0,0 +1,45 @@
+"""
+Benchmark extract_all_dates against calling extract_date on the rest of the
+text after each date, by document size.
+Run with: python -m benchmarks.bench_all_dates
+"""
+import time
+
+from benchmarks.synthetic_corpus import generate_contract
+from legal_string_processor import extract_all_dates, extract_date
+
+SIZES = (16 * 1024, 128 * 1024, 1024 * 1024)
+
+def reslice_all_dates(text):
+    """Every date with its offsets, the way callers did it before extract_all_dates."""
+    dates = []
+    pos = 0
+    while True:
+        date = extract_date(text[pos:])
+        if not date:
+            return dates
+        start = text.find(date, pos)
+        pos = start + len(date)
+        dates.append((date, start, pos))
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return (min(timings), result)
+
+def main():
+    print(f"{'Size':>8} {'Dates':>6} {'Re-slicing':>12} {'All dates':>11} {'Speedup':>8} {'In 2000s':>10}")
+    for size in SIZES:
+        text = generate_contract(size)
+        reslice_seconds, expected = best_of(lambda: reslice_all_dates(text))
+        all_seconds, dates = best_of(lambda: extract_all_dates(text))
+        assert dates == expected, "Both should find the same dates"
+        range_seconds, _ = best_of(lambda: extract_all_dates(text, "2000-01-01", "2009-12-31", validate=True))
+        print(f"{size // 1024:>6}KB {len(dates):>6} {reslice_seconds * 1e3:>10.1f}ms "
+              f"{all_seconds * 1e3:>9.2f}ms {reslice_seconds / all_seconds:>7.0f}x {range_seconds * 1e3:>8.2f}ms")
+
+if __name__ == "__main__":
+    main()
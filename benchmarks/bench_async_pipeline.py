@@ -0,0 +1,47 @@
+"""
+Benchmark the async pipeline against a sequential read-then-extract loop
+over files behind a simulated storage latency.
+Run with: python -m benchmarks.bench_async_pipeline
+"""
+import os
+import tempfile
+import time
+
+from async_pipeline import SimulatedLatencyReader, process_files, process_files_sequentially
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def write_documents(directory, count, lines_per_document=200):
+    """Write count documents and return their paths."""
+    paths = []
+    for number in range(count):
+        path = os.path.join(directory, f"doc{number:05d}.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f"Smith {number} v. Jones Corp., {number} F.3d 456\n"
+                       f"Client: Client {number}\nDOB: 1980-05-15\n"
+                       f"SECTION 1. DEFINITIONS\n{FILLER * lines_per_document}"
+                       f"SECTION 2. TERM\nEffective on 2023-06-15.\n")
+        paths.append(path)
+    return paths
+
+def main(count=400, latency=0.01, concurrency=16):
+    reader = SimulatedLatencyReader(latency)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_documents(directory, count)
+
+        start = time.perf_counter()
+        expected = process_files_sequentially(paths, read=reader.read_blocking)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = process_files(paths, reader=reader, concurrency=concurrency)
+        pipelined = time.perf_counter() - start
+        assert results == expected, "Pipeline results differ from the sequential loop"
+
+    print(f"Documents: {count}, read latency: {latency * 1000:.0f}ms, concurrency: {concurrency}")
+    print(f"Sequential: {sequential:.2f}s ({count / sequential:,.0f} docs/s)")
+    print(f"Pipeline:   {pipelined:.2f}s ({count / pipelined:,.0f} docs/s)")
+    print(f"Speedup:    {sequential / pipelined:.2f}x")
+
+if __name__ == "__main__":
+    main()
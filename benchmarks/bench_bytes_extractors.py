@@ -0,0 +1,57 @@
+"""
+Benchmark the bytes extractors against decoding the whole document and
+calling the str extractors, on ASCII and non-ASCII UTF-8 documents.
+Run with: python -m benchmarks.bench_bytes_extractors
+"""
+import time
+import tracemalloc
+
+from legal_string_processor import (
+    extract_client_info,
+    extract_client_info_bytes,
+    extract_date,
+    extract_date_bytes,
+    find_section,
+    find_section_bytes,
+)
+
+def build_document(size_mb, filler):
+    """Return UTF-8 bytes of about size_mb megabytes with the values near the end."""
+    line = f"The Parties agree to the terms set out in this clause {filler}.\n"
+    body = line * (size_mb * 1024 * 1024 // len(line.encode("utf-8")))
+    return (f"SECTION 1. TERMS\n{body}SECTION 2. PARTIES\nClient: Jane Doe\n"
+            f"Signed on 2023-06-15.\n").encode("utf-8")
+
+def decode_then(func):
+    return lambda data, *args: func(data.decode("utf-8"), *args)
+
+def measure(func, *args):
+    """Return (result, seconds, peak traced bytes) of func(*args)."""
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (result, elapsed, peak)
+
+def main(size_mb=32):
+    operations = [
+        ("extract_date", extract_date, extract_date_bytes, ()),
+        ("extract_client_info", extract_client_info, extract_client_info_bytes, ("Client",)),
+        ("find_section", find_section, find_section_bytes, ("SECTION 2. PARTIES",)),
+    ]
+    for label, filler in (("ASCII", "and the schedules"), ("UTF-8 (§, —)", "§ 4 — résumé")):
+        data = build_document(size_mb, filler)
+        print(f"\n{label} document, {len(data) / 1e6:.0f} MB")
+        print(f"{'Operation':<20} {'decode + str':>22} {'bytes':>22}")
+        for name, str_func, bytes_func, args in operations:
+            expected, str_time, str_peak = measure(decode_then(str_func), data, *args)
+            result, bytes_time, bytes_peak = measure(bytes_func, data, *args)
+            assert result == expected
+            print(f"{name:<20} {str_time * 1000:>8.1f}ms {str_peak / 1e6:>8.1f}MB "
+                  f"{bytes_time * 1000:>10.1f}ms {bytes_peak / 1e6:>8.3f}MB")
+
+if __name__ == "__main__":
+    main()
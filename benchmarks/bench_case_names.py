@@ -0,0 +1,66 @@
+"""
+Benchmark extract_case_names_batch against the per-call loop.
+Run with: python -m benchmarks.bench_case_names
+"""
+import gc
+import time
+
+from legal_string_processor import (
+    extract_case_name,
+    extract_parties,
+    extract_case_names_batch,
+)
+
+def build_citations(count):
+    """Build a list of citations in both v. and vs. forms."""
+    citations = []
+    for i in range(count):
+        if i % 2 == 0:
+            citations.append(f"Smith {i} v. Jones Corp., {i} F.3d 456 (9th Cir. 2023)")
+        else:
+            citations.append(f"Brown {i} vs. Board of Education, {i} U.S. 483 (1954)")
+    return citations
+
+def per_call_loop(citations):
+    """Run extract_case_name and extract_parties one citation at a time."""
+    results = []
+    for citation in citations:
+        case_name = extract_case_name(citation)
+        results.append((case_name, extract_parties(case_name)))
+    return results
+
+def time_it(func, citations, repeat=3):
+    """Return the best elapsed seconds and the result for func(citations).
+
+    The garbage collector is paused while timing, as timeit does, so that
+    collections triggered by the result lists do not dominate the numbers.
+    """
+    best = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = func(citations)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if best is None or elapsed < best:
+            best = elapsed
+    return (best, result)
+
+def main(count=500000):
+    citations = build_citations(count)
+
+    loop_time, loop_result = time_it(per_call_loop, citations)
+    batch_time, batch_result = time_it(extract_case_names_batch, citations)
+    assert loop_result == batch_result, "Batch results differ from per-call loop"
+
+    print(f"Citations:      {count}")
+    print(f"Per-call loop:  {loop_time:.3f}s ({count / loop_time:,.0f}/s)")
+    print(f"Batch:          {batch_time:.3f}s ({count / batch_time:,.0f}/s)")
+    print(f"Speedup:        {loop_time / batch_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
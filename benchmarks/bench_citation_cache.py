@@ -0,0 +1,47 @@
+"""
+Benchmark the citation ExtractionCache on a stream with repeated citations.
+Run with: python -m benchmarks.bench_citation_cache
+"""
+import random
+import time
+
+from legal_string_processor import ExtractionCache, extract_case_name, extract_parties
+
+def build_citations(count, duplicate_ratio=0.4, seed=7):
+    """Build citations where about duplicate_ratio of them repeat leading cases."""
+    rng = random.Random(seed)
+    leading = [f"Leading {i} v. Landmark Corp., {i} U.S. 1 (1960)" for i in range(1000)]
+    citations = []
+    for number in range(count):
+        if rng.random() < duplicate_ratio:
+            citations.append(rng.choice(leading))
+        else:
+            citations.append(f"Smith {number} v. Jones Inc., {number} F.3d 456 (9th Cir. 2023)")
+    return citations
+
+def run(case_name_func, parties_func, citations):
+    """Return elapsed seconds to extract the case name and parties of every citation."""
+    start = time.perf_counter()
+    for citation in citations:
+        parties_func(case_name_func(citation))
+    return time.perf_counter() - start
+
+def main(count=500000, duplicate_ratios=(0.4, 0.7, 0.9)):
+    print(f"Citations: {count}")
+    print(f"{'Duplicates':>10} {'Uncached':>9} {'Cached':>9} {'Bytes-capped':>13} {'Hit rate':>9}")
+    for duplicate_ratio in duplicate_ratios:
+        citations = build_citations(count, duplicate_ratio)
+
+        uncached = run(extract_case_name, extract_parties, citations)
+        case_names = ExtractionCache(extract_case_name, max_entries=50000)
+        parties = ExtractionCache(extract_parties, max_entries=50000)
+        cached = run(case_names, parties, citations)
+        capped = run(ExtractionCache(extract_case_name, max_bytes=8 * 1024 * 1024),
+                     ExtractionCache(extract_parties, max_bytes=8 * 1024 * 1024), citations)
+
+        stats = case_names.stats()
+        hit_rate = stats["hits"] / (stats["hits"] + stats["misses"])
+        print(f"{duplicate_ratio:>10.0%} {uncached:>8.3f}s {cached:>8.3f}s {capped:>12.3f}s {hit_rate:>9.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark CitationIndex build throughput, memory per posting and queries
+against grouping raw case names in a dict of lists.
+Run with: python -m benchmarks.bench_citation_index [occurrences] [cases]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from benchmarks.synthetic_corpus import generate_citations
+from legal_string_processor import CitationIndex, extract_case_name, extract_parties
+
+CITATIONS_PER_DOCUMENT = 20
+
+def _variant(citation, rng):
+    """Return citation with the case, spacing or separator changed now and then."""
+    roll = rng.random()
+    if roll < 0.1:
+        return citation.upper()
+    if roll < 0.2:
+        return citation.replace(" v. ", " vs. ", 1) if " v. " in citation else citation.replace(" vs. ", " v. ", 1)
+    if roll < 0.3:
+        return citation.replace(" ", "  ", 2)
+    if roll < 0.35:
+        return citation.replace(" ", "\n", 1)
+    return citation
+
+def generate_occurrences(count, cases, seed=0):
+    """Return count (doc_id, citation, offset) triples citing cases distinct cases.
+
+    Popular cases are cited far more often than the rest, as in real briefs.
+    """
+    rng = random.Random(seed)
+    citations = generate_citations(cases, seed)
+    weights = [1 / (rank + 1) for rank in range(cases)]
+    chosen = rng.choices(citations, weights, k=count)
+    return [(f"brief-{number // CITATIONS_PER_DOCUMENT}", _variant(citation, rng),
+             (number % CITATIONS_PER_DOCUMENT) * 500)
+            for number, citation in enumerate(chosen)]
+
+def group_raw(occurrences):
+    """Group by the extracted case name, as callers did before CitationIndex."""
+    groups = {}
+    for doc_id, citation, offset in occurrences:
+        case_name = extract_case_name(citation)
+        extract_parties(case_name)
+        groups.setdefault(case_name, []).append((doc_id, offset))
+    return groups
+
+def measure(build):
+    """Return (result, build seconds, bytes retained by the result)."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (result, elapsed, retained)
+
+def main(count=200000, cases=5000):
+    occurrences = generate_occurrences(count, cases)
+    groups, raw_seconds, raw_bytes = measure(lambda: group_raw(occurrences))
+    index, index_seconds, index_bytes = measure(lambda: CitationIndex(occurrences))
+
+    print(f"Occurrences: {count:,} of {cases:,} cases in {count // CITATIONS_PER_DOCUMENT:,} documents "
+          f"(source strings are shared and not counted)")
+    print(f"{'Grouping':<16} {'Groups':>8} {'Build':>14} {'Per posting':>12}")
+    print(f"{'raw dict':<16} {len(groups):>8,} {count / raw_seconds:>12,.0f}/s {raw_bytes / count:>10.1f} B")
+    print(f"{'CitationIndex':<16} {len(index):>8,} {count / index_seconds:>12,.0f}/s {index_bytes / count:>10.1f} B")
+
+    queries = [citation for _, citation, _ in occurrences[:1000]]
+    for label, query in (("documents_citing", index.documents_citing), ("count", index.count)):
+        start = time.perf_counter()
+        for citation in queries:
+            query(citation)
+        print(f"{label + ' query':<28} {(time.perf_counter() - start) / len(queries) * 1e6:>8.1f} us")
+    start = time.perf_counter()
+    top = index.most_common(10)
+    print(f"{'most_common(10)':<28} {(time.perf_counter() - start) * 1e3:>8.1f} ms  top: {top[0][0]} ({top[0][1]:,})")
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
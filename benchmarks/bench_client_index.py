@@ -0,0 +1,80 @@
+"""
+Benchmark ClientRecordIndex queries against scanning every record with
+extract_client_info, and its build and update costs.
+Run with: python -m benchmarks.bench_client_index [records]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.synthetic_corpus import generate_client_records
+from legal_string_processor import ClientRecordIndex, extract_client_info
+
+FIELDS = ("Client", "DOB", "Case #")
+SCANNED_QUERIES = 3
+INDEXED_QUERIES = 1000
+MEMORY_SAMPLE = 100000
+
+def scan_exact(records, field, value):
+    return [number for number, text in enumerate(records) if extract_client_info(text, field) == value]
+
+def scan_prefix(records, field, prefix):
+    return [number for number, text in enumerate(records) if extract_client_info(text, field).startswith(prefix)]
+
+def scan_dates(records, field, since, until):
+    return [number for number, text in enumerate(records) if since <= extract_client_info(text, field) <= until]
+
+def per_query(func, args, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return ((time.perf_counter() - start) / repeat, len(result))
+
+def main(count=1000000):
+    records = generate_client_records(count, fields=5)
+    case_number = extract_client_info(records[count // 2], "Case #")
+
+    # Memory is traced on a sample, since tracing slows the build several times
+    sample = records[:MEMORY_SAMPLE]
+    gc.collect()
+    tracemalloc.start()
+    sample_index = ClientRecordIndex(enumerate(sample), fields=FIELDS)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sample_index
+
+    gc.collect()
+    start = time.perf_counter()
+    index = ClientRecordIndex(enumerate(records), fields=FIELDS)
+    build = time.perf_counter() - start
+    print(f"Records: {count:,}; index of {', '.join(FIELDS)} built in {build:.1f}s "
+          f"({count / build:,.0f}/s), {memory / len(sample):.0f} B per record (source texts not counted)")
+
+    queries = [
+        ("Case # exact", scan_exact, index.find, ("Case #", case_number)),
+        ("Case # prefix CR-2023-", scan_prefix, index.find_prefix, ("Case #", "CR-2023-")),
+        ("Case # prefix CR-2023-0001", scan_prefix, index.find_prefix, ("Case #", "CR-2023-0001")),
+        ("DOB in May 1980", scan_dates, index.find_dates, ("DOB", "1980-05-01", "1980-05-31")),
+    ]
+    print(f"{'Query':<28} {'Matches':>8} {'Scan':>10} {'Index':>12} {'Speedup':>9}")
+    for label, scan, query, args in queries:
+        scan_seconds, scanned = per_query(scan, (records,) + args, SCANNED_QUERIES)
+        index_seconds, matched = per_query(query, args, INDEXED_QUERIES)
+        assert scanned == matched, f"{label}: scan found {scanned}, index {matched}"
+        print(f"{label:<28} {matched:>8,} {scan_seconds * 1e3:>8.0f}ms {index_seconds * 1e6:>10.1f}us "
+              f"{scan_seconds / index_seconds:>8,.0f}x")
+
+    updates = generate_client_records(1000, fields=5, seed=1)
+    start = time.perf_counter()
+    for number, text in enumerate(updates, count):
+        index.add(number, text)
+    added = time.perf_counter() - start
+    start = time.perf_counter()
+    for number in range(count, count + len(updates)):
+        index.remove(number)
+    removed = time.perf_counter() - start
+    print(f"add {added / len(updates) * 1e6:.1f}us, remove {removed / len(updates) * 1e6:.1f}us per record")
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
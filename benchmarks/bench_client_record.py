@@ -0,0 +1,47 @@
+"""
+Benchmark parse_client_record against per-field extract_client_info calls.
+Run with: python -m benchmarks.bench_client_record
+"""
+import timeit
+
+from legal_string_processor import extract_client_info, lookup_client_info, parse_client_record
+
+def build_record(field_count):
+    """Build a client record with field_count "Field: value" lines."""
+    lines = ["Client: John Doe", "DOB: 1980-05-15", "Case #: CR-2023-01234"]
+    for number in range(len(lines), field_count):
+        lines.append(f"Field {number}: value of field {number}")
+    return "\n".join(lines[:field_count])
+
+def field_names(record_text):
+    """Return the field names of a record in line order."""
+    return [line.split(":")[0] for line in record_text.split("\n")]
+
+def per_field(text, fields):
+    return [extract_client_info(text, field) for field in fields]
+
+def parsed(text, fields):
+    record = parse_client_record(text)
+    return [record[field] for field in fields]
+
+def parsed_lookup(text, fields):
+    record = parse_client_record(text)
+    return [lookup_client_info(text, field, record) for field in fields]
+
+def main(field_counts=(5, 20, 100), number=2000):
+    print(f"{'Fields':>6} {'per-field':>12} {'parse':>12} {'parse+lookup':>14}")
+    for field_count in field_counts:
+        text = build_record(field_count)
+        fields = field_names(text)
+        expected = per_field(text, fields)
+        assert parsed(text, fields) == expected
+        assert parsed_lookup(text, fields) == expected
+
+        timings = []
+        for func in (per_field, parsed, parsed_lookup):
+            seconds = min(timeit.repeat(lambda: func(text, fields), number=number, repeat=3))
+            timings.append(seconds / number * 1e6)
+        print(f"{field_count:>6} {timings[0]:>10.1f}us {timings[1]:>10.1f}us {timings[2]:>12.1f}us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measure memory per record of the compact result containers against the
+tuples and strings the batch extractors return.
+Run with: python -m benchmarks.bench_compact_results
+"""
+import gc
+import time
+import tracemalloc
+
+from legal_string_processor import (
+    extract_case_names_batch,
+    extract_case_names_compact,
+    extract_client_info,
+    extract_client_info_compact,
+    extract_date,
+    extract_dates_compact,
+)
+
+def build_corpus(count):
+    """Return (citations, documents) with count entries each."""
+    citations = [f"Smith Holdings {n} LLC v. Jones Manufacturing Corp., {n} F.3d {n % 900} (9th Cir. 2023)"
+                 for n in range(count)]
+    documents = [f"Client: Client Number {n}\nDOB: 1980-05-15\nFiled on 2023-06-{n % 28 + 1:02d}.\n"
+                 for n in range(count)]
+    return (citations, documents)
+
+def measure(func):
+    """Return (result, elapsed seconds, bytes still allocated by the result).
+
+    Memory is traced in a second run so tracing does not slow the timed one.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (result, elapsed, retained)
+
+def main(count=200000):
+    citations, documents = build_corpus(count)
+    comparisons = [
+        ("case names + parties",
+         lambda: extract_case_names_batch(citations),
+         lambda: extract_case_names_compact(citations)),
+        ("dates",
+         lambda: [extract_date(document) for document in documents],
+         lambda: extract_dates_compact(documents)),
+        ("client info",
+         lambda: [extract_client_info(document, "Client") for document in documents],
+         lambda: extract_client_info_compact(documents, "Client")),
+    ]
+
+    print(f"Records: {count:,} (source texts are shared and not counted)")
+    print(f"{'Results':<22} {'current':>14} {'compact':>14} {'Saving':>7} {'Build time':>19}")
+    for label, current, compact in comparisons:
+        expected, current_time, current_bytes = measure(current)
+        results, compact_time, compact_bytes = measure(compact)
+        assert list(results) == expected
+        del expected, results
+        print(f"{label:<22} {current_bytes / count:>8.1f} B/rec {compact_bytes / count:>8.1f} B/rec "
+              f"{current_bytes / compact_bytes:>6.1f}x {current_time:>8.2f}s / {compact_time:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark corpus_runner scaling across worker counts.
+Run with: python -m benchmarks.bench_corpus_runner
+"""
+import json
+import os
+import tempfile
+import time
+
+from corpus_runner import run_corpus
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def write_corpus(path, count, lines_per_document=200):
+    """Write count synthetic documents to a JSONL file."""
+    with open(path, "w", encoding="utf-8") as file:
+        for number in range(count):
+            text = (f"Smith {number} v. Jones Corp., {number} F.3d 456 (9th Cir. 2023)\n"
+                    f"Client: Client {number}\nDOB: 1980-05-15\nCase #: CR-2023-{number:05d}\n"
+                    f"SECTION 1. DEFINITIONS\n{FILLER * lines_per_document}"
+                    f"SECTION 2. TERM\nEffective on 2023-06-15.\n")
+            file.write(json.dumps({"id": number, "text": text}))
+            file.write("\n")
+
+def main(count=20000, chunk_size=64):
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpus})
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "corpus.jsonl")
+        write_corpus(source, count)
+
+        print(f"Documents: {count}, chunk size: {chunk_size}, CPUs: {cpus}")
+        print(f"{'Workers':>7} {'Seconds':>9} {'Docs/s':>10} {'Speedup':>8}")
+        baseline = None
+        expected = None
+        for workers in worker_counts:
+            output = os.path.join(directory, f"results-{workers}.jsonl")
+            start = time.perf_counter()
+            run_corpus(source, output, heading="SECTION 1. DEFINITIONS",
+                       workers=workers, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+
+            with open(output, encoding="utf-8") as file:
+                results = file.read()
+            if expected is None:
+                expected = results
+            assert results == expected, f"Output with {workers} workers differs"
+
+            if baseline is None:
+                baseline = elapsed
+            print(f"{workers:>7} {elapsed:>9.2f} {count / elapsed:>10,.0f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
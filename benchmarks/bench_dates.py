@@ -0,0 +1,58 @@
+"""
+Benchmark extract_date and iter_dates on a large document.
+Run with: python -m benchmarks.bench_dates
+"""
+import io
+import time
+import tracemalloc
+
+from legal_string_processor import DATE_PUNCTUATION, extract_date, iter_dates
+
+def build_document(size_mb):
+    """Build a document of roughly size_mb megabytes with a date at the end."""
+    paragraph = ("This Agreement is made effective as of the Effective Date, by and "
+                 "between Party A and Party B (collectively, the \"Parties\").\n")
+    repeats = (size_mb * 1024 * 1024) // len(paragraph)
+    return paragraph * repeats + "Signed on 2023-06-15.\n"
+
+def split_extract_date(text):
+    """The original extract_date approach: split the whole text first."""
+    for word in text.split():
+        clean_word = word.strip(DATE_PUNCTUATION)
+        if (len(clean_word) == 10 and clean_word[4] == '-' and clean_word[7] == '-'
+                and clean_word[0:4].isdigit() and clean_word[5:7].isdigit()
+                and clean_word[8:10].isdigit()):
+            return clean_word
+    return ""
+
+def measure(func, *args):
+    """Return (result, elapsed seconds, peak traced bytes) for func(*args)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (result, elapsed, peak)
+
+def first_streamed_date(stream):
+    """Take the first date from a file object via iter_dates."""
+    return next(iter_dates(stream), "")
+
+def main(size_mb=50):
+    document = build_document(size_mb)
+
+    runs = [
+        ("split (original)", split_extract_date, document),
+        ("extract_date", extract_date, document),
+        ("iter_dates (stream)", first_streamed_date, io.StringIO(document)),
+    ]
+
+    print(f"Document size: {len(document) / (1024 * 1024):.1f} MB")
+    for name, func, arg in runs:
+        result, elapsed, peak = measure(func, arg)
+        assert result == "2023-06-15", f"{name} returned {result!r}"
+        print(f"{name:22} {elapsed:8.3f}s  peak {peak / (1024 * 1024):8.2f} MB")
+
+if __name__ == "__main__":
+    main()
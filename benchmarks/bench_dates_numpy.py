@@ -0,0 +1,48 @@
+"""
+Benchmark the numpy date engine against the pure-Python path.
+Run with: python -m benchmarks.bench_dates_numpy  (requires NumPy)
+"""
+import random
+import time
+
+from legal_string_processor import extract_dates_batch
+
+WORDS = ("the", "Parties", "agree", "Agreement", "effective", "as", "of", "(collectively,",
+         "dispute", "arose", "between", "Party", "A", "and", "B;", "WHEREAS,", "12-34", "CR-2023-01")
+
+def build_documents(count, words_per_document=120, seed=11):
+    """Build documents where most contain one or two dates at random places."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(words_per_document)]
+        for _ in range(rng.randint(0, 2)):
+            date = f"{rng.randint(1990, 2030)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            words.insert(rng.randrange(len(words) + 1), rng.choice(("", "(")) + date + rng.choice(("", ",", ".", ");")))
+        documents.append(" ".join(words))
+    return documents
+
+def main(count=100000):
+    documents = build_documents(count)
+    # Import NumPy before timing
+    extract_dates_batch(documents[:1], engine="numpy")
+
+    timings = {}
+    results = {}
+    for engine in ("python", "numpy"):
+        # Best of three runs
+        timings[engine] = float("inf")
+        for _ in range(3):
+            results[engine] = None
+            start = time.perf_counter()
+            results[engine] = extract_dates_batch(documents, engine=engine)
+            timings[engine] = min(timings[engine], time.perf_counter() - start)
+    assert results["numpy"] == results["python"], "Engines disagree"
+
+    print(f"Documents: {count}")
+    for engine, elapsed in timings.items():
+        print(f"{engine:>7}: {elapsed:.3f}s ({count / elapsed:,.0f} docs/s)")
+    print(f"Speedup: {timings['python'] / timings['numpy']:.2f}x")
+
+if __name__ == "__main__":
+    main()
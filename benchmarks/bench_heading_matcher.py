@@ -0,0 +1,64 @@
+"""
+Benchmark finding the next heading with one str.find per keyword against a
+HeadingMatcher, sweeping the size of the heading vocabulary.
+Run with: python -m benchmarks.bench_heading_matcher
+"""
+import time
+
+from legal_string_processor import HeadingMatcher, find_section
+
+KEYWORDS = ("SECTION", "ARTICLE", "RECITALS", "SCHEDULE", "EXHIBIT", "ANNEX",
+            "WHEREAS", "APPENDIX", "ADDENDUM", "DEFINITIONS", "PREAMBLE", "CLAUSE",
+            "PART", "CHAPTER", "TITLE", "ATTACHMENT", "AMENDMENT", "NOTICES",
+            "SIGNATURES", "WITNESSETH", "RIDER", "STATEMENT", "SUBSCHEDULE", "EXHIBITS")
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def build_document(sections, lines_per_section=200):
+    """Build a contract with the given number of SECTION headings."""
+    parts = []
+    for number in range(1, sections + 1):
+        parts.append(f"SECTION {number}. CLAUSE {number}\n")
+        parts.append(FILLER * lines_per_section)
+    return "".join(parts)
+
+def find_next_heading(document, start, keywords):
+    """The per-keyword scan find_section uses for its default vocabulary."""
+    next_heading_pos = -1
+    for keyword in keywords:
+        pos = document.find(keyword, start)
+        if pos != -1 and (next_heading_pos == -1 or pos < next_heading_pos):
+            next_heading_pos = pos
+    return next_heading_pos
+
+def time_call(func, repeats):
+    """Return the mean seconds per call of func."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+def main(vocabulary_sizes=(3, 6, 12, 24), sections=100, repeats=20):
+    contract = build_document(sections)
+    single = build_document(1, len(contract) // len(FILLER))
+    scenarios = [
+        (f"first of {sections} sections (next heading close by)", contract),
+        ("only section (every scan runs to the end)", single),
+    ]
+    for label, document in scenarios:
+        heading = "SECTION 1."
+        start = document.find("\n")
+        print(f"\n{len(document) / 1e6:.1f} MB document, heading after the {label}")
+        print(f"{'Keywords':>8} {'str.find':>10} {'matcher':>10} {'Speedup':>8}")
+        for size in vocabulary_sizes:
+            keywords = KEYWORDS[:size]
+            matcher = HeadingMatcher(keywords)
+            assert matcher.find(document, start) == find_next_heading(document, start, keywords)
+            assert find_section(document, heading, matcher) == find_section(document, heading, keywords)
+
+            plain = time_call(lambda: find_next_heading(document, start, keywords), repeats)
+            matched = time_call(lambda: matcher.find(document, start), repeats)
+            print(f"{size:>8} {plain * 1000:>8.2f}ms {matched * 1000:>8.2f}ms {plain / matched:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
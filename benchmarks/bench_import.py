@@ -0,0 +1,102 @@
+"""
+Benchmark how long the entry-point modules take to import.
+
+Each module is imported in a fresh interpreter under python -X importtime,
+with a warm bytecode cache as in a deployed worker, and its median
+cumulative import time is checked against IMPORT_BUDGET_MS.  Importing it
+must also leave the optional engines in DEFERRED_MODULES unloaded; they
+are imported on first use.
+Run with: python -m benchmarks.bench_import [--runs 7]
+Exits with status 1 when a module is over budget.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median cumulative import time allowed per module, in milliseconds
+IMPORT_BUDGET_MS = {
+    "legal_string_processor": 40,
+    "corpus_runner": 50,
+    "result_writer": 60,
+}
+
+# Engines that importing an entry point must not load
+DEFERRED_MODULES = ("numpy", "mmap", "concurrent.futures", "multiprocessing",
+                    "asyncio", "argparse", "pyarrow")
+
+def _environment(cache_dir):
+    """Return the child environment, with bytecode cached in cache_dir."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = cache_dir
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+def _run(code, env, *options):
+    return subprocess.run([sys.executable, *options, "-c", code], env=env, cwd=PROJECT_ROOT,
+                          capture_output=True, text=True, check=True)
+
+def import_time_ms(module, env):
+    """Return the cumulative import time of module in a fresh interpreter."""
+    stderr = _run(f"import {module}", env, "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.rsplit("|", 2) if line.count("|") == 2 else ("", "", "")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise ValueError(f"No import time reported for {module}")
+
+def deferred_modules_loaded(module, env):
+    """Return the DEFERRED_MODULES that importing module loads."""
+    loaded = _run(f"import sys, {module}; print(*sys.modules)", env).stdout.split()
+    return [name for name in DEFERRED_MODULES if name in loaded]
+
+def measure(modules=tuple(IMPORT_BUDGET_MS), runs=7):
+    """Return {module: {"median_ms", "budget_ms", "deferred_loaded"}}."""
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = _environment(cache_dir)
+        for module in modules:
+            # The first import writes the bytecode cache
+            _run(f"import {module}", env)
+            timings = [import_time_ms(module, env) for _ in range(runs)]
+            results[module] = {
+                "median_ms": statistics.median(timings),
+                "budget_ms": IMPORT_BUDGET_MS.get(module),
+                "deferred_loaded": deferred_modules_loaded(module, env),
+            }
+    return results
+
+def budget_failures(results):
+    """Return one message per module over its time budget or loading a deferred engine."""
+    failures = []
+    for module, result in results.items():
+        if result["budget_ms"] is not None and result["median_ms"] > result["budget_ms"]:
+            failures.append(f"{module} imports in {result['median_ms']:.1f}ms, "
+                            f"over its {result['budget_ms']}ms budget")
+        if result["deferred_loaded"]:
+            failures.append(f"{module} loads {', '.join(result['deferred_loaded'])} on import")
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark entry-point import time.")
+    parser.add_argument("--runs", type=int, default=7, help="imports timed per module")
+    args = parser.parse_args(argv)
+
+    results = measure(runs=args.runs)
+    print(f"{'Module':<24} {'Median':>9} {'Budget':>8}  Deferred engines loaded")
+    for module, result in results.items():
+        print(f"{module:<24} {result['median_ms']:>7.1f}ms {result['budget_ms']:>6}ms  "
+              f"{', '.join(result['deferred_loaded']) or '-'}")
+    failures = budget_failures(results)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
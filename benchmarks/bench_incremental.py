@@ -0,0 +1,101 @@
+"""
+Benchmark per-edit latency of IncrementalDocument against re-running
+find_section and extract_date on the whole edited text, by document size.
+Run with: python -m benchmarks.bench_incremental
+"""
+import random
+import time
+
+from benchmarks.synthetic_corpus import generate_contract
+from legal_string_processor import IncrementalDocument, extract_date, find_section
+
+def typing_edits(text, count, seed=0):
+    """Return (offset, deleted, inserted) edits typing and deleting near a cursor."""
+    rng = random.Random(seed)
+    cursor = len(text) // 2
+    length = len(text)
+    edits = []
+    for _ in range(count):
+        if rng.random() < 0.2 and cursor > 0:
+            edits.append((cursor - 1, 1, ""))
+            cursor -= 1
+            length -= 1
+        else:
+            inserted = rng.choice("abcdefgh ,.-0123456789\n")
+            edits.append((cursor, 0, inserted))
+            cursor += 1
+            length += 1
+        if rng.random() < 0.01:
+            cursor = rng.randint(0, length)
+    return edits
+
+def boundary_edits(text, count, span=4096, seed=0):
+    """Return edits replacing span characters with as many copied from elsewhere.
+
+    With span equal to the block size every edit crosses a block boundary.
+    """
+    rng = random.Random(seed)
+    edits = []
+    for _ in range(count):
+        offset = rng.randint(0, len(text) - span)
+        source = rng.randint(0, len(text) - span)
+        edits.append((offset, span, text[source:source + span]))
+    return edits
+
+def paste_edits(text, count, span=3 * 4096, seed=0):
+    """Return edits cutting span characters and pasting them elsewhere.
+
+    Each cut deletes whole blocks and each paste inserts more than two
+    blocks' worth of text.
+    """
+    rng = random.Random(seed)
+    length = len(text)
+    edits = []
+    for _ in range(count // 2):
+        offset = rng.randint(0, length - span)
+        target = rng.randint(0, length - span)
+        edits.append((offset, span, ""))
+        # What is pasted does not matter, only how much
+        edits.append((target, 0, text[offset:offset + span]))
+    return edits
+
+EDIT_PATTERNS = (
+    ("typing", typing_edits),
+    ("across blocks", boundary_edits),
+    ("cut and paste", paste_edits),
+)
+
+def time_pattern(size_mb, pattern, make_edits, edits, heading):
+    """Print per-edit latency of one edit pattern on a document of size_mb."""
+    text = generate_contract(int(size_mb * 1024 * 1024))
+    changes = make_edits(text, edits)
+    document = IncrementalDocument(text)
+
+    start = time.perf_counter()
+    for offset, deleted, inserted in changes:
+        document.edit(offset, deleted, inserted)
+        section = document.find_section(heading)
+        date = document.extract_date()
+    incremental = (time.perf_counter() - start) / len(changes)
+    final = document.text
+    assert (section, date) == (find_section(final, heading), extract_date(final))
+
+    # Rebuilding and rescanning large texts is slow, so time fewer edits
+    full_edits = changes[:max(20, int(edits / size_mb / 10))]
+    start = time.perf_counter()
+    for offset, deleted, inserted in full_edits:
+        text = text[:offset] + inserted + text[offset + deleted:]
+        find_section(text, heading)
+        extract_date(text)
+    full = (time.perf_counter() - start) / len(full_edits)
+    print(f"{size_mb:>6.1f}MB {pattern:>14} {full * 1e6:>14.1f}us {incremental * 1e6:>11.1f}us "
+          f"{full / incremental:>7.1f}x")
+
+def main(sizes_mb=(0.1, 1, 10), edits=2000, heading="SECTION 2."):
+    print(f"{'Size':>8} {'Edits':>14} {'full recompute':>16} {'incremental':>13} {'Speedup':>8}")
+    for size_mb in sizes_mb:
+        for pattern, make_edits in EDIT_PATTERNS:
+            time_pattern(size_mb, pattern, make_edits, edits, heading)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark the cost of extractor instrumentation when disabled and enabled.
+Run with: python -m benchmarks.bench_instrumentation
+"""
+import timeit
+
+import legal_string_processor
+
+CALLS = (
+    ("extract_case_name", ("Smith v. Jones, 123 F.3d 456 (9th Cir. 2023)",)),
+    ("extract_parties", ("Smith v. Jones",)),
+    ("extract_date", ("This Agreement is made effective as of 2023-06-15.",)),
+    ("find_section", ("SECTION 1. TERMS\nTerms apply.\nSECTION 2. FEES\nFees.", "SECTION 1. TERMS")),
+    ("extract_client_info", ("Client: John Doe\nDOB: 1980-05-15", "DOB")),
+)
+
+def time_calls(number):
+    """Return per-call microseconds for each extractor, looked up through the module."""
+    timings = {}
+    for name, args in CALLS:
+        seconds = min(timeit.repeat(lambda: getattr(legal_string_processor, name)(*args),
+                                    number=number, repeat=3))
+        timings[name] = seconds / number * 1e6
+    return timings
+
+def main(number=100000):
+    disabled = time_calls(number)
+    with legal_string_processor.instrumented() as instrumentation:
+        enabled = time_calls(number)
+    snapshot = instrumentation.snapshot()
+
+    print(f"{'Function':>20} {'Disabled':>10} {'Enabled':>10} {'p99 (enabled)':>14}")
+    for name, _ in CALLS:
+        print(f"{name:>20} {disabled[name]:>8.2f}us {enabled[name]:>8.2f}us "
+              f"{snapshot[name]['p99_seconds'] * 1e6:>12.2f}us")
+
+if __name__ == "__main__":
+    main()
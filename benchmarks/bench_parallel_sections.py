@@ -0,0 +1,50 @@
+"""
+Benchmark split_sections_parallel against split_sections by document size
+and worker count.  Each worker pool is started once per worker count and
+reused, as a batch job would, so the times are of splitting alone.
+Run with: python -m benchmarks.bench_parallel_sections [size_mb ...]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+
+from benchmarks.synthetic_corpus import generate_contract
+from legal_string_processor import split_sections, split_sections_parallel
+
+WORKER_COUNTS = (2, 4, 8)
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return (min(timings), result)
+
+def main(sizes_mb=(8, 32, 128)):
+    documents = [(size, generate_contract(size * 1024 * 1024)) for size in sizes_mb]
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'Size':>7} {'Sections':>9} {'Sequential':>11}" + "".join(f" {f'{workers} workers':>17}" for workers in WORKER_COUNTS))
+    rows = {}
+    for size, document in documents:
+        seconds, expected = best_of(lambda: list(split_sections(document)))
+        rows[size] = [f"{size:>5}MB {len(expected):>9,} {seconds * 1e3:>9.0f}ms"]
+        expected = [tuple(section) for section in expected]
+        rows[size].append(seconds)
+    # Workers forked after this share the tracker of the shared memory blocks
+    resource_tracker.ensure_running()
+    for workers in WORKER_COUNTS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Start the workers before timing
+            list(executor.map(abs, range(workers)))
+            for size, document in documents:
+                seconds, sections = best_of(lambda: split_sections_parallel(document, workers=workers, executor=executor))
+                assert [tuple(section) for section in sections] == [tuple(section) for section in split_sections(document)]
+                rows[size][0] += f" {seconds * 1e3:>8.0f}ms ({rows[size][1] / seconds:.1f}x)"
+    for size, _ in documents:
+        print(rows[size][0])
+
+if __name__ == "__main__":
+    main(tuple(map(int, sys.argv[1:])) or (8, 32, 128))
@@ -0,0 +1,63 @@
+"""
+Micro-benchmark LegalStringProcessor methods and batch variants against
+the module-level functions.
+Run with: python -m benchmarks.bench_processor
+"""
+import timeit
+
+import legal_string_processor as lsp
+
+CITATION = "Smith Holdings LLC v. Jones Manufacturing Corp., 123 F.3d 456 (9th Cir. 2023)"
+CASE_NAME = "Smith Holdings LLC v. Jones Manufacturing Corp."
+TEXT = "This Agreement is made effective as of 2023-06-15, by and between Party A and Party B."
+RECORD = "Client: John Doe\nDOB: 1980-05-15\nCase #: CR-2023-01234"
+DOCUMENT = "".join(f"SECTION {n}. CLAUSE {n}\nThe Parties agree to clause {n}.\n" for n in range(1, 41))
+
+def compare(first, second, number, repeat=15):
+    """Return the best per-call nanoseconds of two functions timed alternately."""
+    best = [float("inf"), float("inf")]
+    for _ in range(repeat):
+        for index, func in enumerate((first, second)):
+            best[index] = min(best[index], timeit.timeit(func, number=number) / number * 1e9)
+    return best
+
+def main(number=200000, batch=1000):
+    processor = lsp.LegalStringProcessor()
+    calls = [
+        ("extract_case_name", lambda: lsp.extract_case_name(CITATION),
+         lambda: processor.extract_case_name(CITATION)),
+        ("extract_parties", lambda: lsp.extract_parties(CASE_NAME),
+         lambda: processor.extract_parties(CASE_NAME)),
+        ("extract_date", lambda: lsp.extract_date(TEXT), lambda: processor.extract_date(TEXT)),
+        ("find_section", lambda: lsp.find_section(DOCUMENT, "SECTION 20. CLAUSE 20"),
+         lambda: processor.find_section(DOCUMENT, "SECTION 20. CLAUSE 20")),
+        ("extract_client_info", lambda: lsp.extract_client_info(RECORD, "DOB"),
+         lambda: processor.extract_client_info(RECORD, "DOB")),
+    ]
+    print(f"{'Per call':<22} {'function':>10} {'method':>10} {'Saved':>8}")
+    for name, function, method in calls:
+        plain, shared = compare(function, method, number // 10)
+        print(f"{name:<22} {plain:>8.0f}ns {shared:>8.0f}ns {plain - shared:>6.0f}ns")
+
+    citations = [CITATION] * batch
+    texts = [RECORD] * batch
+    headings = [f"SECTION {n}. CLAUSE {n}" for n in range(1, 41)]
+    batches = [
+        ("case names + parties",
+         lambda: [(name, lsp.extract_parties(name)) for name in map(lsp.extract_case_name, citations)],
+         lambda: processor.extract_case_names_batch(citations)),
+        ("client info",
+         lambda: [lsp.extract_client_info(text, "DOB") for text in texts],
+         lambda: processor.extract_client_info_batch(texts, "DOB")),
+        ("find_section x40",
+         lambda: [lsp.find_section(DOCUMENT, heading) for heading in headings],
+         lambda: processor.find_sections_batch(DOCUMENT, headings)),
+    ]
+    print(f"\n{'Per item, batched':<22} {'loop':>10} {'batch':>10} {'Saved':>8}")
+    for name, loop, batched in batches:
+        items = len(headings) if name.startswith("find_section") else batch
+        plain, shared = (nanoseconds / items for nanoseconds in compare(loop, batched, number // batch // 10))
+        print(f"{name:<22} {plain:>8.0f}ns {shared:>8.0f}ns {plain - shared:>6.0f}ns")
+
+if __name__ == "__main__":
+    main()
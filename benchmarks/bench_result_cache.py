@@ -0,0 +1,56 @@
+"""
+Benchmark a weekly re-run over a mostly unchanged archive with and without
+the on-disk result cache.
+Run with: python -m benchmarks.bench_result_cache [documents] [document_kb] [changed_percent]
+"""
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic_corpus import generate_contract
+from corpus_runner import iter_results
+from result_cache import ResultCache
+
+def generate_archive(count, size_bytes, seed=0):
+    """Return count (doc_id, text) contracts of about size_bytes each."""
+    return [(f"contract-{number}.txt", f"Client: Client {number}\nDOB: 1980-05-15\n"
+             + generate_contract(size_bytes, seed + number, paragraphs_per_section=4))
+            for number in range(count)]
+
+def change(archive, percent, seed=0):
+    """Return archive with percent of the documents edited."""
+    rng = random.Random(seed)
+    edited = set(rng.sample(range(len(archive)), len(archive) * percent // 100))
+    return [(doc_id, text + "\nAmended on 2024-01-01.\n" if number in edited else text)
+            for number, (doc_id, text) in enumerate(archive)]
+
+def timed_run(documents, cache=None):
+    start = time.perf_counter()
+    for _ in iter_results(documents, workers=1, cache=cache):
+        pass
+    return time.perf_counter() - start
+
+def main(count=2000, document_kb=32, changed_percent=10):
+    archive = generate_archive(count, document_kb * 1024)
+    next_week = change(archive, changed_percent)
+
+    uncached = timed_run(next_week)
+    with tempfile.TemporaryDirectory() as directory:
+        with ResultCache(directory) as cache:
+            first = timed_run(archive, cache)
+        with ResultCache(directory) as cache:
+            second = timed_run(next_week, cache)
+            report = cache.report()
+            stored = cache.size()
+
+    print(f"Documents: {count:,} of {document_kb} KB, {changed_percent}% changed between runs")
+    print(f"{'Run':<34} {'Time':>9}")
+    print(f"{'no cache':<34} {uncached:>8.2f}s")
+    print(f"{'first run, empty cache':<34} {first:>8.2f}s")
+    print(f"{'second run, warm cache':<34} {second:>8.2f}s  ({uncached / second:.1f}x faster)")
+    print(report)
+    print(f"Cache size: {stored / 1024:,.0f} KB")
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""
+Benchmark writing extraction results row by row with json.dumps against
+ResultWriter blocks, for several buffer sizes, next to extraction itself.
+Run with: python -m benchmarks.bench_result_writer
+"""
+import json
+import os
+import tempfile
+import time
+
+from corpus_runner import process_document
+from result_writer import write_results
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def build_results(count):
+    """Return (documents, results) for count small contracts."""
+    documents = [(f"doc{n:06d}.txt",
+                  f"Smith {n} v. Jones Corp., {n} F.3d 456\nClient: Client {n}\nDOB: 1980-05-15\n"
+                  f"SECTION 1. TERMS\n{FILLER * 2}SECTION 2. TERM\nEffective on 2023-06-15.\n")
+                 for n in range(count)]
+    start = time.perf_counter()
+    results = [process_document(doc_id, text) for doc_id, text in documents]
+    return (results, time.perf_counter() - start)
+
+def write_row_by_row(results, path):
+    """The corpus runner's original output loop."""
+    with open(path, "w", encoding="utf-8") as out:
+        for result in results:
+            out.write(json.dumps(result, ensure_ascii=False))
+            out.write("\n")
+
+def main(count=200000, buffer_sizes=(100, 1000, 10000)):
+    results, extract_time = build_results(count)
+    print(f"Results: {count:,}; extraction: {count / extract_time:>12,.0f} rows/s")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results")
+
+        start = time.perf_counter()
+        write_row_by_row(results, path)
+        elapsed = time.perf_counter() - start
+        print(f"{'row-by-row json.dumps':<30} {count / elapsed:>12,.0f} rows/s")
+
+        for output_format in ("jsonl", "csv"):
+            for buffer_rows in buffer_sizes:
+                start = time.perf_counter()
+                write_results(results, path, output_format, buffer_rows=buffer_rows)
+                elapsed = time.perf_counter() - start
+                label = f"ResultWriter {output_format}, {buffer_rows} rows"
+                print(f"{label:<30} {count / elapsed:>12,.0f} rows/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark find_section_in_file (mmap) against reading the file into memory.
+Run with: python -m benchmarks.bench_section_file
+
+Each measurement runs in a fresh process so that peak RSS is per mode.
+"""
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+from legal_string_processor import find_section, find_section_in_file
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def write_document(path, size_mb):
+    """Write a contract of roughly size_mb megabytes whose last section is the target."""
+    block = FILLER * 1000
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        written = 0
+        section = 1
+        while written < size_mb * 1024 * 1024:
+            file.write(f"SECTION {section}. GENERAL\n")
+            file.write(block)
+            written += len(block)
+            section += 1
+        file.write("ARTICLE 99. NOTICES\nAll notices must be in writing.\n")
+        file.write("RECITALS\nEnd of document.\n")
+
+def in_memory(path, heading):
+    """Read and decode the whole file, then call find_section."""
+    with open(path, encoding="utf-8", newline="") as file:
+        document = file.read()
+    return find_section(document, heading)
+
+def run_mode(mode, path, heading, results):
+    """Child process body: time one lookup and report peak RSS in MB."""
+    func = find_section_in_file if mode == "mmap" else in_memory
+    start = time.perf_counter()
+    section = func(path, heading)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    results.put((section, elapsed, peak_mb))
+
+def measure(mode, path, heading):
+    """Run one mode in a fresh process and return (section, seconds, peak MB)."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=run_mode, args=(mode, path, heading, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+def main(sizes_mb=(64, 256, 512)):
+    heading = "ARTICLE 99. NOTICES"
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "contract.txt")
+        print(f"{'Size':>8} {'Mode':>10} {'Latency':>10} {'Peak RSS':>10}")
+        for size_mb in sizes_mb:
+            write_document(path, size_mb)
+            for mode in ("in-memory", "mmap"):
+                section, elapsed, peak_mb = measure(mode, path, heading)
+                assert section == "All notices must be in writing.", f"{mode} returned {section!r}"
+                print(f"{size_mb:>6}MB {mode:>10} {elapsed:>9.3f}s {peak_mb:>8.1f}MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark SectionIndex build cost against repeated find_section lookups.
+Run with: python -m benchmarks.bench_section_index
+"""
+import time
+
+from legal_string_processor import SectionIndex, find_section
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def build_document(sections, lines_per_section=20):
+    """Build a contract with the given number of SECTION headings."""
+    parts = []
+    for number in range(1, sections + 1):
+        parts.append(f"SECTION {number}. CLAUSE {number}\n")
+        parts.append(FILLER * lines_per_section)
+    return "".join(parts)
+
+def time_lookups(func, headings):
+    """Return total seconds to look up every heading with func."""
+    start = time.perf_counter()
+    for heading in headings:
+        func(heading)
+    return time.perf_counter() - start
+
+def main(section_counts=(100, 1000, 5000), lookups=50):
+    print(f"{'Sections':>8} {'Build':>10} {'find_section':>14} {'index':>10} {'prefix':>10} {'Break-even':>11}")
+    for sections in section_counts:
+        document = build_document(sections)
+        step = max(1, sections // lookups)
+        headings = [f"SECTION {n}. CLAUSE {n}\n" for n in range(1, sections + 1, step)]
+        # Headings that only start their lines, "SECTION 1" starting "SECTION 10." too
+        prefixes = [f"SECTION {n}" for n in range(1, sections + 1, step)]
+
+        start = time.perf_counter()
+        index = SectionIndex(document)
+        build = time.perf_counter() - start
+
+        for heading in headings + prefixes:
+            assert index.find_section(heading) == find_section(document, heading)
+        index = SectionIndex(document)
+
+        plain = time_lookups(lambda heading: find_section(document, heading), headings) / len(headings)
+        indexed = time_lookups(index.find_section, headings) / len(headings)
+        prefixed = time_lookups(index.find_section, prefixes) / len(prefixes)
+        break_even = build / (plain - indexed) if plain > indexed else float("inf")
+        print(f"{sections:>8} {build * 1000:>8.2f}ms {plain * 1e6:>12.1f}us "
+              f"{indexed * 1e6:>8.1f}us {prefixed * 1e6:>8.1f}us {break_even:>9.1f} lookups")
+
+if __name__ == "__main__":
+    main()
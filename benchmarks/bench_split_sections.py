@@ -0,0 +1,54 @@
+"""
+Benchmark outlining a master agreement with split_sections against one
+find_section call per heading.
+Run with: python -m benchmarks.bench_split_sections
+"""
+import time
+import tracemalloc
+
+from legal_string_processor import find_section, split_sections
+
+FILLER = "The Parties agree to the terms set out in this clause and the schedules.\n"
+
+def build_document(sections, lines_per_section=20):
+    """Build a contract with the given number of SECTION headings."""
+    parts = []
+    for number in range(1, sections + 1):
+        parts.append(f"SECTION {number}. CLAUSE {number}\n")
+        parts.append(FILLER * lines_per_section)
+    return "".join(parts)
+
+def outline_with_find_section(document, headings):
+    """Return (heading, content length) for each heading via find_section."""
+    return [(heading, len(find_section(document, heading))) for heading in headings]
+
+def outline_with_split_sections(document):
+    """Return (heading, content span length) for each section in one pass."""
+    return [(section.heading, section.end - section.start) for section in split_sections(document)]
+
+def measure(func, *args):
+    """Return (result, elapsed seconds, peak traced bytes) for func(*args)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (result, elapsed, peak)
+
+def main(section_counts=(50, 500, 2000)):
+    print(f"{'Sections':>8} {'find_section':>13} {'peak':>9} {'split_sections':>15} {'peak':>9} {'Speedup':>8}")
+    for sections in section_counts:
+        document = build_document(sections)
+        headings = [section.heading for section in split_sections(document)]
+        assert len(headings) == sections
+        for section in split_sections(document):
+            assert section.content == find_section(document, section.heading)
+
+        _, plain, plain_peak = measure(outline_with_find_section, document, headings)
+        _, single, single_peak = measure(outline_with_split_sections, document)
+        print(f"{sections:>8} {plain * 1000:>11.1f}ms {plain_peak / 1024:>7.0f}KB "
+              f"{single * 1000:>13.1f}ms {single_peak / 1024:>7.0f}KB {plain / single:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
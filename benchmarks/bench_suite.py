@@ -0,0 +1,227 @@
+"""
+Benchmark every public extractor on a seeded synthetic corpus.
+
+Reports throughput, latency percentiles and peak traced memory for each
+extractor, and the import time of the entry-point modules (see
+bench_import), and saves them as JSON, optionally comparing with an
+earlier results file.
+Run with: python -m benchmarks.bench_suite [--scale 1.0] [--seed 0]
+                                           [--output results.json]
+                                           [--compare previous.json]
+                                           [--only NAME ...]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import legal_string_processor as lsp
+from benchmarks.bench_import import measure as measure_imports
+from benchmarks.synthetic_corpus import (
+    generate_citations,
+    generate_client_records,
+    generate_contract,
+    generate_documents,
+)
+
+# Corpus sizes at scale 1.0
+CITATIONS = 100000
+DOCUMENTS = 20000
+CLIENT_RECORDS = 20000
+CONTRACT_BYTES = 4 * 1024 * 1024
+HEADING_LOOKUPS = 200
+BATCH_SIZE = 1000
+
+def _batches(items, size=BATCH_SIZE):
+    return [(items[start:start + size],) for start in range(0, len(items), size)]
+
+def build_benchmarks(scale, seed, directory):
+    """Return {name: (func, calls, items_per_call)} over a corpus of the given scale.
+
+    calls is a list of argument tuples; items_per_call is how many records
+    one call handles, for throughput.
+    """
+    citations = generate_citations(int(CITATIONS * scale), seed)
+    case_names = [lsp.extract_case_name(citation) for citation in citations]
+    documents = generate_documents(int(DOCUMENTS * scale), seed)
+    records = generate_client_records(int(CLIENT_RECORDS * scale), seed=seed)
+    contract = generate_contract(int(CONTRACT_BYTES * scale), seed)
+
+    headings = [section.heading for section in lsp.split_sections(contract)]
+    step = max(1, len(headings) // HEADING_LOOKUPS)
+    lookups = headings[::step]
+    index = lsp.SectionIndex(contract)
+    contract_path = os.path.join(directory, "contract.txt")
+    with open(contract_path, "w", encoding="utf-8") as file:
+        file.write(contract)
+    fields = ("Client", "DOB", "Case #", "Priority")
+    parsed = [lsp.parse_client_record(record) for record in records]
+    # Each amendment is inserted and then deleted again, so every pass
+    # edits the same document
+    editable = lsp.IncrementalDocument(contract)
+    amendment = "Amended on 2024-01-01.\n"
+    edit_step = max(1, len(contract) // HEADING_LOOKUPS)
+    edits = [(offset, deleted, inserted) for offset in range(0, len(contract), edit_step)
+             for deleted, inserted in ((0, amendment), (len(amendment), ""))]
+
+    def edit_and_extract(offset, deleted, inserted):
+        editable.edit(offset, deleted, inserted)
+        return (editable.extract_date(), editable.find_section(lookups[0]))
+
+    processor = lsp.LegalStringProcessor(separators=("v.", "vs.", "versus"))
+    index_fields = ("Client", "DOB", "Case #")
+    client_index = lsp.ClientRecordIndex(enumerate(records), fields=index_fields)
+    case_numbers = [lsp.extract_client_info(record, "Case #") for record in records[::max(1, len(records) // 1000)]]
+    encoded_documents = [document.encode("utf-8") for document in documents]
+    encoded_records = [record.encode("utf-8") for record in records]
+    encoded_contract = contract.encode("utf-8")
+
+    return {
+        "extract_case_name": (lsp.extract_case_name, [(c,) for c in citations], 1),
+        "extract_parties": (lsp.extract_parties, [(n,) for n in case_names], 1),
+        "cached_extract_case_name": (lsp.ExtractionCache(lsp.extract_case_name), [(c,) for c in citations], 1),
+        "extract_case_names_batch": (lsp.extract_case_names_batch, _batches(citations), BATCH_SIZE),
+        "extract_case_names_compact": (lsp.extract_case_names_compact, _batches(citations), BATCH_SIZE),
+        "processor_extract_case_name": (processor.extract_case_name, [(c,) for c in citations], 1),
+        "processor_case_names_batch": (processor.extract_case_names_batch, _batches(citations), BATCH_SIZE),
+        "canonical_case_key": (lsp.canonical_case_key, [(c,) for c in citations], 1),
+        "citation_index_build": (lambda batch: lsp.CitationIndex((number, c, 0) for number, c in enumerate(batch)),
+                                 _batches(citations), BATCH_SIZE),
+        "extract_date": (lsp.extract_date, [(d,) for d in documents], 1),
+        "extract_date_contract": (lsp.extract_date, [(contract,)], 1),
+        "iter_dates_contract": (lambda text: sum(1 for _ in lsp.iter_dates(text)), [(contract,)], 1),
+        "extract_all_dates_contract": (lsp.extract_all_dates, [(contract,)], 1),
+        "extract_all_dates_range": (lambda text: lsp.extract_all_dates(text, "2000-01-01", "2009-12-31", validate=True),
+                                    [(contract,)], 1),
+        "extract_dates_batch": (lsp.extract_dates_batch, _batches(documents), BATCH_SIZE),
+        "extract_dates_compact": (lsp.extract_dates_compact, _batches(documents), BATCH_SIZE),
+        "find_section": (lsp.find_section, [(contract, h) for h in lookups], 1),
+        "find_section_in_file": (lsp.find_section_in_file, [(contract_path, h) for h in lookups], 1),
+        "section_index_find_section": (index.find_section, [(h,) for h in lookups], 1),
+        "split_sections": (lambda text: sum(1 for _ in lsp.split_sections(text)), [(contract,)], 1),
+        "incremental_edit": (edit_and_extract, edits, 1),
+        # Includes starting a pool of two workers, as a one-off call does
+        "split_sections_parallel": (lambda text: len(lsp.split_sections_parallel(text, workers=2)), [(contract,)], 1),
+        "extract_client_info": (lsp.extract_client_info, [(r, f) for r in records for f in fields], 1),
+        "parse_client_record": (lsp.parse_client_record, [(r,) for r in records], 1),
+        "lookup_client_info": (lsp.lookup_client_info,
+                               [(r, f, p) for r, p in zip(records, parsed) for f in fields], 1),
+        "extract_date_bytes": (lsp.extract_date_bytes, [(d,) for d in encoded_documents], 1),
+        "extract_client_info_bytes": (lsp.extract_client_info_bytes,
+                                      [(r, f) for r in encoded_records for f in fields], 1),
+        "find_section_bytes": (lsp.find_section_bytes, [(encoded_contract, h) for h in lookups], 1),
+        "client_index_build": (lambda batch: lsp.ClientRecordIndex(enumerate(batch), fields=index_fields),
+                               _batches(records), BATCH_SIZE),
+        "client_index_find": (client_index.find, [("Case #", n) for n in case_numbers], 1),
+        "client_index_find_prefix": (client_index.find_prefix, [("Case #", n[:9]) for n in case_numbers], 1),
+        "client_index_find_dates": (client_index.find_dates,
+                                    [("DOB", f"{year}-01-01", f"{year}-12-31") for year in range(1950, 2030)], 1),
+        "extract_client_info_compact": (lambda texts: lsp.extract_client_info_compact(texts, "DOB"),
+                                        _batches(records), BATCH_SIZE),
+    }
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+def run_benchmark(func, calls, items_per_call):
+    """Time every call, then rerun under tracemalloc for the peak memory."""
+    perf_counter = time.perf_counter
+    latencies = []
+    input_chars = 0
+    gc.collect()
+    for args in calls:
+        start = perf_counter()
+        func(*args)
+        latencies.append(perf_counter() - start)
+        if isinstance(args[0], str):
+            input_chars += len(args[0])
+    total = sum(latencies)
+    latencies.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for args in calls:
+        func(*args)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    return {
+        "calls": len(calls),
+        "total_seconds": total,
+        "items_per_second": len(calls) * items_per_call / total if total else 0.0,
+        "mb_per_second": input_chars / 1e6 / total if total and input_chars else None,
+        "p50_us": _percentile(latencies, 50) * 1e6,
+        "p90_us": _percentile(latencies, 90) * 1e6,
+        "p99_us": _percentile(latencies, 99) * 1e6,
+        "max_us": latencies[-1] * 1e6,
+        "peak_memory_bytes": peak,
+    }
+
+def run_suite(scale=1.0, seed=0, only=None):
+    """Run the selected benchmarks and return the results dict."""
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = build_benchmarks(scale, seed, directory)
+        unknown = set(only or ()) - set(benchmarks)
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+        results = {}
+        for name, (func, calls, items_per_call) in benchmarks.items():
+            if only and name not in only:
+                continue
+            results[name] = run_benchmark(func, calls, items_per_call)
+            print(format_row(name, results[name]), flush=True)
+    imports = {} if only else measure_imports()
+    for module, result in imports.items():
+        print(f"{'import ' + module:<30} {result['median_ms']:>12.1f}ms (budget {result['budget_ms']}ms)")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "seed": seed,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+        "imports": imports,
+    }
+
+def format_row(name, result, previous=None):
+    """Return one line of the results table."""
+    row = (f"{name:<30} {result['items_per_second']:>12,.0f}/s {result['p50_us']:>10.1f} "
+           f"{result['p99_us']:>10.1f} {result['peak_memory_bytes'] / 1024:>10,.0f}KB")
+    if previous is not None:
+        row += f" {result['items_per_second'] / previous['items_per_second']:>7.2f}x"
+    return row
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every public extractor.")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="corpus size multiplier (10 gives a million citations)")
+    parser.add_argument("--seed", type=int, default=0, help="corpus random seed")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="earlier results JSON to compare throughput with")
+    parser.add_argument("--only", nargs="+", help="run only these benchmarks")
+    args = parser.parse_args(argv)
+
+    print(f"{'Benchmark':<30} {'Throughput':>14} {'p50 us':>10} {'p99 us':>10} {'Peak mem':>12}")
+    suite = run_suite(args.scale, args.seed, args.only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(suite, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            previous = json.load(file)["results"]
+        print(f"\nCompared with {args.compare} (throughput ratio, >1 is faster):")
+        for name, result in suite["results"].items():
+            if name in previous:
+                print(format_row(name, result, previous[name]))
+
+if __name__ == "__main__":
+    sys.exit(main())
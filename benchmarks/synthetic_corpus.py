@@ -0,0 +1,120 @@
+"""
+Seeded synthetic legal corpus for the benchmarks.
+
+Scales the shapes of initialize_legal_samples() up to realistic sizes:
+citations in both "v." and "vs." forms, multi-MB contracts with many
+SECTION/ARTICLE headings, and client records with many fields.  The same
+seed always produces the same corpus.
+"""
+import random
+
+SURNAMES = ("Smith", "Jones", "Garcia", "Brown", "Martinez", "Johnson", "Lee", "Walker",
+            "Nguyen", "Patel", "O'Brien", "Kowalski", "Schmidt", "Rossi", "Tanaka", "Okafor")
+COMPANY_WORDS = ("Holdings", "Manufacturing", "Logistics", "Capital", "Health", "Energy",
+                 "Systems", "Partners", "Insurance", "Foods", "Media", "Realty")
+COMPANY_SUFFIXES = ("Inc.", "Corp.", "LLC", "Co.", "Ltd.", "L.P.")
+REPORTERS = ("F.3d", "F.4th", "F. Supp. 3d", "U.S.", "S. Ct.", "P.3d", "N.E.2d", "Cal. App. 5th")
+COURTS = ("9th Cir.", "2d Cir.", "5th Cir.", "D.C. Cir.", "S.D.N.Y.", "N.D. Cal.", "Del. Ch.")
+SECTION_TITLES = ("DEFINITIONS", "TERM", "PAYMENT", "CONFIDENTIALITY", "INDEMNIFICATION",
+                  "TERMINATION", "GOVERNING LAW", "NOTICES", "ASSIGNMENT", "WARRANTIES",
+                  "LIMITATION OF LIABILITY", "DISPUTE RESOLUTION", "FORCE MAJEURE")
+CLAUSE_SENTENCES = (
+    "The Parties agree to perform their obligations in good faith.",
+    "Each Party shall bear its own costs unless otherwise agreed in writing.",
+    "This clause survives termination or expiry of this Agreement.",
+    "Notices shall be delivered by hand or by registered mail.",
+    "No waiver of any provision shall be effective unless in writing.",
+    "The Client shall pay all undisputed invoices within thirty days.",
+    "Confidential Information excludes information that is publicly available.",
+)
+CLIENT_FIELDS = ("Client", "DOB", "Case #", "Address", "Phone", "Email", "Attorney", "Court",
+                 "Judge", "Docket", "Status", "Matter", "Billing Code", "Opened", "Closed",
+                 "Referral", "Language", "Interpreter", "Conflict Check", "Retainer",
+                 "Rate", "Paralegal", "Office", "Practice Area", "Opposing Counsel",
+                 "Insurance", "Employer", "Emergency Contact", "Notes", "Priority")
+
+def _date(rng):
+    return f"{rng.randint(1950, 2030):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+def _party(rng):
+    """Return a person or company party name."""
+    if rng.random() < 0.5:
+        name = f"{rng.choice(SURNAMES)} {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    else:
+        name = rng.choice(SURNAMES)
+    if rng.random() < 0.1:
+        name += ", et al."
+    return name
+
+def generate_citations(count, seed=0):
+    """Return count case citations, mostly "v." with a share of "vs." and "In re"."""
+    rng = random.Random(seed)
+    citations = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            name = f"In re {rng.choice(SURNAMES)}"
+        else:
+            separator = "v." if roll < 0.7 else "vs."
+            name = f"{_party(rng)} {separator} {_party(rng)}"
+        citations.append(f"{name}, {rng.randint(1, 999)} {rng.choice(REPORTERS)} "
+                         f"{rng.randint(1, 1999)} ({rng.choice(COURTS)} {rng.randint(1950, 2025)})")
+    return citations
+
+def generate_contract(size_bytes, seed=0, paragraphs_per_section=8):
+    """Return a contract of about size_bytes characters with numbered headings.
+
+    It opens with RECITALS and alternates ARTICLE and SECTION headings, and
+    about one paragraph in four mentions a date.
+    """
+    rng = random.Random(seed)
+    parts = ["MASTER SERVICES AGREEMENT\n\nRECITALS\n",
+             f"WHEREAS, the Parties entered into discussions on {_date(rng)};\n\n"]
+    size = sum(map(len, parts))
+    number = 0
+    while size < size_bytes:
+        number += 1
+        keyword = "ARTICLE" if number % 5 == 1 else "SECTION"
+        section = [f"{keyword} {number}. {rng.choice(SECTION_TITLES)}\n\n"]
+        for paragraph in range(paragraphs_per_section):
+            text = " ".join(rng.choice(CLAUSE_SENTENCES) for _ in range(rng.randint(2, 5)))
+            if rng.random() < 0.25:
+                text += f" Effective as of {_date(rng)}."
+            section.append(f"{number}.{paragraph + 1} {text}\n")
+        section.append("\n")
+        text = "".join(section)
+        parts.append(text)
+        size += len(text)
+    return "".join(parts)
+
+def generate_client_records(count, fields=len(CLIENT_FIELDS), seed=0):
+    """Return count "Field: value" client records with the first fields field names."""
+    rng = random.Random(seed)
+    names = CLIENT_FIELDS[:fields]
+    records = []
+    for number in range(count):
+        lines = []
+        for name in names:
+            if name in ("DOB", "Opened", "Closed"):
+                value = _date(rng)
+            elif name == "Case #":
+                value = f"CR-{rng.randint(2000, 2025)}-{rng.randint(0, 99999):05d}"
+            elif name == "Client":
+                value = f"{rng.choice(SURNAMES)} Client {number}"
+            else:
+                value = f"{rng.choice(SURNAMES)} {rng.randint(1, 9999)}"
+            lines.append(f"{name}: {value}")
+        records.append("\n".join(lines))
+    return records
+
+def generate_documents(count, seed=0):
+    """Return count short documents mixing a citation, client lines, sections and dates."""
+    rng = random.Random(seed)
+    citations = generate_citations(count, seed)
+    documents = []
+    for number, citation in enumerate(citations):
+        documents.append(
+            f"{citation}\nClient: {rng.choice(SURNAMES)} Client {number}\nDOB: {_date(rng)}\n"
+            f"SECTION 1. {rng.choice(SECTION_TITLES)}\n{rng.choice(CLAUSE_SENTENCES)}\n"
+            f"SECTION 2. {rng.choice(SECTION_TITLES)}\nSigned on {_date(rng)}.\n")
+    return documents
@@ -0,0 +1,347 @@
+"""
+Corpus Runner
+Runs the Legal String Processor extractors over a corpus of documents
+using a pool of worker processes.
+
+Usage:
+    python -m corpus_runner INPUT OUTPUT [--ops case_name,parties,date,section,client_info]
+                            [--heading HEADING] [--field FIELD ...]
+                            [--workers N] [--chunk-size N]
+                            [--format csv|jsonl|parquet] [--buffer-rows N]
+                            [--cache DIR] [--cache-size MB]
+
+INPUT is a directory (one document per file) or a JSONL file with one
+{"id": ..., "text": ...} object per line. OUTPUT is a JSONL file, or "-"
+for standard output.  With --format, results are written as flat rows by
+result_writer.ResultWriter instead.  With --cache, documents whose content
+was processed with the same options in an earlier run are answered from a
+result_cache.ResultCache, and its hit rate and time saved are printed.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from legal_string_processor import (
+    extract_case_name,
+    extract_client_info,
+    extract_date,
+    extract_parties,
+    find_section,
+)
+
+OPERATIONS = ("case_name", "parties", "date", "section", "client_info")
+DEFAULT_FIELDS = ("Client", "DOB", "Case #")
+
+class InvalidDocument:
+    """Stands in for the text of a file or JSONL line that could not be read as a document.
+
+    process_document records error as the document's error for every
+    operation, so one bad line does not stop the run.
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+def load_documents(source):
+    """Yield (doc_id, text) for each document in a directory or JSONL file.
+
+    Directory entries are read in sorted name order; JSONL documents without
+    an "id" use their line number.  Files that cannot be read or are not
+    UTF-8, and lines that are not UTF-8 JSON objects, yield an
+    InvalidDocument as their text.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            path = os.path.join(source, name)
+            if os.path.isfile(path):
+                try:
+                    with open(path, encoding="utf-8") as file:
+                        text = file.read()
+                except UnicodeDecodeError as e:
+                    text = InvalidDocument(f"Invalid UTF-8: {e}")
+                except OSError as e:
+                    text = InvalidDocument(f"Cannot read file: {e}")
+                yield (name, text)
+        return
+
+    # Lines are decoded one at a time so that one bad line does not stop the run
+    with open(source, "rb") as file:
+        for line_number, line in enumerate(file, 1):
+            try:
+                line = line.decode("utf-8")
+            except UnicodeDecodeError as e:
+                yield (line_number, InvalidDocument(f"Invalid UTF-8: {e}"))
+                continue
+            if not line.strip():
+                continue
+            try:
+                document = json.loads(line)
+            except ValueError as e:
+                yield (line_number, InvalidDocument(f"Invalid JSON: {e}"))
+                continue
+            if not isinstance(document, dict):
+                yield (line_number, InvalidDocument("Invalid JSON: expected an object"))
+                continue
+            yield (document.get("id", line_number), document.get("text"))
+
+def process_document(doc_id, text, ops=OPERATIONS, heading="SECTION", fields=DEFAULT_FIELDS):
+    """Run the selected extractors on one document and return a result dict.
+
+    A ValueError from an extractor is recorded under "errors" for that
+    operation instead of stopping the run, and so is text that is neither
+    a string nor None (or an InvalidDocument) for every operation.
+    """
+    result = {"id": doc_id}
+    errors = {}
+
+    if text is not None and not isinstance(text, str):
+        if isinstance(text, InvalidDocument):
+            message = text.error
+        else:
+            message = f"Text must be a string, not {type(text).__name__}"
+        for op in ops:
+            if op == "client_info":
+                errors.update((f"client_info:{field}", message) for field in fields)
+            else:
+                errors[op] = message
+        result["errors"] = errors
+        return result
+
+    if "case_name" in ops or "parties" in ops:
+        try:
+            case_name = extract_case_name(text)
+            if "case_name" in ops:
+                result["case_name"] = case_name
+            if "parties" in ops:
+                result["parties"] = list(extract_parties(case_name))
+        except ValueError as e:
+            for op in ("case_name", "parties"):
+                if op in ops:
+                    errors[op] = str(e)
+
+    if "date" in ops:
+        try:
+            result["date"] = extract_date(text)
+        except ValueError as e:
+            errors["date"] = str(e)
+
+    if "section" in ops:
+        try:
+            result["section"] = find_section(text, heading)
+        except ValueError as e:
+            errors["section"] = str(e)
+
+    if "client_info" in ops:
+        client_info = {}
+        for field in fields:
+            try:
+                client_info[field] = extract_client_info(text, field)
+            except ValueError as e:
+                errors[f"client_info:{field}"] = str(e)
+        result["client_info"] = client_info
+
+    if errors:
+        result["errors"] = errors
+    return result
+
+def _process_chunk(chunk, ops, heading, fields):
+    """Worker entry point: process a list of (doc_id, text) documents."""
+    return [process_document(doc_id, text, ops, heading, fields) for doc_id, text in chunk]
+
+def _process_chunk_timed(chunk, ops, heading, fields):
+    """Worker entry point: like _process_chunk, with each document's processing time."""
+    perf_counter = time.perf_counter
+    timed = []
+    for doc_id, text in chunk:
+        start = perf_counter()
+        result = process_document(doc_id, text, ops, heading, fields)
+        timed.append((result, perf_counter() - start))
+    return timed
+
+def _iter_chunks(documents, chunk_size):
+    """Group documents into lists of at most chunk_size."""
+    chunk = []
+    for document in documents:
+        chunk.append(document)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _iter_pool_results(documents, ops, heading, fields, workers, chunk_size):
+    """Yield results in input order from a pool of worker processes."""
+    # Imported here so that importing this module stays cheap
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _iter_chunks(documents, chunk_size):
+            pending.append(executor.submit(_process_chunk, chunk, ops, heading, fields))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def _iter_local_results(documents, ops, heading, fields, chunk_size):
+    """Yield results in input order from the current process."""
+    for chunk in _iter_chunks(documents, chunk_size):
+        yield from _process_chunk(chunk, ops, heading, fields)
+
+def _iter_cached_results(documents, ops, heading, fields, workers, chunk_size, cache):
+    """Yield results in input order, processing only the documents cache lacks.
+
+    Documents are looked up two chunks per worker at a time, and the misses
+    of each block are processed (in worker processes when workers > 1,
+    started on the first miss) and stored before the block is yielded.
+    """
+    executor = None
+    try:
+        for block in _iter_chunks(documents, chunk_size * max(workers, 1) * 2):
+            keys = [cache.key(text, ops, heading, fields) for _, text in block]
+            found = cache.get_many(keys)
+            misses = [(document, key) for document, key in zip(block, keys) if key not in found]
+            chunks = [[document for document, _ in misses[start:start + chunk_size]]
+                      for start in range(0, len(misses), chunk_size)]
+            if workers > 1 and chunks:
+                if executor is None:
+                    # Imported here so that importing this module stays cheap
+                    from concurrent.futures import ProcessPoolExecutor
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                futures = [executor.submit(_process_chunk_timed, chunk, ops, heading, fields)
+                           for chunk in chunks]
+                timed = [item for future in futures for item in future.result()]
+            else:
+                timed = [item for chunk in chunks for item in _process_chunk_timed(chunk, ops, heading, fields)]
+            cache.put_many((key, result, seconds) for (_, key), (result, seconds) in zip(misses, timed))
+
+            computed = iter(timed)
+            for (doc_id, _), key in zip(block, keys):
+                if key in found:
+                    yield {"id": doc_id, **found[key]}
+                else:
+                    yield next(computed)[0]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+def iter_results(documents, ops=OPERATIONS, heading="SECTION", fields=DEFAULT_FIELDS,
+                 workers=None, chunk_size=64, cache=None):
+    """Return an iterator of result dicts, one per document, in input order.
+
+    Documents are sent to worker processes in chunks of chunk_size.  At most
+    two chunks per worker are in flight, so memory stays bounded however
+    large the corpus is, and each result is yielded as soon as it and every
+    earlier result are ready.  workers=1 runs in the current process.
+    With a result_cache.ResultCache as cache, documents whose content was
+    already processed with the same options are answered from the cache.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    for op in ops:
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {op}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if cache is not None:
+        return _iter_cached_results(documents, ops, heading, fields, workers, chunk_size, cache)
+    if workers <= 1:
+        return _iter_local_results(documents, ops, heading, fields, chunk_size)
+    return _iter_pool_results(documents, ops, heading, fields, workers, chunk_size)
+
+def run_corpus(source, output, ops=OPERATIONS, heading="SECTION", fields=DEFAULT_FIELDS,
+               workers=None, chunk_size=64, output_format=None, buffer_rows=10000, cache=None):
+    """Process every document in source and write JSONL results to output.
+
+    output is a path or "-" for standard output.  output_format ("csv",
+    "jsonl" or "parquet") writes flat rows through a ResultWriter flushing
+    every buffer_rows rows instead.  cache is an optional ResultCache, as
+    for iter_results.  Returns the number of documents processed.
+    """
+    if source is None or output is None:
+        raise ValueError("Source and output cannot be None")
+
+    results = iter_results(load_documents(source), ops, heading, fields, workers, chunk_size, cache)
+
+    if output_format is not None:
+        # Imported here as result_writer itself imports this module
+        from result_writer import write_results
+        return write_results(results, output, output_format, fields, buffer_rows)
+
+    count = 0
+    out = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+    try:
+        for result in results:
+            out.write(json.dumps(result, ensure_ascii=False))
+            out.write("\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return count
+
+def main(argv=None):
+    """Command-line entry point."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run legal string extractors over a corpus.")
+    parser.add_argument("input", help="directory of documents or JSONL file")
+    parser.add_argument("output", help="JSONL output file, or - for stdout")
+    parser.add_argument("--ops", default=",".join(OPERATIONS),
+                        help="comma-separated operations (default: all)")
+    parser.add_argument("--heading", default="SECTION", help="heading for the section operation")
+    parser.add_argument("--field", action="append", dest="fields",
+                        help="client information field (repeatable)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="documents per worker task")
+    parser.add_argument("--format", choices=("csv", "jsonl", "parquet"), default=None,
+                        help="write flat rows in this format instead of nested JSONL")
+    parser.add_argument("--buffer-rows", type=int, default=10000, help="rows per write with --format")
+    parser.add_argument("--cache", help="directory of a result cache to reuse unchanged documents' results")
+    parser.add_argument("--cache-size", type=int, default=1024, help="result cache size limit in MB")
+    args = parser.parse_args(argv)
+
+    ops = tuple(op.strip() for op in args.ops.split(",") if op.strip())
+    for op in ops:
+        if op not in OPERATIONS:
+            parser.error(f"unknown operation in --ops: {op}")
+    if not os.path.exists(args.input):
+        parser.error(f"input not found: {args.input}")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    for option, value in (("--chunk-size", args.chunk_size), ("--buffer-rows", args.buffer_rows),
+                          ("--cache-size", args.cache_size)):
+        if value < 1:
+            parser.error(f"{option} must be at least 1")
+    if args.format == "parquet" and args.output == "-":
+        parser.error("--format parquet needs an output file")
+
+    fields = tuple(args.fields) if args.fields else DEFAULT_FIELDS
+    cache = None
+    try:
+        if args.cache:
+            from result_cache import ResultCache
+            cache = ResultCache(args.cache, max_bytes=args.cache_size * 1024 * 1024)
+        count = run_corpus(args.input, args.output, ops, args.heading, fields,
+                           args.workers, args.chunk_size, args.format, args.buffer_rows, cache)
+    except OSError as e:
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if cache is not None:
+            cache.close()
+    print(f"Processed {count} documents", file=sys.stderr)
+    if cache is not None:
+        print(cache.report(), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
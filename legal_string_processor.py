@@ -3,6 +3,98 @@ Legal String Processor
 Demonstrates basic string operations with legal text examples.
 """
 
+import heapq
+import os
+import re
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
+from types import FunctionType
+
+# Punctuation stripped from the ends of a word before checking for a date
+DATE_PUNCTUATION = ',.;:\'\"()[]{}'
+
+# Headings that end a section in find_section unless another vocabulary is given
+SECTION_HEADINGS = ("SECTION", "ARTICLE", "RECITALS")
+
+# Bytes scanned per step by find_section_in_file before its pages are released
+MMAP_WINDOW = 16 * 1024 * 1024
+
+# Smallest chunk split_sections_parallel hands to a worker, in characters
+PARALLEL_CHUNK_SIZE = 1024 * 1024
+
+# Texts up to this length are split into words, which is faster than
+# scanning for candidates when there are only a few dozen words
+DATE_SPLIT_LIMIT = 256
+
+# First '-' of a YYYY-MM-DD candidate: another '-' follows three characters on
+_DATE_DASHES = re.compile(r"-(?=..-)", re.DOTALL)
+
+# Instrumentation collecting extractor calls in the current thread or task
+_active_instrumentation = ContextVar("legal_string_processor_instrumentation", default=None)
+
+# Instrumented functions by qualified name: (function, original code, timing
+# code, recorded name, index of the text argument, untouched copy to call)
+_instrumentable = {}
+_instrumentation_lock = threading.Lock()
+_instrumentation_users = 0
+
+def _instrumented(func):
+    """Register an extractor for instrumentation and return it unchanged.
+
+    While no Instrumentation is active anywhere in the process the function
+    runs its own code, at no extra cost.  Enabling instrumentation swaps the
+    function's code for a timing stub, so every caller sees it however it
+    bound the function; calls are recorded under the function's name with
+    the length of the text passed first (after self, for methods).
+    """
+    namespace = {"_timed_call": _timed_call}
+    exec(f"def {func.__name__}(*args, **kwargs):\n"
+         f"    return _timed_call({func.__qualname__!r}, args, kwargs)\n", namespace)
+    timing_code = namespace[func.__name__].__code__
+    untouched = FunctionType(func.__code__, func.__globals__, func.__name__,
+                             func.__defaults__, func.__closure__)
+    untouched.__kwdefaults__ = func.__kwdefaults__
+    text_index = 1 if "." in func.__qualname__ else 0
+    _instrumentable[func.__qualname__] = (func, func.__code__, timing_code,
+                                          func.__name__, text_index, untouched)
+    return func
+
+def _timed_call(qualname, args, kwargs):
+    """Run an instrumented function, recording it in the active Instrumentation."""
+    _, _, _, name, text_index, untouched = _instrumentable[qualname]
+    instrumentation = _active_instrumentation.get()
+    if instrumentation is None:
+        return untouched(*args, **kwargs)
+    text = args[text_index] if len(args) > text_index else None
+    size = len(text) if isinstance(text, str) else 0
+    start = time.perf_counter()
+    try:
+        result = untouched(*args, **kwargs)
+    except BaseException:
+        instrumentation.record(name, time.perf_counter() - start, size, True)
+        raise
+    instrumentation.record(name, time.perf_counter() - start, size)
+    return result
+
+def _count_instrumentation_user(change):
+    """Track active Instrumentations, swapping the timing code in or out at zero."""
+    global _instrumentation_users
+    with _instrumentation_lock:
+        users = max(0, _instrumentation_users + change)
+        if (users > 0) != (_instrumentation_users > 0):
+            for func, code, timing_code, *_ in _instrumentable.values():
+                func.__code__ = timing_code if users else code
+        _instrumentation_users = users
+
 def initialize_legal_samples():
     """Initialize sample legal text data."""
     # Sample case citation
@@ -30,6 +122,7 @@ WHEREAS, a dispute arose between the Parties on 2022-11-30;
     
     return (case_citation, client_info, contract_section, legal_document)
 
+@_instrumented
 def extract_case_name(citation):
     """Extract the case name from a case citation."""
     if citation is None:
@@ -62,6 +155,7 @@ def extract_case_name(citation):
     
     return f"{plaintiff}{separator}{defendant}"
 
+@_instrumented
 def extract_parties(case_name):
     """Extract plaintiff and defendant from a case name."""
     if case_name is None:
@@ -80,17 +174,436 @@ def extract_parties(case_name):
     else:
         return (case_name, "")
 
+def extract_case_names_batch(citations):
+    """Extract case names and (plaintiff, defendant) pairs from many citations.
+
+    Returns a list of (case_name, (plaintiff, defendant)) tuples, one per
+    citation, matching extract_case_name followed by extract_parties.
+    """
+    return DEFAULT_PROCESSOR.extract_case_names_batch(citations)
+
+def _strip_span(text, start, end):
+    """Return the offsets of text[start:end].strip() within text."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end)
+
+def _case_name_spans(citation, separators):
+    """Locate the parties extract_case_name would join, as offsets into citation.
+
+    Returns (code, (plaintiff_start, plaintiff_end, defendant_start,
+    defendant_end)), where separators[code - 1] is the first of separators
+    found.  code is 0 when there is none, and the plaintiff span is then
+    the whole case name.
+    """
+    for code, separator in enumerate(separators, 1):
+        separator_pos = citation.find(separator)
+        if separator_pos != -1:
+            break
+    else:
+        comma_pos = citation.find(',')
+        if comma_pos == -1:
+            return (0, (0, len(citation), 0, 0))
+        return (0, _strip_span(citation, 0, comma_pos) + (0, 0))
+    
+    rest_start = separator_pos + len(separator)
+    rest_end = citation.find(separator, rest_start)
+    if rest_end == -1:
+        rest_end = len(citation)
+    comma_pos = citation.find(',', rest_start, rest_end)
+    if comma_pos != -1:
+        rest_end = comma_pos
+    return (code, _strip_span(citation, 0, separator_pos) + _strip_span(citation, rest_start, rest_end))
+
+def _misjoin_affixes(separator, earlier):
+    """Return (tails, heads) flagging case names extract_parties may split elsewhere.
+
+    A case name joins a plaintiff and a defendant, neither holding any of
+    separator or earlier (the separators tried before it), with separator.
+    Another of them can then only appear across the party boundary, which
+    needs the plaintiff to end with one of tails or the defendant to start
+    with one of heads.  Flagged case names are split by extract_parties.
+    """
+    tails = set()
+    heads = set()
+    for other in (*earlier, separator):
+        # Each placement of other across the joining separator, by its start
+        # relative to that separator's
+        for start in range(1 - len(other), len(separator)):
+            if other is separator and start == 0:
+                continue
+            end = start + len(other)
+            overlap_start = max(start, 0)
+            overlap_end = min(end, len(separator))
+            if other[overlap_start - start:overlap_end - start] != separator[overlap_start:overlap_end]:
+                continue
+            if start < 0:
+                tails.add(other[:-start])
+            elif end > len(separator):
+                heads.add(other[len(separator) - start:])
+            else:
+                # other lies inside separator, so every case name is flagged
+                tails.add("")
+    return (tuple(sorted(tails)), tuple(sorted(heads)))
+
+# Separators stored by code in CaseNameResults; 0 means none was found
+_CASE_SEPARATORS = ("", " v. ", " vs. ")
+
+class CaseNameResults:
+    """Compact results of extract_case_names_batch.
+
+    Each citation is stored by reference with the offsets of its plaintiff
+    and defendant in flat arrays, about 40 bytes per record, instead of a
+    tuple of tuples and three new strings.  Strings are built only when a
+    record is read; reading record i gives the (case_name, (plaintiff,
+    defendant)) tuple extract_case_names_batch returns.
+    """
+
+    __slots__ = ("_citations", "_spans", "_separators", "_irregular")
+
+    def __init__(self, citations=()):
+        self._citations = []
+        # plaintiff_start, plaintiff_end, defendant_start, defendant_end per record
+        self._spans = array("q")
+        self._separators = array("b")
+        # index -> parties, for the rare case names extract_parties splits
+        # differently from the citation
+        self._irregular = {}
+        self.extend(citations)
+
+    def append(self, citation):
+        """Extract and store the case name and parties of one citation."""
+        if citation is None:
+            raise ValueError("Citation cannot be None")
+        
+        code, spans = _case_name_spans(citation, _CASE_SEPARATORS[1:])
+        if code:
+            _, tails, heads = DEFAULT_PROCESSOR._joins[code - 1]
+            if citation.endswith(tails, spans[0], spans[1]) or citation.startswith(heads, spans[2], spans[3]):
+                case_name = f"{citation[spans[0]:spans[1]]}{_CASE_SEPARATORS[code]}{citation[spans[2]:spans[3]]}"
+                self._irregular[len(self._citations)] = extract_parties(case_name)
+        
+        self._citations.append(citation)
+        self._spans.extend(spans)
+        self._separators.append(code)
+
+    def extend(self, citations):
+        """Append every citation in citations."""
+        for citation in citations:
+            self.append(citation)
+
+    def __len__(self):
+        return len(self._citations)
+
+    def case_name(self, index):
+        """Return the case name of record index."""
+        index = range(len(self._citations))[index]
+        citation = self._citations[index]
+        offset = index * 4
+        plaintiff = citation[self._spans[offset]:self._spans[offset + 1]]
+        code = self._separators[index]
+        if not code:
+            return plaintiff
+        return f"{plaintiff}{_CASE_SEPARATORS[code]}{citation[self._spans[offset + 2]:self._spans[offset + 3]]}"
+
+    def parties(self, index):
+        """Return the (plaintiff, defendant) tuple of record index."""
+        index = range(len(self._citations))[index]
+        if index in self._irregular:
+            return self._irregular[index]
+        if not self._separators[index]:
+            return (self.case_name(index), "")
+        citation = self._citations[index]
+        offset = index * 4
+        return (citation[self._spans[offset]:self._spans[offset + 1]],
+                citation[self._spans[offset + 2]:self._spans[offset + 3]])
+
+    def __getitem__(self, index):
+        return (self.case_name(index), self.parties(index))
+
+    def __iter__(self):
+        for index in range(len(self._citations)):
+            yield self[index]
+
+def extract_case_names_compact(citations):
+    """Like extract_case_names_batch, returning a compact CaseNameResults."""
+    return CaseNameResults(citations)
+
+def _result_size(value):
+    """Approximate memory used by a cached string or tuple of strings."""
+    size = sys.getsizeof(value)
+    if isinstance(value, tuple):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+class ExtractionCache:
+    """Thread-safe, size-bounded LRU cache around a one-argument extractor.
+
+    The cache holds at most max_entries results and, if max_bytes is set,
+    at most max_bytes of keys and results; the least recently used entries
+    are evicted first.  None is never cached, so the extractor's ValueError
+    is raised on every call.
+    """
+
+    def __init__(self, func, max_entries=100000, max_bytes=None):
+        if func is None:
+            raise ValueError("Function cannot be None")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Max entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Max bytes must be at least 1")
+        self.func = func
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        if max_bytes is None:
+            # Only an entry limit: functools.lru_cache is thread-safe and
+            # implemented in C, which matters for extractors this cheap
+            self._lru = lru_cache(maxsize=max_entries)(func)
+        else:
+            self._lru = None
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, key):
+        if key is None:
+            return self.func(key)
+        if self._lru is not None:
+            return self._lru(key)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        # Extract outside the lock; a racing thread may store the same result
+        result = self.func(key)
+        size = _result_size(key) + _result_size(result)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = result
+                self._sizes[key] = size
+                self._bytes += size
+                self._evict()
+        return result
+
+    def _evict(self):
+        """Drop least recently used entries until both limits are met."""
+        entries = self._entries
+        while entries and (
+                (self.max_entries is not None and len(entries) > self.max_entries)
+                or self._bytes > self.max_bytes):
+            key, _ = entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(key)
+            self._evictions += 1
+
+    def clear(self):
+        """Remove every cached result and reset the statistics."""
+        with self._lock:
+            if self._lru is not None:
+                self._lru.cache_clear()
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        """Return hit, miss and eviction counts and the current cache size.
+
+        "evictions" and "bytes" are only counted when the cache was given a
+        max_bytes limit, and are None otherwise.
+        """
+        if self._lru is not None:
+            # lru_cache does not report evictions, and they cannot be derived
+            # from its misses: a miss whose extractor raises stores nothing
+            info = self._lru.cache_info()
+            return {
+                "hits": info.hits,
+                "misses": info.misses,
+                "evictions": None,
+                "entries": info.currsize,
+                "bytes": None,
+            }
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+# Opt-in memoized versions of the citation extractors
+cached_extract_case_name = ExtractionCache(extract_case_name)
+cached_extract_parties = ExtractionCache(extract_parties)
+
+def _iter_date_words(text, pos=0, endpos=None):
+    """Yield the words in text[pos:endpos] that may hold a YYYY-MM-DD date.
+
+    Words are located from the '-' pattern instead of splitting the whole
+    text, so memory use does not grow with the text.  Every word that
+    extract_date would accept is yielded, in order; callers still strip
+    and check each one.
+    """
+    for word_start, word_end, _ in _iter_date_word_spans(text, pos, endpos):
+        yield text[word_start:word_end]
+
+def _iter_date_word_spans(text, pos=0, endpos=None):
+    """Yield (word_start, word_end, date_start) for each word _iter_date_words yields.
+
+    text[date_start:date_start + 10] is what the word strips down to.
+    """
+    if endpos is None:
+        endpos = len(text)
+    for match in _DATE_DASHES.finditer(text, pos, endpos):
+        date_start = match.start() - 4
+        date_end = date_start + 10
+        if date_start < pos or date_end > endpos:
+            continue
+
+        # Only punctuation may sit between the date and the word boundaries
+        word_start = date_start
+        while word_start > pos and text[word_start - 1] in DATE_PUNCTUATION:
+            word_start -= 1
+        if word_start > pos and not text[word_start - 1].isspace():
+            continue
+        word_end = date_end
+        while word_end < endpos and text[word_end] in DATE_PUNCTUATION:
+            word_end += 1
+        if word_end < endpos and not text[word_end].isspace():
+            continue
+
+        yield (word_start, word_end, date_start)
+
+def _is_date(clean_word):
+    """Check that a stripped word matches YYYY-MM-DD, as extract_date does."""
+    return (len(clean_word) == 10 and clean_word[4] == '-' and clean_word[7] == '-'
+            and clean_word[0:4].isdigit() and clean_word[5:7].isdigit()
+            and clean_word[8:10].isdigit())
+
+# Days in each month of a non-leap year
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _is_calendar_date(value):
+    """Check that a YYYY-MM-DD string of ASCII digits names a real calendar day."""
+    if not (_is_date(value) and value.isascii()):
+        return False
+    year, month, day = int(value[0:4]), int(value[5:7]), int(value[8:10])
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _MONTH_DAYS[month - 1]
+
+def _iter_chunks(stream, chunk_size):
+    """Yield chunks read from a text file object until it is exhausted."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def _iter_dates_in_text(text):
+    """Yield every YYYY-MM-DD date in a string."""
+    for word in _iter_date_words(text):
+        clean_word = word.strip(DATE_PUNCTUATION)
+        if _is_date(clean_word):
+            yield clean_word
+
+def _date_starts(text):
+    """Return the offset of every date _iter_dates_in_text yields."""
+    return [date_start for _, _, date_start in _iter_date_word_spans(text)
+            if _is_date(text[date_start:date_start + 10])]
+
+def _iter_dates_in_chunks(chunks):
+    """Yield every YYYY-MM-DD date in a sequence of string chunks.
+
+    The unfinished word at the end of each chunk is carried over to the
+    next one, so dates split across chunk boundaries are still found.
+    """
+    carry = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer = carry + chunk
+
+        # Words are complete up to the last whitespace in the new chunk
+        cut = len(buffer)
+        while cut > len(carry) and not buffer[cut - 1].isspace():
+            cut -= 1
+        if cut == len(carry):
+            cut = 0
+
+        for word in _iter_date_words(buffer, 0, cut):
+            clean_word = word.strip(DATE_PUNCTUATION)
+            if _is_date(clean_word):
+                yield clean_word
+
+        carry = buffer[cut:]
+        # Words are checked with their end punctuation stripped, so a run of
+        # it counts the same as one character; collapse runs so a word of
+        # nothing but punctuation does not grow the carry without bound
+        core = carry.strip(DATE_PUNCTUATION)
+        if not core:
+            carry = carry[:1]
+        elif len(carry) - len(core) > 2:
+            core_start = len(carry) - len(carry.lstrip(DATE_PUNCTUATION))
+            core_end = core_start + len(core)
+            carry = carry[:min(core_start, 1)] + core + carry[core_end:core_end + 1]
+        # A word with more than ten characters left after stripping leading
+        # punctuation can never become a date; swap it for a short
+        # placeholder that cannot either, so one huge word does not grow
+        # the carry without bound
+        core = carry.lstrip(DATE_PUNCTUATION)
+        if len(core) > 10 and core[10:].strip(DATE_PUNCTUATION):
+            carry = "#" * 11
+
+    if carry:
+        yield from _iter_dates_in_text(carry)
+
+def iter_dates(text_or_stream, chunk_size=65536):
+    """Lazily yield every date in YYYY-MM-DD format, in order of appearance.
+
+    Accepts a string, a text file object, or an iterable of string chunks.
+    Dates are checked the same way as in extract_date, and scanning stops
+    as soon as the caller stops consuming the results.
+    """
+    if text_or_stream is None:
+        raise ValueError("Text cannot be None")
+
+    if isinstance(text_or_stream, str):
+        return _iter_dates_in_text(text_or_stream)
+    if hasattr(text_or_stream, "read"):
+        return _iter_dates_in_chunks(_iter_chunks(text_or_stream, chunk_size))
+    return _iter_dates_in_chunks(text_or_stream)
+
+@_instrumented
 def extract_date(text):
     """Extract a date in YYYY-MM-DD format from text."""
     if text is None:
         raise ValueError("Text cannot be None")
     
-    # Find a date in YYYY-MM-DD format
-    words = text.split()
+    # Find a date in YYYY-MM-DD format; longer texts are scanned for
+    # candidate words only rather than splitting the whole text into a list
+    if len(text) <= DATE_SPLIT_LIMIT:
+        words = text.split()
+    else:
+        words = _iter_date_words(text)
     
     for word in words:
         # Clean the word from punctuation
-        clean_word = word.strip(',.;:\'\"()[]{}')
+        clean_word = word.strip(DATE_PUNCTUATION)
         
         # Check if it matches date format YYYY-MM-DD
         if len(clean_word) == 10 and clean_word[4] == '-' and clean_word[7] == '-':
@@ -103,14 +616,242 @@ def extract_date(text):
     
     return ""
 
-def find_section(document, heading):
-    """Find a section in a document by its heading."""
+def _ascii_date(date):
+    """Return a YYYY-MM-DD date with its digits as ASCII, or None if they are not decimal.
+
+    _is_date accepts any digits isdigit() does, such as full-width ones,
+    which only compare as dates once converted.
+    """
+    if date.isascii():
+        return date
+    parts = (date[0:4], date[5:7], date[8:10])
+    if not all(part.isdecimal() for part in parts):
+        return None
+    return "%04d-%02d-%02d" % tuple(map(int, parts))
+
+def _date_bound(bound, default):
+    """Return a since/until bound as a YYYY-MM-DD string, default when None."""
+    if bound is None:
+        return default
+    bound = str(bound)
+    if not (_is_date(bound) and bound.isascii()):
+        raise ValueError(f"Dates must be YYYY-MM-DD: {bound!r}")
+    return bound
+
+def extract_all_dates(text, since=None, until=None, validate=False):
+    """Return (date, start, end) for every YYYY-MM-DD date in text, in order.
+
+    Dates are recognised as extract_date recognises them, in one pass over
+    the text, and text[start:end] is the date.  since and until are
+    inclusive YYYY-MM-DD strings or datetime.date objects limiting the
+    dates returned; validate=True also drops dates that are not real
+    calendar days, such as 2023-02-30.  Both are applied while scanning.
+    """
+    if text is None:
+        raise ValueError("Text cannot be None")
+    
+    since = _date_bound(since, "0000-00-00")
+    until = _date_bound(until, "9999-99-99")
+    filtered = validate or since != "0000-00-00" or until != "9999-99-99"
+    
+    dates = []
+    for _, _, start in _iter_date_word_spans(text):
+        end = start + 10
+        date = text[start:end]
+        if not _is_date(date):
+            continue
+        if filtered:
+            key = _ascii_date(date)
+            if key is None or not since <= key <= until or (validate and not _is_calendar_date(key)):
+                continue
+        dates.append((date, start, end))
+    return dates
+
+# ASCII characters str.split() treats as whitespace, including \x1c-\x1f
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+DATE_ENGINES = ("python", "numpy")
+
+# Punctuation the numpy engine steps over around a date before deferring
+# the text to extract_date
+_PUNCTUATION_REACH = 8
+
+# Characters per numpy batch; larger buffers fall out of the CPU cache
+# between array passes and lose to the python engine
+_NUMPY_BATCH_CHARS = 1 << 18
+
+def _first_dates_numpy(texts):
+    """First YYYY-MM-DD date of each text, found with NumPy array operations.
+
+    The texts are joined and encoded once into a single uint8 buffer, and
+    every position is checked for the digit and '-' pattern at once; a
+    candidate counts only if nothing but punctuation separates it from
+    whitespace on both sides, which is what stripping a split() word does.
+    Non-ASCII texts, and the rare ones with a run of punctuation longer
+    than _PUNCTUATION_REACH around a candidate, use extract_date, since
+    isdigit() and split() also accept non-ASCII digits and whitespace.
+    """
+    import numpy as np
+    
+    # Newlines around and between texts keep dates from spanning them
+    padded = "\n".join(["", *texts, ""])
+    # Replacing each non-ASCII character with one byte keeps offsets aligned
+    buffer = padded.encode("ascii", "replace")
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    size = len(data)
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    starts = np.cumsum(lengths + 1) - lengths
+    
+    results = [""] * len(texts)
+    deferred = set()
+    if not padded.isascii():
+        deferred.update(i for i, text in enumerate(texts) if not text.isascii())
+    
+    # Candidate starts have '-' at offsets 4 and 7, then digits everywhere else
+    dashes = np.flatnonzero(data == ord('-'))
+    dashes = dashes[(dashes >= 5) & (dashes < size - 6)]
+    candidates = dashes[data[dashes + 3] == ord('-')] - 4
+    digits = data[candidates[:, None] + np.array([0, 1, 2, 3, 5, 6, 8, 9])] - np.uint8(ord('0'))
+    candidates = candidates[(digits < 10).all(axis=1)]
+    
+    space_table = np.zeros(256, dtype=bool)
+    space_table[list(_ASCII_WHITESPACE)] = True
+    punct_table = np.zeros(256, dtype=bool)
+    punct_table[list(DATE_PUNCTUATION.encode("ascii"))] = True
+    
+    # The first byte that is not punctuation on each side must be whitespace;
+    # the padding newlines stop every run at the ends of the buffer
+    steps = np.arange(1, _PUNCTUATION_REACH + 1)
+    before = data[np.maximum(candidates[:, None] - steps, 0)]
+    after = data[np.minimum(candidates[:, None] + 9 + steps, size - 1)]
+    rows = np.arange(len(candidates))
+    bounded = np.ones(len(candidates), dtype=bool)
+    is_date = np.ones(len(candidates), dtype=bool)
+    for side in (before, after):
+        stops = ~punct_table[side]
+        bounded &= stops.any(axis=1)
+        is_date &= space_table[side[rows, stops.argmax(axis=1)]]
+    for date_start in candidates[~bounded].tolist():
+        deferred.add(int(np.searchsorted(starts, date_start, side="right")) - 1)
+    dates = candidates[is_date & bounded]
+    
+    # Dates are in offset order, so the first one per text is its first date
+    text_numbers = np.searchsorted(starts, dates, side="right") - 1
+    text_numbers, first = np.unique(text_numbers, return_index=True)
+    for text_number, date_start in zip(text_numbers.tolist(), dates[first].tolist()):
+        results[text_number] = padded[date_start:date_start + 10]
+    for text_number in deferred:
+        results[text_number] = extract_date(texts[text_number])
+    return results
+
+def extract_dates_batch(texts, engine="python", batch_size=10000):
+    """Extract the first YYYY-MM-DD date of each text, as extract_date does.
+
+    engine="numpy" checks a whole batch of texts with vectorized array
+    operations; it requires NumPy.  It is faster on many short texts,
+    while the python engine, which stops at each text's first date, is
+    faster on long ones.  Texts are processed at most batch_size and about
+    _NUMPY_BATCH_CHARS characters at a time, so the intermediate arrays
+    stay in cache.
+    """
+    if engine not in DATE_ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    
+    if engine == "python":
+        return [extract_date(text) for text in texts]
+    
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        raise ImportError("The numpy engine requires NumPy (pip install numpy)") from None
+    
+    texts = list(texts)
+    if None in texts:
+        raise ValueError("Text cannot be None")
+    ends = list(accumulate(map(len, texts)))
+    results = []
+    batch_start = 0
+    while batch_start < len(texts):
+        done = ends[batch_start - 1] if batch_start else 0
+        batch_end = min(batch_start + batch_size,
+                        bisect_right(ends, done + _NUMPY_BATCH_CHARS, batch_start + 1))
+        results.extend(_first_dates_numpy(texts[batch_start:batch_end]))
+        batch_start = batch_end
+    return results
+
+class SpanResults:
+    """Compact results of an extractor returning one substring per text.
+
+    Each text is stored by reference with the offsets of its result in two
+    flat arrays, about 24 bytes per record, and the substring is sliced out
+    only when read.  A result not found reads as "".
+    """
+
+    __slots__ = ("_texts", "_starts", "_ends")
+
+    def __init__(self):
+        self._texts = []
+        self._starts = array("q")
+        self._ends = array("q")
+
+    def append(self, text, start, end):
+        """Store text[start:end] as the next result; start -1 for no result."""
+        self._texts.append(text)
+        self._starts.append(start)
+        self._ends.append(end)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def span(self, index):
+        """Return the (start, end) offsets of record index, or None if not found."""
+        index = range(len(self._texts))[index]
+        start = self._starts[index]
+        return None if start == -1 else (start, self._ends[index])
+
+    def __getitem__(self, index):
+        index = range(len(self._texts))[index]
+        start = self._starts[index]
+        if start == -1:
+            return ""
+        return self._texts[index][start:self._ends[index]]
+
+    def __iter__(self):
+        for index in range(len(self._texts)):
+            yield self[index]
+
+def extract_dates_compact(texts):
+    """Return the first date of each text, as extract_date, in a SpanResults."""
+    results = SpanResults()
+    for text in texts:
+        if text is None:
+            raise ValueError("Text cannot be None")
+        date_start = -1
+        for _, _, start in _iter_date_word_spans(text):
+            if _is_date(text[start:start + 10]):
+                date_start = start
+                break
+        results.append(text, date_start, date_start + 10)
+    return results
+
+@_instrumented
+def find_section(document, heading, headings=None):
+    """Find a section in a document by its heading.
+
+    headings is the vocabulary of keywords that end a section, as a sequence
+    of strings or a HeadingMatcher; SECTION_HEADINGS when None.
+    """
     if document is None or heading is None:
         raise ValueError("Document and heading cannot be None")
     
     if not heading:
         raise ValueError("Heading cannot be empty")
     
+    matcher = None if headings is None else _heading_matcher(headings)
+    
     # Find the heading position
     heading_pos = document.find(heading)
     if heading_pos == -1:
@@ -123,7 +864,12 @@ def find_section(document, heading):
     
     # Find the next heading or end of document
     next_heading_pos = -1
-    possible_headings = ["SECTION", "ARTICLE", "RECITALS"]
+    possible_headings = SECTION_HEADINGS
+    
+    if matcher is not None:
+        # One scan however many keywords there are
+        next_heading_pos = matcher.find(document, content_start)
+        possible_headings = ()
     
     for possible_heading in possible_headings:
         pos = document.find(possible_heading, content_start)
@@ -138,6 +884,978 @@ def find_section(document, heading):
     
     return content
 
+def _trie_pattern(node):
+    """Return a regular expression matching every keyword below a trie node."""
+    alternatives = [re.escape(char) + _trie_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+    if not alternatives:
+        return ""
+    pattern = "(?:" + "|".join(alternatives) + ")"
+    if "" in node:
+        # A keyword ends here and longer ones continue
+        return pattern + "?"
+    return alternatives[0] if len(alternatives) == 1 else pattern
+
+class HeadingMatcher:
+    """Finds the first of many heading keywords in a single scan.
+
+    The keywords are merged into a trie compiled to one regular expression,
+    so a search visits each character once whatever the vocabulary size,
+    instead of once per keyword as with repeated str.find calls.
+    """
+
+    def __init__(self, headings):
+        if headings is None or isinstance(headings, str):
+            raise ValueError("Headings must be a sequence of strings")
+        self.headings = tuple(headings)
+        if not self.headings:
+            raise ValueError("Headings cannot be empty")
+        trie = {}
+        for keyword in self.headings:
+            if not isinstance(keyword, str) or not keyword:
+                raise ValueError("Each heading must be a non-empty string")
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        pattern = _trie_pattern(trie)
+        self._search = re.compile(pattern).search
+        self._line_search = re.compile(f"(?m)^(?:{pattern})").search
+        # The lookahead matches without consuming, so overlapping keywords
+        # are all reported
+        self._finditer = re.compile(f"(?=(?:{pattern}))").finditer
+
+    def find(self, document, start=0):
+        """Return the lowest offset at or after start where any keyword occurs, or -1."""
+        match = self._search(document, start)
+        return match.start() if match else -1
+
+    def find_line_start(self, document, start=0):
+        """Return the lowest offset at or after start where a keyword begins a line, or -1."""
+        match = self._line_search(document, start)
+        return match.start() if match else -1
+
+    def iter_find(self, document):
+        """Yield the offsets at which any keyword occurs, in order."""
+        for match in self._finditer(document):
+            yield match.start()
+
+    def find_all(self, document):
+        """Return the sorted offsets at which any keyword occurs."""
+        return [match.start() for match in self._finditer(document)]
+
+@lru_cache(maxsize=32)
+def _cached_matcher(headings):
+    return HeadingMatcher(headings)
+
+def _heading_matcher(headings):
+    """Return headings as a HeadingMatcher, reusing ones built from the same keywords."""
+    if isinstance(headings, HeadingMatcher):
+        return headings
+    if isinstance(headings, (list, tuple)):
+        try:
+            return _cached_matcher(tuple(headings))
+        except TypeError:
+            # Unhashable entries; let HeadingMatcher report them
+            pass
+    return HeadingMatcher(headings)
+
+class Section:
+    """One section of a document found by split_sections.
+
+    Holds offsets into the document rather than a copy of the text;
+    content is sliced out only when it is read.  Unpacks as
+    (heading, start, end, content).
+    """
+
+    __slots__ = ("document", "heading", "start", "end")
+
+    def __init__(self, document, heading, start, end):
+        self.document = document
+        self.heading = heading
+        self.start = start
+        self.end = end
+
+    @property
+    def content(self):
+        """The section text, as find_section returns it."""
+        return self.document[self.start:self.end].strip()
+
+    def __iter__(self):
+        return iter((self.heading, self.start, self.end, self.content))
+
+    def __repr__(self):
+        return f"Section({self.heading!r}, {self.start}, {self.end})"
+
+def _iter_sections(document, positions):
+    """Yield the Sections that start at the given keyword offsets."""
+    heading_pos = next(positions, -1)
+    while heading_pos != -1:
+        content_start = document.find('\n', heading_pos)
+        if content_start == -1:
+            # A heading on the last line has no content
+            yield Section(document, document[heading_pos:].rstrip(), len(document), len(document))
+            return
+        
+        next_heading_pos = next(positions, -1)
+        while next_heading_pos != -1 and next_heading_pos < content_start:
+            next_heading_pos = next(positions, -1)
+        
+        content_end = len(document) if next_heading_pos == -1 else next_heading_pos
+        yield Section(document, document[heading_pos:content_start].rstrip(), content_start, content_end)
+        heading_pos = next_heading_pos
+
+def split_sections(document, headings=None):
+    """Lazily yield a Section for every heading of a document, in one pass.
+
+    A section starts at a heading keyword (SECTION_HEADINGS unless headings
+    is given); its heading is the rest of that line and its content runs,
+    as in find_section, from the end of the heading to the next keyword.
+    Keywords inside a heading line do not start another section.  content
+    equals find_section(document, heading, headings) whenever the heading
+    text does not also occur earlier in the document.
+    """
+    if document is None:
+        raise ValueError("Document cannot be None")
+    
+    matcher = _heading_matcher(SECTION_HEADINGS if headings is None else headings)
+    return _iter_sections(document, matcher.iter_find(document))
+
+def _section_chunk_bounds(document, matcher, chunk_size):
+    """Return offsets splitting document into chunks of at least chunk_size characters.
+
+    Every offset after 0 is a keyword at the start of a line.  Any earlier
+    heading line ends before it, so split_sections starts a section there
+    and each chunk can be split on its own.
+    """
+    bounds = [0]
+    pos = chunk_size
+    while pos < len(document):
+        pos = matcher.find_line_start(document, pos)
+        if pos == -1:
+            break
+        bounds.append(pos)
+        pos += chunk_size
+    bounds.append(len(document))
+    return bounds
+
+def _attach_shared_memory(name):
+    """Attach to a shared memory block that another process created and will unlink."""
+    from multiprocessing.shared_memory import SharedMemory
+    
+    try:
+        # Python 3.13+: leave cleanup to the creating process alone
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        return SharedMemory(name=name)
+
+def _split_shared_chunk(name, byte_start, byte_end, offset, headings):
+    """Worker entry point: split one chunk of a document held in shared memory.
+
+    Returns the headings of the chunk's sections and their content start and
+    end offsets in the whole document, as one flat array.
+    """
+    memory = _attach_shared_memory(name)
+    try:
+        view = memory.buf[byte_start:byte_end]
+        chunk = str(view, "utf-8", "surrogatepass")
+        view.release()
+    finally:
+        memory.close()
+    
+    found = []
+    spans = array("q")
+    for section in _iter_sections(chunk, _heading_matcher(headings).iter_find(chunk)):
+        found.append(section.heading)
+        spans.extend((section.start + offset, section.end + offset))
+    return (found, spans)
+
+def split_sections_parallel(document, headings=None, workers=None, executor=None,
+                            chunk_size=PARALLEL_CHUNK_SIZE):
+    """Return the Sections split_sections yields, found by a pool of worker processes.
+
+    The document is cut at line-start headings into chunks of about
+    chunk_size characters or more, copied once into shared memory as UTF-8,
+    and each worker decodes and splits only its own chunks.  The Sections
+    are merged in document order and slice the original document, so the
+    result equals list(split_sections(document, headings)).  executor is an
+    optional ProcessPoolExecutor to reuse; otherwise one with workers
+    processes (default: CPU count) is started for the call.  Documents of
+    fewer than two chunks are split in the current process.
+
+    The calling process creates and unlinks the shared memory.  Before
+    Python 3.13, workers forked before the process's resource tracker was
+    running (as in a pool created before the first call) track the block
+    themselves and print resource_tracker leak warnings at exit; results
+    are unaffected.  Calling multiprocessing.resource_tracker.ensure_running()
+    before creating such a pool avoids them.
+    """
+    if document is None:
+        raise ValueError("Document cannot be None")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    
+    matcher = _heading_matcher(SECTION_HEADINGS if headings is None else headings)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Chunks only split cleanly at line starts when no keyword spans lines
+    if any('\n' in keyword for keyword in matcher.headings):
+        bounds = [0, len(document)]
+    else:
+        # A few chunks per worker, to even out uneven chunks
+        bounds = _section_chunk_bounds(document, matcher, max(chunk_size, len(document) // (workers * 4)))
+    if len(bounds) <= 2 or (workers <= 1 and executor is None):
+        return list(_iter_sections(document, matcher.iter_find(document)))
+    
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+    
+    encoded = [document[start:end].encode("utf-8", "surrogatepass") for start, end in zip(bounds, bounds[1:])]
+    memory = SharedMemory(create=True, size=sum(map(len, encoded)))
+    own_executor = executor is None
+    try:
+        byte_bounds = [0]
+        for data in encoded:
+            byte_start = byte_bounds[-1]
+            memory.buf[byte_start:byte_start + len(data)] = data
+            byte_bounds.append(byte_start + len(data))
+        del encoded
+        
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        futures = [executor.submit(_split_shared_chunk, memory.name, byte_bounds[number],
+                                   byte_bounds[number + 1], bounds[number], matcher.headings)
+                   for number in range(len(bounds) - 1)]
+        sections = []
+        for future in futures:
+            found, spans = future.result()
+            sections.extend(Section(document, heading, spans[2 * number], spans[2 * number + 1])
+                            for number, heading in enumerate(found))
+        return sections
+    finally:
+        if own_executor and executor is not None:
+            executor.shutdown()
+        memory.close()
+        memory.unlink()
+
+def _find_all(document, keywords):
+    """Return the sorted offsets of every occurrence of any keyword, overlaps included."""
+    positions = []
+    for keyword in keywords:
+        pos = document.find(keyword)
+        while pos != -1:
+            positions.append(pos)
+            pos = document.find(keyword, pos + 1)
+    positions.sort()
+    return positions
+
+def _prefix_end(texts, prefix, low):
+    """Return the end of the run of sorted texts starting with prefix that begins at low."""
+    high = len(texts)
+    while low < high:
+        middle = (low + high) // 2
+        if texts[middle].startswith(prefix):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+class _HeadingLines:
+    """Where each line that starts at a heading keyword first occurs.
+
+    A line here runs from a keyword to the next newline.  Lookups take a
+    binary search over the sorted line texts and a range minimum over the
+    offsets of the lines a heading starts, or one dict lookup when the
+    heading runs on past a whole line.
+    """
+
+    __slots__ = ("_first", "_texts", "_tree")
+
+    def __init__(self, document, positions):
+        first = {}
+        find = document.find
+        for pos in positions:
+            end = find('\n', pos)
+            first.setdefault(document[pos:end] if end != -1 else document[pos:], pos)
+        self._first = first
+        
+        # A min segment tree over the first offsets of the sorted texts
+        texts = sorted(first)
+        count = len(texts)
+        tree = [0] * count + [first[text] for text in texts]
+        for index in range(count - 1, 0, -1):
+            tree[index] = min(tree[2 * index], tree[2 * index + 1])
+        self._texts = texts
+        self._tree = tree
+
+    def find(self, document, heading):
+        """Return the first offset of a heading that starts with a keyword, or -1."""
+        line, newline, _ = heading.partition('\n')
+        if newline:
+            # Such a heading can only start where a whole line equals line
+            pos = self._first.get(line, -1)
+            if pos == -1 or document.startswith(heading, pos):
+                return pos
+            return document.find(heading, pos + 1)
+        
+        low = bisect_left(self._texts, heading)
+        # The lines starting with heading sort together from low
+        return self._range_min(low, _prefix_end(self._texts, heading, low))
+
+    def _range_min(self, low, high):
+        """Return the smallest first offset of texts[low:high], or -1 if empty."""
+        tree = self._tree
+        count = len(self._texts)
+        result = -1
+        low += count
+        high += count
+        while low < high:
+            if low & 1:
+                if result == -1 or tree[low] < result:
+                    result = tree[low]
+                low += 1
+            if high & 1:
+                high -= 1
+                if result == -1 or tree[high] < result:
+                    result = tree[high]
+            low >>= 1
+            high >>= 1
+        return result
+
+class SectionIndex:
+    """Heading offsets of one document, for repeated find_section lookups.
+
+    The offsets of every heading keyword (SECTION_HEADINGS unless headings
+    is given) are recorded once, so each lookup finds the next heading with a
+    binary search instead of rescanning the document.  Results match
+    find_section(document, heading, headings).
+    """
+
+    def __init__(self, document, headings=None):
+        self.matcher = None if headings is None else _heading_matcher(headings)
+        self._build(document)
+
+    def _build(self, document):
+        """Record the heading offsets of document and drop cached lookups."""
+        if document is None:
+            raise ValueError("Document cannot be None")
+        self.document = document
+        if self.matcher is None:
+            self.heading_positions = _find_all(document, SECTION_HEADINGS)
+        else:
+            self.heading_positions = self.matcher.find_all(document)
+        self._heading_lines = _HeadingLines(document, self.heading_positions)
+        # heading -> (content_start, content_end), or None when not found
+        self._spans = {}
+
+    def update(self, document):
+        """Rebuild the index if document differs; return True if it was rebuilt."""
+        if document is self.document or document == self.document:
+            return False
+        self._build(document)
+        return True
+
+    def find_section(self, heading):
+        """Find a section by its heading, as find_section(self.document, heading)."""
+        if heading is None:
+            raise ValueError("Heading cannot be None")
+        
+        if not heading:
+            raise ValueError("Heading cannot be empty")
+        
+        if heading in self._spans:
+            span = self._spans[heading]
+        else:
+            span = self._find_span(heading)
+            self._spans[heading] = span
+        
+        if span is None:
+            return ""
+        return self.document[span[0]:span[1]].strip()
+
+    def _find_span(self, heading):
+        """Locate the (start, end) of a section's content, or None."""
+        document = self.document
+        keywords = SECTION_HEADINGS if self.matcher is None else self.matcher.headings
+        if heading.startswith(keywords):
+            # Every occurrence of such a heading starts at a recorded keyword
+            heading_pos = self._heading_lines.find(document, heading)
+        else:
+            heading_pos = document.find(heading)
+        if heading_pos == -1:
+            return None
+        
+        content_start = document.find('\n', heading_pos)
+        if content_start == -1:
+            return None
+        
+        # The next heading is the first keyword at or after content_start
+        next_index = bisect_left(self.heading_positions, content_start)
+        if next_index < len(self.heading_positions):
+            return (content_start, self.heading_positions[next_index])
+        return (content_start, len(document))
+
+class _FenwickTree:
+    """Prefix sums over a list of non-negative counts, updated in O(log n)."""
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, values):
+        # Node i covers the counts after i & (i - 1), up to and including i
+        prefix = [0, *accumulate(values)]
+        self._tree = [0] + [prefix[index] - prefix[index & (index - 1)]
+                            for index in range(1, len(prefix))]
+
+    def add(self, index, delta):
+        """Add delta to the count at index."""
+        index += 1
+        tree = self._tree
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index):
+        """Return the sum of the counts before index."""
+        total = 0
+        tree = self._tree
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def search(self, total):
+        """Return (index, rest) for the first index whose running sum exceeds total.
+
+        rest is total less the counts before index.  index is the number of
+        counts when no running sum exceeds total.
+        """
+        tree = self._tree
+        count = len(tree) - 1
+        index = 0
+        step = 1 << count.bit_length()
+        while step:
+            if index + step <= count and tree[index + step] <= total:
+                index += step
+                total -= tree[index]
+            step >>= 1
+        return (index, total)
+
+# Characters of a heading's line that IncrementalDocument indexes it by
+_HEADING_KEY_LENGTH = 256
+# Most indexed lines a heading may start before IncrementalDocument
+# searches the text for it instead
+_HEADING_KEY_SCAN = 64
+# Most emptied blocks an edit leaves in place to keep the block count
+_SPARE_BLOCKS = 8
+
+class IncrementalDocument:
+    """An editable document that keeps its heading and date offsets up to date.
+
+    The text is held in blocks of about block_size characters, each with
+    the offsets of the heading keywords (SECTION_HEADINGS unless headings
+    is given) and of the dates that start in it.  An edit rewrites only the
+    blocks it touches and rescans only the text whose results it can
+    change: keywords overlapping the edit, and the whitespace-delimited
+    words around it, since a date depends on nothing outside its word.
+    Block lengths and per-block heading and date counts are kept in Fenwick
+    trees, and each heading is indexed by the start of its line, so
+    locating an offset, the next heading or a heading by name costs
+    O(log blocks).  An edit that keeps the number of blocks updates them in
+    place: emptied blocks are kept (a few per edit), and text that would
+    outgrow the touched blocks is spread over neighbouring ones.  Only an
+    edit that still needs new blocks rebuilds the trees.
+    find_section and extract_date match the module functions on text.
+    """
+
+    def __init__(self, text, headings=None, block_size=4096):
+        if text is None:
+            raise ValueError("Text cannot be None")
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1")
+        self.keywords = SECTION_HEADINGS if headings is None else _heading_matcher(headings).headings
+        self._matcher = _heading_matcher(self.keywords)
+        self._longest_keyword = max(map(len, self.keywords))
+        self.block_size = block_size
+        
+        self._blocks = [text[start:start + block_size]
+                        for start in range(0, len(text), block_size)] or [""]
+        self._headings = [[] for _ in self._blocks]
+        self._dates = [[] for _ in self._blocks]
+        # Per block, the line keys of its headings in offset order
+        self._heading_keys = [[] for _ in self._blocks]
+        # Line key -> ids of the key lists of the blocks holding it
+        self._key_blocks = {}
+        self._sorted_keys = []
+        self._length = len(text)
+        self._rebuild_trees()
+        self._insert_positions(self._headings, self._heading_counts, self._matcher.find_all(text))
+        self._insert_positions(self._dates, self._date_counts, _date_starts(text))
+        self._refresh_keys(0, len(self._blocks))
+
+    # Fenwick trees over the blocks
+
+    def _rebuild_trees(self):
+        """Recompute the trees and block numbers after blocks were added or removed."""
+        self._lengths = _FenwickTree([len(block) for block in self._blocks])
+        self._heading_counts = _FenwickTree([len(positions) for positions in self._headings])
+        self._date_counts = _FenwickTree([len(positions) for positions in self._dates])
+        self._block_numbers = {id(keys): index for index, keys in enumerate(self._heading_keys)}
+
+    def _locate(self, offset):
+        """Return (block index, offset within it) for a document offset."""
+        index, local = self._lengths.search(offset)
+        if index == len(self._blocks):
+            # The end of the document
+            return (index - 1, len(self._blocks[-1]))
+        return (index, local)
+
+    # Reading text across blocks
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def text(self):
+        """The whole document as one string."""
+        return "".join(self._blocks)
+
+    def _slice(self, start, end):
+        """Return text[start:end] without joining the whole document."""
+        end = min(end, self._length)
+        if start >= end:
+            return ""
+        block_index, local = self._locate(start)
+        parts = []
+        remaining = end - start
+        while remaining > 0:
+            part = self._blocks[block_index][local:local + remaining]
+            parts.append(part)
+            remaining -= len(part)
+            block_index += 1
+            local = 0
+        return "".join(parts)
+
+    def _find(self, sub, start=0):
+        """Return the lowest offset of sub at or after start, or -1."""
+        if start > self._length:
+            return -1
+        block_index, local = self._locate(start)
+        block_start = start - local
+        overlap = len(sub) - 1
+        while block_index < len(self._blocks):
+            block = self._blocks[block_index]
+            # Include enough of the next blocks for a match to straddle them
+            window = block + self._slice(block_start + len(block), block_start + len(block) + overlap)
+            pos = window.find(sub, local)
+            if pos != -1 and (pos < len(block) or block_index == len(self._blocks) - 1):
+                return block_start + pos
+            block_start += len(block)
+            block_index += 1
+            local = 0
+        return -1
+
+    def _word_start(self, offset):
+        """Return the start of the run of non-whitespace ending at offset."""
+        block_index, local = self._locate(offset)
+        while True:
+            block = self._blocks[block_index]
+            pos = local
+            while pos > 0 and not block[pos - 1].isspace():
+                pos -= 1
+            offset -= local - pos
+            if pos > 0 or block_index == 0:
+                return offset
+            block_index -= 1
+            local = len(self._blocks[block_index])
+
+    def _word_end(self, offset):
+        """Return the end of the run of non-whitespace starting at offset."""
+        if offset >= self._length:
+            return self._length
+        block_index, local = self._locate(offset)
+        while block_index < len(self._blocks):
+            block = self._blocks[block_index]
+            pos = local
+            while pos < len(block) and not block[pos].isspace():
+                pos += 1
+            offset += pos - local
+            if pos < len(block):
+                return offset
+            block_index += 1
+            local = 0
+        return offset
+
+    # Per-block offset lists
+
+    def _insert_positions(self, lists, counts, positions):
+        """Add sorted document offsets to the per-block lists."""
+        if not positions:
+            return
+        block_index, local = self._locate(positions[0])
+        block_start = positions[0] - local
+        block_end = block_start + len(self._blocks[block_index])
+        for position in positions:
+            while position >= block_end and block_index < len(self._blocks) - 1:
+                block_index += 1
+                block_start = block_end
+                block_end += len(self._blocks[block_index])
+            insort(lists[block_index], position - block_start)
+            counts.add(block_index, 1)
+
+    def _remove_positions(self, lists, counts, start, end):
+        """Drop the offsets in [start, end) from the per-block lists."""
+        if start >= end:
+            return
+        block_index, local = self._locate(start)
+        block_start = start - local
+        while block_index < len(self._blocks) and block_start < end:
+            positions = lists[block_index]
+            low = bisect_left(positions, start - block_start)
+            high = bisect_left(positions, end - block_start)
+            if high > low:
+                del positions[low:high]
+                counts.add(block_index, low - high)
+            block_start += len(self._blocks[block_index])
+            block_index += 1
+
+    def _iter_positions(self, lists, start=0):
+        """Yield the document offsets in lists at or after start, in order."""
+        block_index, local = self._locate(start)
+        block_start = start - local
+        while block_index < len(self._blocks):
+            positions = lists[block_index]
+            for position in positions[bisect_left(positions, start - block_start):]:
+                yield block_start + position
+            block_start += len(self._blocks[block_index])
+            block_index += 1
+
+    def _next_position(self, lists, counts, start):
+        """Return the first offset in lists at or after start, or -1."""
+        block_index, local = self._locate(start)
+        positions = lists[block_index]
+        index = bisect_left(positions, local)
+        if index < len(positions):
+            return start - local + positions[index]
+        # The first later block holding any offset
+        block_index, _ = counts.search(counts.prefix(block_index + 1))
+        if block_index == len(lists):
+            return -1
+        return self._lengths.prefix(block_index) + lists[block_index][0]
+
+    # Heading line keys
+
+    def _heading_key(self, position):
+        """Return the line of the heading at position, up to _HEADING_KEY_LENGTH characters."""
+        window = self._slice(position, position + _HEADING_KEY_LENGTH)
+        newline = window.find('\n')
+        return window if newline == -1 else window[:newline]
+
+    def _drop_keys(self, keys):
+        """Remove a block's heading keys from the key index and clear them."""
+        handle = id(keys)
+        for key in keys:
+            handles = self._key_blocks[key]
+            handles.remove(handle)
+            if not handles:
+                del self._key_blocks[key]
+                del self._sorted_keys[bisect_left(self._sorted_keys, key)]
+        keys.clear()
+
+    def _refresh_keys(self, first, end):
+        """Recompute the heading keys of blocks first to end - 1."""
+        block_start = self._lengths.prefix(first)
+        for block_index in range(first, end):
+            keys = self._heading_keys[block_index]
+            self._drop_keys(keys)
+            handle = id(keys)
+            block = self._blocks[block_index]
+            for position in self._headings[block_index]:
+                end = block.find('\n', position, position + _HEADING_KEY_LENGTH)
+                if end != -1:
+                    key = block[position:end]
+                elif position + _HEADING_KEY_LENGTH <= len(block):
+                    key = block[position:position + _HEADING_KEY_LENGTH]
+                else:
+                    key = self._heading_key(block_start + position)
+                keys.append(key)
+                handles = self._key_blocks.get(key)
+                if handles is None:
+                    self._key_blocks[key] = [handle]
+                    insort(self._sorted_keys, key)
+                else:
+                    handles.append(handle)
+            block_start += len(self._blocks[block_index])
+
+    def _first_keyed(self, keys, matches):
+        """Return the first heading offset whose key is in keys and satisfies matches, or -1."""
+        blocks = [self._block_numbers[handle]
+                  for key in keys for handle in self._key_blocks.get(key, ())]
+        if not blocks:
+            return -1
+        block_index = min(blocks)
+        block_start = self._lengths.prefix(block_index)
+        for position, key in zip(self._headings[block_index], self._heading_keys[block_index]):
+            if matches(key):
+                return block_start + position
+        return -1
+
+    def _find_heading(self, heading):
+        """Return the first offset of a heading that starts with a keyword, or -1."""
+        line, newline, _ = heading.partition('\n')
+        if newline:
+            if len(line) >= _HEADING_KEY_LENGTH:
+                return self._find(heading)
+            # Such a heading can only start where a whole line equals line
+            position = self._first_keyed([line], line.__eq__)
+            if position == -1 or self._slice(position, position + len(heading)) == heading:
+                return position
+            return self._find(heading, position + 1)
+        
+        if len(heading) > _HEADING_KEY_LENGTH:
+            return self._find(heading)
+        keys = self._sorted_keys
+        low = bisect_left(keys, heading)
+        high = _prefix_end(keys, heading, low)
+        if high - low > _HEADING_KEY_SCAN:
+            # Many lines start with it, so the text search ends early
+            return self._find(heading)
+        return self._first_keyed(keys[low:high], lambda key: key.startswith(heading))
+
+    # Editing
+
+    def edit(self, offset, deleted, inserted):
+        """Replace deleted characters at offset with inserted."""
+        if inserted is None:
+            raise ValueError("Inserted text cannot be None")
+        if offset < 0 or deleted < 0 or offset + deleted > self._length:
+            raise ValueError("Edit is outside the document")
+        if not deleted and not inserted:
+            return
+        
+        first, first_local = self._locate(offset)
+        if deleted:
+            last, last_local = self._locate(offset + deleted - 1)
+            last_local += 1
+        else:
+            last, last_local = first, first_local
+        
+        # Take in neighbouring blocks while the edited text would need more
+        # blocks than it touches, so the trees can still be updated in place
+        blocks = self._blocks
+        edit_first, edit_last = first, last
+        merged_length = first_local + len(inserted) + len(blocks[last]) - last_local
+        neighbours = len(inserted) // self.block_size + 2
+        while merged_length > 2 * self.block_size * (last - first + 1) and neighbours:
+            if last + 1 < len(blocks) and (not first or len(blocks[last + 1]) <= len(blocks[first - 1])):
+                last += 1
+                merged_length += len(blocks[last])
+            elif first:
+                first -= 1
+                merged_length += len(blocks[first])
+            else:
+                break
+            neighbours -= 1
+        
+        # Splice the touched blocks, keeping the offsets outside the edit
+        head = "".join(blocks[first:edit_first]) + blocks[edit_first][:first_local]
+        tail = blocks[edit_last][last_local:] + "".join(blocks[edit_last + 1:last + 1])
+        merged = head + inserted + tail
+        shift = len(head) + len(inserted) - last_local
+        kept = []
+        for lists in (self._headings, self._dates):
+            positions = []
+            block_start = 0
+            for index in range(first, edit_first):
+                positions += [block_start + position for position in lists[index]]
+                block_start += len(blocks[index])
+            positions += [block_start + position for position
+                          in lists[edit_first][:bisect_left(lists[edit_first], first_local)]]
+            positions += [position + shift for position
+                          in lists[edit_last][bisect_left(lists[edit_last], last_local):]]
+            block_start = shift + len(blocks[edit_last])
+            for index in range(edit_last + 1, last + 1):
+                positions += [block_start + position for position in lists[index]]
+                block_start += len(blocks[index])
+            kept.append(positions)
+        
+        touched = last - first + 1
+        if len(merged) > 2 * self.block_size * touched:
+            # New blocks of block_size to 2 * block_size characters
+            count = len(merged) // self.block_size
+        else:
+            # At most as many pieces as blocks touched, none over 2 * block_size
+            count = max(min(touched, len(merged) // self.block_size), 1)
+        size = -(-len(merged) // count) or 1
+        pieces = [merged[start:start + size] for start in range(0, len(merged), size)]
+        missing = touched - len(pieces)
+        if 0 < missing <= _SPARE_BLOCKS:
+            # Keep emptied blocks so the trees can be updated in place
+            pieces += [""] * missing
+        elif not pieces and touched == len(self._blocks):
+            pieces = [""]
+        
+        piece_lists = ([], [])
+        for kept_positions, new_lists in zip(kept, piece_lists):
+            piece_start = 0
+            for piece in pieces:
+                low = bisect_left(kept_positions, piece_start)
+                high = bisect_left(kept_positions, piece_start + len(piece))
+                new_lists.append([position - piece_start for position in kept_positions[low:high]])
+                piece_start += len(piece)
+        
+        old_lengths = [len(block) for block in self._blocks[first:last + 1]]
+        old_counts = [(len(headings), len(dates)) for headings, dates
+                      in zip(self._headings[first:last + 1], self._dates[first:last + 1])]
+        # The touched blocks' headings are keyed again below
+        for keys in self._heading_keys[first:last + 1]:
+            self._drop_keys(keys)
+        self._blocks[first:last + 1] = pieces
+        self._headings[first:last + 1] = piece_lists[0]
+        self._dates[first:last + 1] = piece_lists[1]
+        self._length += len(merged) - sum(old_lengths)
+        if len(pieces) == touched:
+            for index, piece in enumerate(pieces):
+                block_index = first + index
+                headings, dates = old_counts[index]
+                if len(piece) != old_lengths[index]:
+                    self._lengths.add(block_index, len(piece) - old_lengths[index])
+                if len(piece_lists[0][index]) != headings:
+                    self._heading_counts.add(block_index, len(piece_lists[0][index]) - headings)
+                if len(piece_lists[1][index]) != dates:
+                    self._date_counts.add(block_index, len(piece_lists[1][index]) - dates)
+        else:
+            self._heading_keys[first:last + 1] = [[] for _ in pieces]
+            self._rebuild_trees()
+        
+        # Keywords that overlap the edit
+        edit_end = offset + len(inserted)
+        keyword_start = max(0, offset - self._longest_keyword + 1)
+        self._remove_positions(self._headings, self._heading_counts, keyword_start, edit_end)
+        window = self._slice(keyword_start, edit_end + self._longest_keyword - 1)
+        self._insert_positions(self._headings, self._heading_counts, [
+            keyword_start + position for position in self._matcher.find_all(window)
+            if keyword_start + position < edit_end])
+        
+        # Dates in the words around the edit
+        word_start = self._word_start(offset)
+        word_end = self._word_end(edit_end)
+        self._remove_positions(self._dates, self._date_counts, word_start, word_end)
+        window = self._slice(word_start, word_end)
+        self._insert_positions(self._dates, self._date_counts,
+                               [word_start + position for position in _date_starts(window)])
+        
+        # The new blocks, the headings found above, and those whose line keys
+        # can reach into the edit
+        key_start = min(keyword_start, max(0, offset - _HEADING_KEY_LENGTH))
+        self._refresh_keys(min(first, self._locate(key_start)[0]), first + len(pieces))
+
+    # Queries
+
+    def heading_positions(self):
+        """Return the offsets of every heading keyword."""
+        return list(self._iter_positions(self._headings))
+
+    def date_positions(self):
+        """Return the offsets of every date extract_date would accept."""
+        return list(self._iter_positions(self._dates))
+
+    def extract_date(self):
+        """Return the first date, as extract_date(self.text)."""
+        position = self._next_position(self._dates, self._date_counts, 0)
+        if position == -1:
+            return ""
+        return self._slice(position, position + 10)
+
+    def find_section(self, heading):
+        """Find a section by its heading, as find_section(self.text, heading, headings)."""
+        if heading is None:
+            raise ValueError("Heading cannot be None")
+        
+        if not heading:
+            raise ValueError("Heading cannot be empty")
+        
+        if heading.startswith(self.keywords):
+            # Every occurrence of such a heading starts at a keyword
+            heading_pos = self._find_heading(heading)
+        else:
+            heading_pos = self._find(heading)
+        if heading_pos == -1:
+            return ""
+        
+        content_start = self._find("\n", heading_pos)
+        if content_start == -1:
+            return ""
+        
+        content_end = self._next_position(self._headings, self._heading_counts, content_start)
+        if content_end == -1:
+            content_end = self._length
+        return self._slice(content_start, content_end).strip()
+
+def _mapped_find(buffer, sub, start, end=None):
+    """Find sub in buffer[start:end] of a memory-mapped file, one window at a time.
+
+    The pages of each scanned window are released afterwards, so resident
+    memory does not grow with the size of the file.
+    """
+    import mmap
+    
+    if end is None:
+        end = len(buffer)
+    pos = start
+    while pos < end:
+        window_end = min(end, (pos // MMAP_WINDOW + 1) * MMAP_WINDOW)
+        # Let a match start anywhere in the window, even if it ends past it
+        found = buffer.find(sub, pos, min(end, window_end + len(sub) - 1))
+        if hasattr(mmap, "MADV_DONTNEED"):
+            page_start = pos - pos % mmap.PAGESIZE
+            buffer.madvise(mmap.MADV_DONTNEED, page_start, window_end - page_start)
+        if found != -1:
+            return found
+        pos = window_end
+    return -1
+
+def find_section_in_file(path, heading):
+    """Find a section by its heading in a UTF-8 file without reading it all.
+
+    The file is memory-mapped and searched as bytes; only the returned
+    section is decoded.  Gives the same result as find_section on the
+    decoded file contents (read without newline translation).
+    """
+    if path is None or heading is None:
+        raise ValueError("Path and heading cannot be None")
+    
+    if not heading:
+        raise ValueError("Heading cannot be empty")
+    
+    import mmap
+    
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as document:
+            # UTF-8 is self-synchronizing, so byte offsets of matches are
+            # always at character boundaries
+            heading_pos = _mapped_find(document, heading.encode("utf-8"), 0)
+            if heading_pos == -1:
+                return ""
+            
+            content_start = _mapped_find(document, b"\n", heading_pos)
+            if content_start == -1:
+                return ""
+            
+            # Later keywords only need to be searched up to the nearest one found
+            content_end = len(document)
+            for possible_heading in SECTION_HEADINGS:
+                keyword = possible_heading.encode("ascii")
+                search_end = min(len(document), content_end + len(keyword) - 1)
+                pos = _mapped_find(document, keyword, content_start, search_end)
+                if pos != -1 and pos < content_end:
+                    content_end = pos
+            
+            content = document[content_start:content_end].decode("utf-8")
+    return content.strip()
+
+@_instrumented
 def extract_client_info(text, field):
     """Extract specific client information by field name."""
     if text is None or field is None:
@@ -165,6 +1883,885 @@ def extract_client_info(text, field):
     value = text[value_start:value_end].strip()
     return value
 
+def _client_info_span(text, field_with_colon):
+    """Return the offsets of extract_client_info's value in text, or (-1, -1) if not found."""
+    field_pos = text.find(field_with_colon)
+    if field_pos == -1:
+        return (-1, -1)
+    value_start = field_pos + len(field_with_colon)
+    value_end = text.find('\n', value_start)
+    if value_end == -1:
+        value_end = len(text)
+    return _strip_span(text, value_start, value_end)
+
+class _ClientRecord(dict):
+    """The dict parse_client_record returns, with room for lookup_client_info's cache."""
+
+    __slots__ = ("shadowed",)
+
+# str[::-1] as a function
+_reverse = itemgetter(slice(None, None, -1))
+
+# Text between two colons of the same line
+_MID_LINE_SEGMENTS = re.compile(r"(?<=:)[^:\n]*(?=:)").findall
+
+def _shadowed_fields(text, record):
+    """Return the fields of record whose first "field:" in text does not start a line.
+
+    A field holds no colon or newline, so "field:" can only match away
+    from a line start at the end of a longer field or of the text between
+    two colons of a line.  Only those fields are searched for.
+    """
+    candidates = set()
+    # A reversed field is a prefix of another one exactly when it is a
+    # prefix of the one sorted right after it
+    ends = sorted(map(_reverse, record))
+    if any(map(str.startswith, ends[1:], ends)):
+        candidates.update(_reverse(shorter) for shorter, longer in zip(ends, ends[1:])
+                          if longer.startswith(shorter))
+    # Without repeated fields or values holding colons, every colon ends a field
+    if text.count(':') > len(record):
+        lengths = {len(field) for field in record}
+        for segment in _MID_LINE_SEGMENTS(text):
+            candidates.update(segment[-length:] for length in lengths if segment[-length:] in record)
+    
+    shadowed = set()
+    for field in candidates:
+        field_pos = text.find(f"{field}:")
+        if field_pos != 0 and text[field_pos - 1] != '\n':
+            shadowed.add(field)
+    return shadowed
+
+def parse_client_record(text):
+    """Parse every "Field: value" line of a client record in one pass.
+
+    Returns a dict mapping each field (the text before the first colon of
+    a line) to its stripped value; the first line wins for repeated fields.
+    """
+    if text is None:
+        raise ValueError("Text cannot be None")
+    
+    record = _ClientRecord()
+    for line in text.split('\n'):
+        field, colon, value = line.partition(':')
+        if colon and field and field not in record:
+            record[field] = value.strip()
+    return record
+
+def lookup_client_info(text, field, record):
+    """Look up a field in a record from parse_client_record(text).
+
+    Returns exactly what extract_client_info(text, field) returns.  That
+    function matches "field:" anywhere in the text, so the parsed value is
+    used only when the first match starts a line; otherwise the text is
+    searched as extract_client_info does.  Which fields match first
+    elsewhere is worked out on the first lookup in a record and kept with it.
+    """
+    if text is None or field is None:
+        raise ValueError("Text and field cannot be None")
+    
+    if not field:
+        raise ValueError("Field cannot be empty")
+    
+    value = record.get(field)
+    if value is not None:
+        if isinstance(record, _ClientRecord):
+            try:
+                shadowed = record.shadowed
+            except AttributeError:
+                shadowed = record.shadowed = _shadowed_fields(text, record)
+            if field not in shadowed:
+                return value
+        else:
+            field_pos = text.find(f"{field}:")
+            if field_pos == 0 or text[field_pos - 1] == '\n':
+                return value
+    return extract_client_info(text, field)
+
+def extract_client_info_compact(texts, field):
+    """Return extract_client_info(text, field) for each text in a SpanResults."""
+    if field is None:
+        raise ValueError("Field cannot be None")
+    
+    if not field:
+        raise ValueError("Field cannot be empty")
+    
+    field_with_colon = f"{field}:"
+    results = SpanResults()
+    for text in texts:
+        if text is None:
+            raise ValueError("Text cannot be None")
+        results.append(text, *_client_info_span(text, field_with_colon))
+    return results
+
+class _SortedKeys:
+    """Distinct keys in sorted order, kept in blocks.
+
+    Adding or removing a key moves only the keys of one block, so updates
+    cost O(sqrt n) instead of the O(n) of one sorted list.
+    """
+
+    __slots__ = ("_blocks", "_maxes")
+
+    BLOCK_SIZE = 1000
+
+    def __init__(self, keys=()):
+        keys = sorted(keys)
+        self._blocks = [keys[start:start + self.BLOCK_SIZE] for start in range(0, len(keys), self.BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+
+    def add(self, key):
+        """Add a key that is not present."""
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        index = min(bisect_left(self._maxes, key), len(self._blocks) - 1)
+        block = self._blocks[index]
+        insort(block, key)
+        self._maxes[index] = block[-1]
+        if len(block) > 2 * self.BLOCK_SIZE:
+            self._blocks[index:index + 1] = [block[:self.BLOCK_SIZE], block[self.BLOCK_SIZE:]]
+            self._maxes[index:index + 1] = [block[self.BLOCK_SIZE - 1], block[-1]]
+
+    def remove(self, key):
+        """Remove a key that is present."""
+        index = bisect_left(self._maxes, key)
+        block = self._blocks[index]
+        del block[bisect_left(block, key)]
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+
+    def irange(self, low, high):
+        """Yield the keys from low to high inclusive, in order."""
+        blocks = self._blocks
+        index = bisect_left(self._maxes, low)
+        if index == len(blocks):
+            return
+        position = bisect_left(blocks[index], low)
+        while index < len(blocks):
+            block = blocks[index]
+            end = bisect_right(block, high)
+            yield from block[position:end]
+            if end < len(block):
+                return
+            index += 1
+            position = 0
+
+    def __len__(self):
+        return sum(map(len, self._blocks))
+
+class ClientRecordIndex:
+    """Exact, prefix and date-range search over "Field: value" client records.
+
+    Records are parsed with parse_client_record and each indexed field keeps
+    a dict from value to record ids and its distinct values in sorted order,
+    so queries take O(log n) plus the size of the answer.  Values that are
+    YYYY-MM-DD calendar dates are also kept in a date index per field.
+    fields limits indexing to the given fields; by default every field is
+    indexed.  Records can be added and removed at any time.
+    """
+
+    __slots__ = ("fields", "_records", "_values", "_sorted", "_dates")
+
+    def __init__(self, records=(), fields=None):
+        if isinstance(fields, str):
+            raise ValueError("Fields must be a collection of field names")
+        self.fields = None if fields is None else frozenset(fields)
+        # record id -> field, value, field, value, ... of its indexed fields
+        self._records = {}
+        # field -> {value: record id, or a list of them when shared}
+        self._values = {}
+        # field -> _SortedKeys of its values, and of its date values
+        self._sorted = {}
+        self._dates = {}
+        self.add_many(records)
+
+    def _indexed(self, text):
+        """Return the (field, value) pairs of text to index, as one flat tuple."""
+        record = parse_client_record(text)
+        intern = sys.intern
+        fields = self.fields
+        # Interned so that each field name is stored once, not once per record
+        return tuple(item for field, value in record.items() if fields is None or field in fields
+                     for item in (intern(field), value))
+
+    def add(self, record_id, text):
+        """Index the record text under record_id, replacing any record with that id."""
+        if record_id is None or text is None:
+            raise ValueError("Record id and text cannot be None")
+        
+        record = self._indexed(text)
+        if record_id in self._records:
+            self.remove(record_id)
+        self._records[record_id] = record
+        for field, value in zip(record[::2], record[1::2]):
+            values = self._values.get(field)
+            if values is None:
+                values = self._values[field] = {}
+                self._sorted[field] = _SortedKeys()
+                self._dates[field] = _SortedKeys()
+            ids = values.get(value)
+            if ids is None:
+                values[value] = record_id
+                self._sorted[field].add(value)
+                if _is_calendar_date(value):
+                    self._dates[field].add(value)
+            elif type(ids) is list:
+                ids.append(record_id)
+            else:
+                values[value] = [ids, record_id]
+
+    def add_many(self, records):
+        """Index every (record_id, text) pair; return how many were added.
+
+        Into an empty index, the sorted values are built with one sort per
+        field instead of one insertion per value.
+        """
+        if self._records:
+            count = 0
+            for record_id, text in records:
+                self.add(record_id, text)
+                count += 1
+            return count
+        
+        count = 0
+        try:
+            for record_id, text in records:
+                if record_id is None or text is None:
+                    raise ValueError("Record id and text cannot be None")
+                if record_id in self._records:
+                    self._remove_values(record_id)
+                record = self._records[record_id] = self._indexed(text)
+                for field, value in zip(record[::2], record[1::2]):
+                    values = self._values.get(field)
+                    if values is None:
+                        values = self._values[field] = {}
+                    ids = values.get(value)
+                    if ids is None:
+                        values[value] = record_id
+                    elif type(ids) is list:
+                        ids.append(record_id)
+                    else:
+                        values[value] = [ids, record_id]
+                count += 1
+        finally:
+            # Also on error, so the records added so far stay searchable
+            for field, values in self._values.items():
+                self._sorted[field] = _SortedKeys(values)
+                self._dates[field] = _SortedKeys(filter(_is_calendar_date, values))
+        return count
+
+    def _remove_values(self, record_id):
+        """Drop record_id from the value dicts; return the values left without records."""
+        emptied = []
+        record = self._records.pop(record_id)
+        for field, value in zip(record[::2], record[1::2]):
+            values = self._values[field]
+            ids = values[value]
+            if type(ids) is list:
+                ids.remove(record_id)
+                if len(ids) == 1:
+                    values[value] = ids[0]
+            else:
+                del values[value]
+                emptied.append((field, value))
+        return emptied
+
+    def remove(self, record_id):
+        """Remove the record indexed under record_id."""
+        if record_id not in self._records:
+            raise ValueError(f"Unknown record id: {record_id!r}")
+        
+        for field, value in self._remove_values(record_id):
+            self._sorted[field].remove(value)
+            if _is_calendar_date(value):
+                self._dates[field].remove(value)
+
+    def _ids(self, field, values):
+        """Return the record ids of the given values of field, in value order."""
+        ids = []
+        lookup = self._values[field]
+        for value in values:
+            entry = lookup[value]
+            if type(entry) is list:
+                ids.extend(entry)
+            else:
+                ids.append(entry)
+        return ids
+
+    def find(self, field, value):
+        """Return the ids of the records whose field equals value, in order added."""
+        if field is None or value is None:
+            raise ValueError("Field and value cannot be None")
+        
+        entry = self._values.get(field, {}).get(value)
+        if entry is None:
+            return []
+        return list(entry) if type(entry) is list else [entry]
+
+    def find_prefix(self, field, prefix):
+        """Return the ids of the records whose field starts with prefix, by value."""
+        if field is None or prefix is None:
+            raise ValueError("Field and prefix cannot be None")
+        
+        if field not in self._sorted:
+            return []
+        # Every string starting with prefix sorts between these two
+        return self._ids(field, self._sorted[field].irange(prefix, prefix + "\U0010ffff"))
+
+    def find_dates(self, field, since=None, until=None):
+        """Return the ids of the records whose field is a date from since to until, by date.
+
+        since and until are inclusive YYYY-MM-DD strings or datetime.date
+        objects; either may be None for an open range.
+        """
+        if field is None:
+            raise ValueError("Field cannot be None")
+        
+        since = _date_bound(since, "0000-00-00")
+        until = _date_bound(until, "9999-99-99")
+        if field not in self._dates:
+            return []
+        return self._ids(field, self._dates[field].irange(since, until))
+
+    def record(self, record_id):
+        """Return the indexed {field: value} of record_id."""
+        if record_id not in self._records:
+            raise ValueError(f"Unknown record id: {record_id!r}")
+        record = self._records[record_id]
+        return dict(zip(record[::2], record[1::2]))
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, record_id):
+        return record_id in self._records
+
+@lru_cache(maxsize=64)
+def _bytes_search(sub):
+    """Return the search method of a compiled pattern matching sub literally."""
+    return re.compile(re.escape(sub)).search
+
+def _buffer_find(data, sub, start=0):
+    """Return the lowest offset of sub in data[start:], or -1.
+
+    Uses the buffer's own find when it has one (bytes, bytearray, mmap);
+    memoryview has none, so the regex engine searches it in place.
+    """
+    find = getattr(data, "find", None)
+    if find is not None:
+        return find(sub, start)
+    match = _bytes_search(sub)(data, start)
+    return match.start() if match else -1
+
+def _char_before(data, pos):
+    """Return the offset of the UTF-8 character that ends at pos."""
+    pos -= 1
+    while pos > 0 and data[pos] & 0xC0 == 0x80:
+        pos -= 1
+    return pos
+
+def _char_after(data, pos):
+    """Return the offset just past the UTF-8 character that starts at pos."""
+    lead = data[pos]
+    return pos + (1 if lead < 0xC0 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4)
+
+# First '-' of a possible YYYY-MM-DD date in UTF-8, whose middle two
+# characters take two to eight bytes
+_DATE_DASHES_BYTES = re.compile(rb"-(?=.{2,8}-)", re.DOTALL)
+_DATE_PUNCTUATION_BYTES = DATE_PUNCTUATION.encode("ascii")
+
+def _date_at_dash(data, dash):
+    """Return (date_start, date_end) if extract_date would accept the word at dash."""
+    date_start = dash
+    for _ in range(4):
+        if date_start == 0:
+            return None
+        date_start = _char_before(data, date_start)
+    date_end = dash + 1
+    for _ in range(5):
+        if date_end >= len(data):
+            return None
+        date_end = _char_after(data, date_end)
+    if not _is_date(str(data[date_start:date_end], "utf-8")):
+        return None
+    
+    # Only punctuation may sit between the date and whitespace or the ends
+    word_start = date_start
+    while word_start > 0 and data[word_start - 1] in _DATE_PUNCTUATION_BYTES:
+        word_start -= 1
+    if word_start > 0:
+        before = _char_before(data, word_start)
+        if not str(data[before:word_start], "utf-8").isspace():
+            return None
+    word_end = date_end
+    while word_end < len(data) and data[word_end] in _DATE_PUNCTUATION_BYTES:
+        word_end += 1
+    if word_end < len(data):
+        after = _char_after(data, word_end)
+        if not str(data[word_end:after], "utf-8").isspace():
+            return None
+    return (date_start, date_end)
+
+def extract_date_bytes(data):
+    """Extract a date in YYYY-MM-DD format from UTF-8 bytes, as extract_date does.
+
+    data may be bytes, bytearray, memoryview or mmap; only the characters
+    around each '-' are decoded, never the whole buffer.
+    """
+    if data is None:
+        raise ValueError("Text cannot be None")
+    
+    for match in _DATE_DASHES_BYTES.finditer(data):
+        span = _date_at_dash(data, match.start())
+        if span is not None:
+            return str(data[span[0]:span[1]], "utf-8")
+    return ""
+
+def extract_client_info_bytes(data, field):
+    """Extract client information from UTF-8 bytes, as extract_client_info does.
+
+    Only the value of the field is decoded.
+    """
+    if data is None or field is None:
+        raise ValueError("Text and field cannot be None")
+    
+    if not field:
+        raise ValueError("Field cannot be empty")
+    
+    # UTF-8 is self-synchronizing, so byte matches fall on character boundaries
+    field_with_colon = f"{field}:".encode("utf-8")
+    field_pos = _buffer_find(data, field_with_colon)
+    if field_pos == -1:
+        return ""
+    
+    value_start = field_pos + len(field_with_colon)
+    value_end = _buffer_find(data, b"\n", value_start)
+    if value_end == -1:
+        value_end = len(data)
+    return str(data[value_start:value_end], "utf-8").strip()
+
+def find_section_bytes(document, heading):
+    """Find a section in UTF-8 bytes by its heading, as find_section does.
+
+    Only the section content is decoded.
+    """
+    if document is None or heading is None:
+        raise ValueError("Document and heading cannot be None")
+    
+    if not heading:
+        raise ValueError("Heading cannot be empty")
+    
+    heading_pos = _buffer_find(document, heading.encode("utf-8"))
+    if heading_pos == -1:
+        return ""
+    
+    content_start = _buffer_find(document, b"\n", heading_pos)
+    if content_start == -1:
+        return ""
+    
+    content_end = len(document)
+    for possible_heading in SECTION_HEADINGS:
+        pos = _buffer_find(document, possible_heading.encode("ascii"), content_start)
+        if pos != -1 and pos < content_end:
+            content_end = pos
+    
+    return str(document[content_start:content_end], "utf-8").strip()
+
+class LegalStringProcessor:
+    """The five extractors with their configuration prepared once.
+
+    separators are the words between the parties of a case name, tried in
+    order ("v." and "vs." by default, e.g. ("v.", "vs.", "versus")), and
+    headings the keywords that end a section (SECTION_HEADINGS by default).
+    Instances are immutable and hold no per-call state, so one can be shared
+    by any number of threads.  With the defaults every method returns what
+    the module function of the same name returns.
+    """
+
+    __slots__ = ("separators", "headings", "_separators", "_joins", "_matcher", "_default_headings")
+
+    def __init__(self, separators=("v.", "vs."), headings=SECTION_HEADINGS):
+        if separators is None or isinstance(separators, str):
+            raise ValueError("Separators must be a sequence of strings")
+        separators = tuple(separators)
+        if not separators or not all(isinstance(word, str) and word.strip() for word in separators):
+            raise ValueError("Separators must be non-empty strings")
+        matcher = _heading_matcher(headings)
+        
+        set_attribute = object.__setattr__
+        set_attribute(self, "separators", separators)
+        set_attribute(self, "headings", matcher.headings)
+        # Separators as they appear in a case name, with the spaces around them
+        set_attribute(self, "_separators", tuple(f" {word.strip()} " for word in separators))
+        # Each separator with the party affixes that can misplace it
+        set_attribute(self, "_joins", tuple(
+            (separator, *_misjoin_affixes(separator, self._separators[:index]))
+            for index, separator in enumerate(self._separators)))
+        set_attribute(self, "_matcher", matcher)
+        set_attribute(self, "_default_headings", matcher.headings == SECTION_HEADINGS)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LegalStringProcessor is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("LegalStringProcessor is immutable")
+
+    def __repr__(self):
+        return f"LegalStringProcessor(separators={self.separators!r}, headings={self.headings!r})"
+
+    @_instrumented
+    def extract_case_name(self, citation):
+        """Extract the case name from a case citation."""
+        if citation is None:
+            raise ValueError("Citation cannot be None")
+        
+        for separator in self._separators:
+            plaintiff, found, rest = citation.partition(separator)
+            if found:
+                break
+        else:
+            comma_pos = citation.find(',')
+            if comma_pos == -1:
+                return citation
+            return citation[:comma_pos].strip()
+        
+        defendant = rest.partition(separator)[0].partition(',')[0].strip()
+        return f"{plaintiff.strip()}{separator}{defendant}"
+
+    @_instrumented
+    def extract_parties(self, case_name):
+        """Extract plaintiff and defendant from a case name."""
+        if case_name is None:
+            raise ValueError("Case name cannot be None")
+        
+        for separator in self._separators:
+            if separator in case_name:
+                parties = case_name.split(separator)
+                if len(parties) == 2:
+                    return (parties[0].strip(), parties[1].strip())
+                break
+        return (case_name, "")
+
+    def extract_date(self, text):
+        """Extract a date in YYYY-MM-DD format from text."""
+        return extract_date(text)
+
+    def find_section(self, document, heading):
+        """Find a section in a document by its heading."""
+        if self._default_headings:
+            return find_section(document, heading)
+        return find_section(document, heading, self._matcher)
+
+    def extract_client_info(self, text, field):
+        """Extract specific client information by field name."""
+        return extract_client_info(text, field)
+
+    def extract_case_names_batch(self, citations):
+        """Return (case_name, (plaintiff, defendant)) for each citation."""
+        joins = self._joins
+        extract_parties = self.extract_parties
+        results = []
+        append = results.append
+        for citation in citations:
+            if citation is None:
+                raise ValueError("Citation cannot be None")
+            
+            # partition() scans once and builds a 3-tuple instead of a list
+            for separator, tails, heads in joins:
+                plaintiff, found, rest = citation.partition(separator)
+                if found:
+                    break
+            else:
+                comma_pos = citation.find(',')
+                case_name = citation if comma_pos == -1 else citation[:comma_pos].strip()
+                append((case_name, (case_name, "")))
+                continue
+            
+            plaintiff = plaintiff.strip()
+            defendant = rest.partition(separator)[0].partition(',')[0].strip()
+            case_name = f"{plaintiff}{separator}{defendant}"
+            # Rebuilding can put a separator across the party boundary; the
+            # parties then come from splitting the case name
+            if plaintiff.endswith(tails) or defendant.startswith(heads):
+                append((case_name, extract_parties(case_name)))
+            else:
+                append((case_name, (plaintiff, defendant)))
+        return results
+
+    def extract_parties_batch(self, case_names):
+        """Return extract_parties(case_name) for each case name."""
+        extract = self.extract_parties
+        return [extract(case_name) for case_name in case_names]
+
+    def extract_dates_batch(self, texts):
+        """Return extract_date(text) for each text."""
+        return [extract_date(text) for text in texts]
+
+    def find_sections_batch(self, document, headings):
+        """Return find_section(document, heading) for each heading."""
+        find = self.find_section
+        return [find(document, heading) for heading in headings]
+
+    def extract_client_info_batch(self, texts, field):
+        """Return extract_client_info(text, field) for each text."""
+        if field is None:
+            raise ValueError("Text and field cannot be None")
+        
+        if not field:
+            raise ValueError("Field cannot be empty")
+        
+        return [extract_client_info(text, field) for text in texts]
+
+# Shared processor with the default configuration
+DEFAULT_PROCESSOR = LegalStringProcessor()
+
+# Words accepted between the parties when grouping citations by case
+CITATION_SEPARATORS = ("v.", "vs.", "v", "vs", "versus")
+_CITATION_PROCESSOR = LegalStringProcessor(separators=CITATION_SEPARATORS)
+
+def _case_key(citation):
+    """canonical_case_key without the interning."""
+    text = citation.casefold().strip(" ")
+    # Other whitespace than single spaces is rare, so only then split and join
+    if "  " in text or not text.isprintable():
+        text = " ".join(text.split())
+    case_name = _CITATION_PROCESSOR.extract_case_name(text)
+    plaintiff, defendant = _CITATION_PROCESSOR.extract_parties(case_name)
+    if not defendant:
+        return case_name
+    return f"{plaintiff} v. {defendant}"
+
+def canonical_case_key(citation):
+    """Return the key under which CitationIndex groups a citation or case name.
+
+    The citation is casefolded, runs of whitespace become one space and the
+    parties are joined by " v. " whatever separator the citation used, so
+    "Smith vs. JONES, 1 F.3d 2" and "SMITH  V.\\nJones" share the key
+    "smith v. jones".  Keys are interned.
+    """
+    if citation is None:
+        raise ValueError("Citation cannot be None")
+    return sys.intern(_case_key(citation))
+
+class CitationIndex:
+    """Occurrences of case citations across a corpus, grouped by case.
+
+    Each occurrence is a (doc_id, citation, offset) triple, where offset is
+    where the citation starts in document doc_id.  Citations are grouped
+    under canonical_case_key, so case, whitespace and separator variants
+    count as the same case.  The postings of a case are (document number,
+    offset) pairs in one flat array, 16 bytes per occurrence, and document
+    ids are stored once.  Queries take a citation or case name in any of
+    its variant forms.
+    """
+
+    __slots__ = ("_keys", "_names", "_postings", "_documents", "_document_ids")
+
+    def __init__(self, occurrences=()):
+        # canonical key -> case number
+        self._keys = {}
+        # Per case number: canonical key, and document number, offset pairs
+        self._names = []
+        self._postings = []
+        # doc_id -> document number, and document number -> doc_id
+        self._documents = {}
+        self._document_ids = []
+        self.add_many(occurrences)
+
+    def add(self, doc_id, citation, offset=0):
+        """Record that document doc_id cites citation at offset."""
+        if doc_id is None:
+            raise ValueError("Document id cannot be None")
+        if offset < 0:
+            raise ValueError("Offset cannot be negative")
+        
+        if citation is None:
+            raise ValueError("Citation cannot be None")
+        
+        key = _case_key(citation)
+        number = self._keys.get(key)
+        if number is None:
+            key = sys.intern(key)
+            number = self._keys[key] = len(self._names)
+            self._names.append(key)
+            self._postings.append(array("q"))
+        document = self._documents.get(doc_id)
+        if document is None:
+            document = self._documents[doc_id] = len(self._document_ids)
+            self._document_ids.append(doc_id)
+        self._postings[number].extend((document, offset))
+
+    def add_many(self, occurrences):
+        """Add every (doc_id, citation, offset) triple; return how many were added."""
+        count = 0
+        for doc_id, citation, offset in occurrences:
+            self.add(doc_id, citation, offset)
+            count += 1
+        return count
+
+    def _case_postings(self, citation):
+        number = self._keys.get(canonical_case_key(citation))
+        return array("q") if number is None else self._postings[number]
+
+    def count(self, citation):
+        """Return how many times the case of citation is cited."""
+        return len(self._case_postings(citation)) // 2
+
+    def documents_citing(self, citation):
+        """Return the ids of the documents citing the case of citation, in order added."""
+        document_ids = self._document_ids
+        return [document_ids[document] for document in dict.fromkeys(self._case_postings(citation)[::2])]
+
+    def occurrences(self, citation):
+        """Return the (doc_id, offset) pairs of every citation of the case of citation."""
+        postings = self._case_postings(citation)
+        document_ids = self._document_ids
+        return [(document_ids[document], offset) for document, offset in zip(postings[::2], postings[1::2])]
+
+    def most_common(self, n=None):
+        """Return (canonical key, count) for the n most cited cases, most cited first.
+
+        All cases are returned when n is None; ties keep the order in which
+        the cases were first cited.
+        """
+        postings = self._postings
+        if n is None:
+            numbers = sorted(range(len(postings)), key=lambda number: -len(postings[number]))
+        else:
+            numbers = heapq.nsmallest(n, range(len(postings)), key=lambda number: -len(postings[number]))
+        return [(self._names[number], len(postings[number]) // 2) for number in numbers]
+
+    def keys(self):
+        """Return the canonical key of every case, in the order first cited."""
+        return list(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, citation):
+        return canonical_case_key(citation) in self._keys
+
+# Extractors that instrumentation times
+INSTRUMENTED_FUNCTIONS = ("extract_case_name", "extract_parties", "extract_date",
+                          "find_section", "extract_client_info")
+
+class Instrumentation:
+    """Call counts, latencies and input sizes collected from the extractors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard everything collected so far."""
+        with self._lock:
+            self._calls = {name: 0 for name in INSTRUMENTED_FUNCTIONS}
+            self._errors = {name: 0 for name in INSTRUMENTED_FUNCTIONS}
+            self._latencies = {name: array('d') for name in INSTRUMENTED_FUNCTIONS}
+            self._sizes = {name: {} for name in INSTRUMENTED_FUNCTIONS}
+
+    def record(self, name, seconds, size, failed=False):
+        """Record one call of an extractor with the length of its input."""
+        # Input sizes are counted in power-of-two buckets: 0, 1, 2, 4, 8, ...
+        bucket = 1 << (size - 1).bit_length() if size > 0 else 0
+        with self._lock:
+            self._calls[name] += 1
+            if failed:
+                self._errors[name] += 1
+            self._latencies[name].append(seconds)
+            sizes = self._sizes[name]
+            sizes[bucket] = sizes.get(bucket, 0) + 1
+
+    def snapshot(self):
+        """Return the collected statistics as a JSON-serializable dict.
+
+        Latencies are in seconds; input_sizes maps the upper bound of each
+        power-of-two size bucket to a call count.
+        """
+        with self._lock:
+            result = {}
+            for name in INSTRUMENTED_FUNCTIONS:
+                latencies = sorted(self._latencies[name])
+                calls = self._calls[name]
+                total = sum(latencies)
+                result[name] = {
+                    "calls": calls,
+                    "errors": self._errors[name],
+                    "total_seconds": total,
+                    "mean_seconds": total / calls if calls else 0.0,
+                    "p50_seconds": _percentile(latencies, 50),
+                    "p90_seconds": _percentile(latencies, 90),
+                    "p99_seconds": _percentile(latencies, 99),
+                    "max_seconds": latencies[-1] if latencies else 0.0,
+                    "input_sizes": {str(bucket): count
+                                    for bucket, count in sorted(self._sizes[name].items())},
+                }
+            return result
+
+    def to_json(self, **kwargs):
+        """Return snapshot() serialized as JSON."""
+        import json
+        return json.dumps(self.snapshot(), **kwargs)
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+def enable_instrumentation(instrumentation=None):
+    """Start timing the extractors and return the collecting Instrumentation.
+
+    Every call of the five extractors in the current thread or asyncio task
+    is recorded, however the caller imported them, including through
+    LegalStringProcessor methods.  Other threads collect separately.
+    """
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    previous = _active_instrumentation.get()
+    _active_instrumentation.set(instrumentation)
+    if previous is None:
+        _count_instrumentation_user(1)
+    return instrumentation
+
+def disable_instrumentation():
+    """Stop timing the extractors in the current thread or task."""
+    if _active_instrumentation.get() is not None:
+        _active_instrumentation.set(None)
+        _count_instrumentation_user(-1)
+
+def get_instrumentation():
+    """Return the active Instrumentation, or None when disabled."""
+    return _active_instrumentation.get()
+
+@contextmanager
+def instrumented():
+    """Collect extractor statistics for the duration of a with block.
+
+    Yields a fresh Instrumentation; whatever was active before is restored
+    afterwards, so blocks can be nested to attribute costs per job.  Calls
+    made inside a nested block are recorded only by that block, and jobs
+    running in other threads are not recorded at all.
+    """
+    instrumentation = Instrumentation()
+    previous = _active_instrumentation.get()
+    token = _active_instrumentation.set(instrumentation)
+    if previous is None:
+        _count_instrumentation_user(1)
+    try:
+        yield instrumentation
+    finally:
+        active = _active_instrumentation.get()
+        _active_instrumentation.reset(token)
+        if active is not None and previous is None:
+            _count_instrumentation_user(-1)
+
 def display_result(original, operation, result):
     """Display the result of a string operation."""
     print(f"\nString Operation: {operation}")
@@ -279,5 +2876,127 @@ def main():
         else:
             print("Invalid choice. Please try again.")
 
+# Operations of the command-line interface, matching menu choices 1-5
+CLI_OPERATIONS = ("case", "client", "section", "date", "string")
+STRING_OPERATIONS = ("slice", "upper", "lower", "title", "find", "replace")
+
+def _cli_result(op, text, args):
+    """Run one command-line operation on a record's text."""
+    if op == "case":
+        case_name = extract_case_name(text)
+        plaintiff, defendant = extract_parties(case_name)
+        return {"case_name": case_name, "plaintiff": plaintiff, "defendant": defendant}
+    if op == "client":
+        return extract_client_info(text, args.field)
+    if op == "section":
+        return find_section(text, args.heading)
+    if op == "date":
+        return extract_date(text)
+    
+    if text is None:
+        raise ValueError("Text cannot be None")
+    string_op = args.string_op
+    if string_op == "slice":
+        return text[args.start:args.end]
+    if string_op == "upper":
+        return text.upper()
+    if string_op == "lower":
+        return text.lower()
+    if string_op == "title":
+        return text.title()
+    if string_op == "find":
+        return text.find(args.substring)
+    return text.replace(args.old, args.new)
+
+def _iter_cli_records(lines, input_format):
+    """Yield (record_id, text, error) for each input line."""
+    import json
+    
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\n')
+        if input_format == "text":
+            yield (line_number, line, None)
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield (line_number, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield (line_number, None, "Invalid JSON: expected an object")
+            continue
+        record_id = record.get("id", line_number)
+        text = record.get("text")
+        if text is not None and not isinstance(text, str):
+            yield (record_id, None, f"Text must be a string, not {type(text).__name__}")
+            continue
+        yield (record_id, text, None)
+
+def cli(argv=None):
+    """Command-line entry point for non-interactive batch processing.
+
+    Reads JSONL records ({"id": ..., "text": ...}) or plain text lines from
+    a file or stdin and writes one JSON result per record, line by line.
+    """
+    import argparse
+    import json
+    
+    parser = argparse.ArgumentParser(
+        prog="python -m legal_string_processor",
+        description="Run a legal string operation over records, one per line.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    extract = subparsers.add_parser("extract", help="run an operation on every record")
+    extract.add_argument("--op", required=True, choices=CLI_OPERATIONS,
+                         help="case (1), client (2), section (3), date (4) or string (5)")
+    extract.add_argument("--in", dest="input", default="-", help="input file, or - for stdin")
+    extract.add_argument("--out", dest="output", default="-", help="output file, or - for stdout")
+    extract.add_argument("--format", choices=("jsonl", "text"), default="jsonl",
+                         help="jsonl records or one plain-text record per line")
+    extract.add_argument("--field", help="client information field (client)")
+    extract.add_argument("--heading", help="section heading (section)")
+    extract.add_argument("--string-op", choices=STRING_OPERATIONS, help="string operation (string)")
+    extract.add_argument("--start", type=int, help="slice start index (string slice)")
+    extract.add_argument("--end", type=int, help="slice end index (string slice)")
+    extract.add_argument("--substring", help="text to find (string find)")
+    extract.add_argument("--old", help="text to replace (string replace)")
+    extract.add_argument("--new", help="replacement text (string replace)")
+    args = parser.parse_args(argv)
+    
+    if args.op == "client" and args.field is None:
+        parser.error("--field is required for --op client")
+    if args.op == "section" and args.heading is None:
+        parser.error("--heading is required for --op section")
+    if args.op == "string":
+        if args.string_op is None:
+            parser.error("--string-op is required for --op string")
+        if args.string_op == "find" and args.substring is None:
+            parser.error("--substring is required for --string-op find")
+        if args.string_op == "replace" and (args.old is None or args.new is None):
+            parser.error("--old and --new are required for --string-op replace")
+    
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for record_id, text, error in _iter_cli_records(source, args.format):
+            if error is None:
+                try:
+                    output = {"id": record_id, "result": _cli_result(args.op, text, args)}
+                except ValueError as e:
+                    output = {"id": record_id, "error": str(e)}
+            else:
+                output = {"id": record_id, "error": error}
+            out.write(json.dumps(output, ensure_ascii=False))
+            out.write("\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli())
     main()
\ No newline at end of file
@@ -0,0 +1,215 @@
+"""
+Result Cache
+Persistent cache of corpus_runner results keyed by a hash of each
+document's content, so a job re-run over a mostly unchanged archive only
+processes the documents that changed.
+
+Entries are spread over several SQLite files (shards) by key.  Each shard
+evicts its least recently used entries once its results take more than
+its share of max_bytes.  The cache records the extractor version it was
+filled with and empties itself when opened by another version.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+import corpus_runner
+import legal_string_processor
+
+DEFAULT_SHARDS = 16
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Results whose JSON is longer than this are stored zlib-compressed; below
+# it compression costs more time than it saves space
+COMPRESS_THRESHOLD = 4096
+
+# Part of the version, to be bumped when the stored format changes
+CACHE_FORMAT = 1
+
+def extractor_version():
+    """Return a hash of the code that produces cached results.
+
+    Any change to legal_string_processor or corpus_runner gives a new
+    version, which invalidates existing caches.
+    """
+    digest = hashlib.blake2b(str(CACHE_FORMAT).encode("ascii"), digest_size=16)
+    for module in (legal_string_processor, corpus_runner):
+        with open(module.__file__, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+class ResultCache:
+    """Sharded on-disk cache of process_document results.
+
+    Use as a context manager, or call close() to write the last entries.
+    hits, misses and seconds_saved count the lookups of this instance;
+    seconds_saved is the processing time the hits originally took.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, shards=DEFAULT_SHARDS, version=None):
+        if directory is None:
+            raise ValueError("Directory cannot be None")
+        if max_bytes < 1 or shards < 1 or shards > 256:
+            raise ValueError("Max bytes must be at least 1 and shards between 1 and 256")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = extractor_version() if version is None else version
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+        self._shard_limit = max_bytes // shards
+        self._clock = time.time_ns()
+        os.makedirs(directory, exist_ok=True)
+        self._shards = [self._open_shard(os.path.join(directory, f"shard-{number:03d}.sqlite"))
+                        for number in range(shards)]
+        self._sizes = [connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                       for connection in self._shards]
+
+    def _open_shard(self, path):
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        connection.execute("CREATE TABLE IF NOT EXISTS entries (key BLOB PRIMARY KEY, value BLOB, "
+                           "size INTEGER, seconds REAL, used INTEGER)")
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+        row = connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is None or row[0] != self.version:
+            connection.execute("DELETE FROM entries")
+            connection.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+        connection.commit()
+        return connection
+
+    def _shard(self, key):
+        return key[0] % len(self._shards)
+
+    def _tick(self):
+        # Strictly increasing use stamps, so eviction order is stable
+        self._clock = max(self._clock + 1, time.time_ns())
+        return self._clock
+
+    @staticmethod
+    def key(text, ops=corpus_runner.OPERATIONS, heading="SECTION", fields=corpus_runner.DEFAULT_FIELDS):
+        """Return the cache key of text processed with these options, or None for no text."""
+        if not isinstance(text, str):
+            return None
+        # SHA-256 is hardware accelerated on most CPUs, several times faster
+        # than BLAKE2 on long documents
+        digest = hashlib.sha256(json.dumps([list(ops), heading, list(fields)]).encode("utf-8"))
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.digest()[:16]
+
+    def get_many(self, keys):
+        """Return {key: result without "id"} for the keys in the cache.
+
+        None keys are skipped.  Every lookup counts as a hit or a miss.
+        """
+        by_shard = {}
+        for key in keys:
+            if key is not None:
+                by_shard.setdefault(self._shard(key), []).append(key)
+        found = {}
+        for number, shard_keys in by_shard.items():
+            connection = self._shards[number]
+            for start in range(0, len(shard_keys), 500):
+                batch = shard_keys[start:start + 500]
+                rows = connection.execute(
+                    f"SELECT key, value, seconds FROM entries WHERE key IN ({','.join('?' * len(batch))})",
+                    batch).fetchall()
+                if not rows:
+                    continue
+                used = self._tick()
+                for key, value, seconds in rows:
+                    # Uncompressed values are JSON objects, so start with "{"
+                    found[key] = json.loads(value if value[:1] == b"{" else zlib.decompress(value))
+                    self.seconds_saved += seconds
+                connection.executemany("UPDATE entries SET used = ? WHERE key = ?",
+                                       [(used, row[0]) for row in rows])
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries):
+        """Store (key, result, seconds) entries, evicting old ones when a shard is full.
+
+        seconds is how long the result took to compute.  The "id" of each
+        result is not stored, and entries with a None key are skipped.
+        """
+        by_shard = {}
+        for key, result, seconds in entries:
+            if key is None:
+                continue
+            value = json.dumps({name: item for name, item in result.items() if name != "id"},
+                               ensure_ascii=False).encode("utf-8")
+            if len(value) > COMPRESS_THRESHOLD:
+                value = zlib.compress(value, 1)
+            # Keyed by content, so an entry with the same key already holds this result
+            by_shard.setdefault(self._shard(key), {})[key] = (key, value, len(key) + len(value), seconds)
+        for number, rows in by_shard.items():
+            connection = self._shards[number]
+            used = self._tick()
+            cursor = connection.executemany(
+                "INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?)",
+                [(key, value, size, seconds, used) for key, value, size, seconds in rows.values()])
+            if cursor.rowcount == len(rows):
+                self._sizes[number] += sum(row[2] for row in rows.values())
+            else:
+                # Some were already stored, e.g. by another process
+                self._sizes[number] = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if self._sizes[number] > self._shard_limit:
+                self._evict(number)
+            connection.commit()
+
+    def _evict(self, number):
+        """Remove least recently used entries until the shard is under 90% of its limit."""
+        connection = self._shards[number]
+        target = self._shard_limit * 9 // 10
+        removed = []
+        cursor = connection.execute("SELECT key, size FROM entries ORDER BY used")
+        for key, size in cursor:
+            if self._sizes[number] <= target:
+                break
+            removed.append((key,))
+            self._sizes[number] -= size
+        cursor.close()
+        connection.executemany("DELETE FROM entries WHERE key = ?", removed)
+
+    def size(self):
+        """Return the bytes of keys and results currently stored."""
+        return sum(self._sizes)
+
+    def hit_rate(self):
+        """Return the share of lookups that were hits, 0.0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self):
+        """Return a one-line summary of this instance's hits and time saved."""
+        return (f"Cache: {self.hits} hits, {self.misses} misses ({self.hit_rate():.1%} hit rate), "
+                f"{self.seconds_saved:.2f}s of processing saved")
+
+    def clear(self):
+        """Remove every entry."""
+        for number, connection in enumerate(self._shards):
+            connection.execute("DELETE FROM entries")
+            connection.commit()
+            self._sizes[number] = 0
+
+    def close(self):
+        """Commit pending use stamps and close the shard files."""
+        for connection in self._shards:
+            connection.commit()
+            connection.close()
+        self._shards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
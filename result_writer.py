@@ -0,0 +1,169 @@
+"""
+Result Writer
+Buffers Legal String Processor results in columns and writes them out in
+large blocks as CSV, JSONL, or Parquet (the last needs pyarrow).
+
+Each result dict, as produced by corpus_runner.process_document, becomes
+one flat row: id, case_name, plaintiff, defendant, date, section, one
+client_info:<field> column per client field, and errors.  Values of
+operations that were not run are empty in CSV and null otherwise.
+"""
+
+import csv
+import json
+import sys
+from json.encoder import encode_basestring
+
+from corpus_runner import DEFAULT_FIELDS
+
+FORMATS = ("csv", "jsonl", "parquet")
+BASE_COLUMNS = ("id", "case_name", "plaintiff", "defendant", "date", "section")
+DEFAULT_BUFFER_ROWS = 10000
+
+def result_columns(fields=DEFAULT_FIELDS):
+    """Return the column names written for the given client fields."""
+    return BASE_COLUMNS + tuple(f"client_info:{field}" for field in fields) + ("errors",)
+
+def _json_values(values):
+    """Encode a column of values as JSON text, one string per value."""
+    try:
+        # Columns of strings, the common case, are encoded in C
+        return list(map(encode_basestring, values))
+    except TypeError:
+        return [encode_basestring(value) if isinstance(value, str) else
+                "null" if value is None else json.dumps(value, ensure_ascii=False)
+                for value in values]
+
+class ResultWriter:
+    """Writes result dicts to a file in blocks of buffer_rows rows.
+
+    Rows are held column by column and each flush encodes and writes a
+    whole block at once.  Use as a context manager, or call close() to
+    write the last block.
+    """
+
+    def __init__(self, output, format="jsonl", fields=DEFAULT_FIELDS,
+                 buffer_rows=DEFAULT_BUFFER_ROWS):
+        if output is None:
+            raise ValueError("Output cannot be None")
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format: {format}")
+        if buffer_rows < 1:
+            raise ValueError("Buffer rows must be at least 1")
+        if format == "parquet" and output == "-":
+            raise ValueError("Parquet output must be written to a file")
+
+        self.format = format
+        self.fields = tuple(fields)
+        self.columns = result_columns(self.fields)
+        self.buffer_rows = buffer_rows
+        self.rows_written = 0
+        self._buffer = [[] for _ in self.columns]
+        self._appends = [column.append for column in self._buffer]
+        self._buffered = 0
+
+        if format == "parquet":
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from None
+            self._pyarrow = pyarrow
+            self._schema = pyarrow.schema([(name, pyarrow.string()) for name in self.columns])
+            self._out = pyarrow.parquet.ParquetWriter(output, self._schema)
+            return
+
+        if output == "-":
+            self._out = sys.stdout
+        else:
+            self._out = open(output, "w", encoding="utf-8", newline="" if format == "csv" else None)
+        if format == "csv":
+            self._csv = csv.writer(self._out)
+            self._csv.writerow(self.columns)
+        else:
+            # Key prefixes of each JSONL line, with the separators between values
+            self._prefixes = ["{" + json.dumps(self.columns[0], ensure_ascii=False) + ": "] + [
+                ", " + json.dumps(name, ensure_ascii=False) + ": " for name in self.columns[1:]]
+
+    def write(self, result):
+        """Add one result dict, flushing when the buffer is full."""
+        appends = self._appends
+        get = result.get
+        appends[0](get("id"))
+        appends[1](get("case_name"))
+        parties = get("parties")
+        if parties:
+            appends[2](parties[0])
+            appends[3](parties[1])
+        else:
+            appends[2](None)
+            appends[3](None)
+        appends[4](get("date"))
+        appends[5](get("section"))
+        client_get = (get("client_info") or {}).get
+        for index, field in enumerate(self.fields, len(BASE_COLUMNS)):
+            appends[index](client_get(field))
+        appends[-1](get("errors"))
+        self._buffered += 1
+        if self._buffered >= self.buffer_rows:
+            self.flush()
+
+    def write_many(self, results):
+        """Add every result dict in results; return how many were added."""
+        count = 0
+        for result in results:
+            self.write(result)
+            count += 1
+        return count
+
+    def flush(self):
+        """Write the buffered rows as one block."""
+        if not self._buffered:
+            return
+        if self.format == "jsonl":
+            self._flush_jsonl()
+        else:
+            self._flush_table()
+        self.rows_written += self._buffered
+        for column in self._buffer:
+            column.clear()
+        self._buffered = 0
+
+    def _flush_jsonl(self):
+        encoded = [[prefix + value for value in _json_values(column)]
+                   for prefix, column in zip(self._prefixes, self._buffer)]
+        lines = ["".join(values) for values in zip(*encoded)]
+        lines.append("")
+        self._out.write("}\n".join(lines))
+
+    def _flush_table(self):
+        columns = self._buffer[:]
+        columns[0] = [None if value is None else str(value) for value in columns[0]]
+        columns[-1] = [None if value is None else json.dumps(value, ensure_ascii=False)
+                       for value in columns[-1]]
+        if self.format == "csv":
+            # csv writes None as an empty field
+            self._csv.writerows(zip(*columns))
+        else:
+            table = self._pyarrow.table(dict(zip(self.columns, columns)), schema=self._schema)
+            self._out.write_table(table)
+
+    def close(self):
+        """Flush the remaining rows and close the output."""
+        self.flush()
+        if self._out is not sys.stdout:
+            self._out.close()
+        else:
+            self._out.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def write_results(results, output, format="jsonl", fields=DEFAULT_FIELDS,
+                  buffer_rows=DEFAULT_BUFFER_ROWS):
+    """Write every result dict in results to output; return the row count."""
+    with ResultWriter(output, format, fields, buffer_rows) as writer:
+        return writer.write_many(results)
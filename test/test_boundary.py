@@ -62,5 +62,25 @@ def test_edge_cases(test_obj):
         test_obj.yakshaAssert("TestEdgeCases", False, "boundary")
         pytest.fail(f"Edge cases test failed: {str(e)}")
 
+def test_date_chunk_boundaries(test_obj):
+    """Test dates split across chunk boundaries when streaming"""
+    try:
+        chunks = ["Effective 20", "23-06-", "15. Dispute on (2022", "-11-30)", ""]
+        assert list(iter_dates(chunks)) == ["2023-06-15", "2022-11-30"], "Should join dates split across chunks"
+        
+        chunks = ["Filed 2023-05-15", "99 and 2023-01-01"]
+        assert list(iter_dates(chunks)) == ["2023-01-01"], "Should not end a word at a chunk boundary"
+        
+        chunks = ["((" * 500, "..." * 500 + "2023-", "05-15" + ")." * 500, ";;" * 500 + " 2022-11-30"]
+        assert list(iter_dates(chunks)) == ["2023-05-15", "2022-11-30"], "Should strip punctuation runs spanning chunks"
+        
+        assert list(iter_dates([])) == [], "No chunks should yield no dates"
+        assert list(iter_dates("")) == [], "Empty text should yield no dates"
+        
+        test_obj.yakshaAssert("TestDateChunkBoundaries", True, "boundary")
+    except Exception as e:
+        test_obj.yakshaAssert("TestDateChunkBoundaries", False, "boundary")
+        pytest.fail(f"Date chunk boundaries test failed: {str(e)}")
+
 if __name__ == '__main__':
     pytest.main(['-v'])
\ No newline at end of file
@@ -51,5 +51,347 @@ def test_error_handling(test_obj):
         test_obj.yakshaAssert("TestErrorHandling", False, "exception")
         pytest.fail(f"Error handling test failed: {str(e)}")
 
+def test_batch_extractor_errors(test_obj):
+    """Test that the batch and compact extractors reject invalid input"""
+    try:
+        functions_to_test = [
+            (extract_case_names_batch, [["Smith v. Jones", None]]),
+            (extract_case_names_compact, [["Smith v. Jones", None]]),
+            (extract_dates_batch, [["2023-01-01"], "unknown"]),
+            (extract_dates_compact, [[None]]),
+            (extract_client_info_compact, [["Client: John Doe"], None]),
+            (extract_client_info_compact, [["Client: John Doe"], ""]),
+            (extract_client_info_compact, [[None], "Client"])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestBatchExtractorErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestBatchExtractorErrors", False, "exception")
+        pytest.fail(f"Batch extractor errors test failed: {str(e)}")
+
+def test_date_scanning_errors(test_obj):
+    """Test that the date scanners reject None text and malformed bounds"""
+    try:
+        functions_to_test = [
+            (iter_dates, [None]),
+            (extract_all_dates, [None]),
+            (extract_all_dates, ["2023-01-01", "2023"]),
+            (extract_all_dates, ["2023-01-01", None, "２０２３-０１-０１"])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestDateScanningErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestDateScanningErrors", False, "exception")
+        pytest.fail(f"Date scanning errors test failed: {str(e)}")
+
+def test_section_lookup_errors(test_obj):
+    """Test that section lookups and heading vocabularies reject invalid input"""
+    try:
+        functions_to_test = [
+            (find_section_in_file, [None, "SECTION"]),
+            (find_section_in_file, ["contract.txt", None]),
+            (find_section_in_file, ["contract.txt", ""]),
+            (SectionIndex, [None]),
+            (SectionIndex("document").find_section, [None]),
+            (HeadingMatcher, [None]),
+            (HeadingMatcher, [[]]),
+            (HeadingMatcher, ["SECTION"]),
+            (HeadingMatcher, [["SECTION", ""]]),
+            (find_section, ["document", "SECTION", ["SECTION", None]]),
+            (split_sections, [None]),
+            (split_sections_parallel, [None]),
+            (split_sections_parallel, ["document", None, 2, None, 0])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestSectionLookupErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestSectionLookupErrors", False, "exception")
+        pytest.fail(f"Section lookup errors test failed: {str(e)}")
+
+def test_client_record_errors(test_obj):
+    """Test that client record parsing, lookup and indexing reject invalid input"""
+    try:
+        functions_to_test = [
+            (parse_client_record, [None]),
+            (lookup_client_info, [None, "Client", {}]),
+            (lookup_client_info, ["text", None, {}]),
+            (ClientRecordIndex, [[("r1", None)]]),
+            (ClientRecordIndex, [[], "DOB"]),
+            (ClientRecordIndex().remove, ["r1"]),
+            (ClientRecordIndex().find, ["DOB", None]),
+            (ClientRecordIndex().find_prefix, [None, "CR-"]),
+            (ClientRecordIndex().find_dates, ["DOB", "May 1980"])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestClientRecordErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestClientRecordErrors", False, "exception")
+        pytest.fail(f"Client record errors test failed: {str(e)}")
+
+def test_bytes_extractor_errors(test_obj):
+    """Test that the bytes extractors reject None and empty arguments"""
+    try:
+        functions_to_test = [
+            (extract_date_bytes, [None]),
+            (extract_client_info_bytes, [None, "Client"]),
+            (extract_client_info_bytes, [b"text", None]),
+            (extract_client_info_bytes, [b"text", ""]),
+            (find_section_bytes, [None, "SECTION"]),
+            (find_section_bytes, [b"document", None]),
+            (find_section_bytes, [b"document", ""])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestBytesExtractorErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestBytesExtractorErrors", False, "exception")
+        pytest.fail(f"Bytes extractor errors test failed: {str(e)}")
+
+def test_processor_errors(test_obj):
+    """Test that LegalStringProcessor rejects invalid configuration and input"""
+    try:
+        functions_to_test = [
+            (LegalStringProcessor, [None]),
+            (LegalStringProcessor, ["v."]),
+            (LegalStringProcessor, [["v.", " "]]),
+            (LegalStringProcessor, [["v."], []]),
+            (DEFAULT_PROCESSOR.extract_case_name, [None]),
+            (DEFAULT_PROCESSOR.extract_case_names_batch, [["Smith v. Jones", None]]),
+            (DEFAULT_PROCESSOR.extract_client_info_batch, [["Client: John Doe"], None]),
+            (DEFAULT_PROCESSOR.extract_client_info_batch, [[None], "Client"])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestProcessorErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestProcessorErrors", False, "exception")
+        pytest.fail(f"Processor errors test failed: {str(e)}")
+
+def test_citation_index_errors(test_obj):
+    """Test that case keys and CitationIndex reject invalid input"""
+    try:
+        functions_to_test = [
+            (canonical_case_key, [None]),
+            (CitationIndex().add, [None, "Smith v. Jones"]),
+            (CitationIndex().add, ["brief-1", None]),
+            (CitationIndex().add, ["brief-1", "Smith v. Jones", -1]),
+            (CitationIndex().documents_citing, [None])
+        ]
+        
+        for func, args in functions_to_test:
+            with pytest.raises(ValueError):
+                func(*args)
+        
+        test_obj.yakshaAssert("TestCitationIndexErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestCitationIndexErrors", False, "exception")
+        pytest.fail(f"Citation index errors test failed: {str(e)}")
+
+def test_corpus_runner_errors(test_obj, tmp_path):
+    """Test that extractor errors are captured per document"""
+    try:
+        from corpus_runner import iter_results
+        
+        results = list(iter_results([("good", "Smith v. Jones"), ("bad", None)], workers=1))
+        assert "errors" not in results[0], "Valid document should have no errors"
+        assert results[1]["errors"]["date"] == "Text cannot be None", "Should capture the extractor's ValueError"
+        assert results[1]["errors"]["case_name"] == "Citation cannot be None", "Should capture case name errors"
+        
+        results = list(iter_results([("number", 42), ("good", "Smith v. Jones")], ops=("date", "client_info"), fields=("Client",), workers=1))
+        assert results[0]["errors"] == {"date": "Text must be a string, not int", "client_info:Client": "Text must be a string, not int"}, "Should capture non-string text"
+        assert "errors" not in results[1], "A bad document should not affect the next"
+        
+        from corpus_runner import load_documents
+        source = tmp_path / "docs.jsonl"
+        source.write_text('{"id": "a", "text": "Smith v. Jones"}\nnot json\n[1]\n')
+        results = list(iter_results(load_documents(str(source)), ops=("case_name",), workers=1))
+        assert [result["id"] for result in results] == ["a", 2, 3], "Bad lines should keep their line numbers"
+        assert results[1]["errors"]["case_name"].startswith("Invalid JSON"), "Should capture invalid JSON lines"
+        assert results[2]["errors"]["case_name"] == "Invalid JSON: expected an object", "Should capture non-object lines"
+        
+        source.write_bytes(b'{"text": "caf\xe9"}\n{"text": "Smith v. Jones"}\n')
+        results = list(iter_results(load_documents(str(source)), ops=("case_name",), workers=1))
+        assert results[0]["errors"]["case_name"].startswith("Invalid UTF-8"), "Should capture undecodable lines"
+        assert results[1]["case_name"] == "Smith v. Jones", "A bad line should not stop the run"
+        
+        directory = tmp_path / "docs"
+        directory.mkdir()
+        (directory / "a.txt").write_bytes(b"\xff\xfe")
+        (directory / "b.txt").write_text("Smith v. Jones")
+        results = list(iter_results(load_documents(str(directory)), ops=("case_name",), workers=1))
+        assert results[0]["errors"]["case_name"].startswith("Invalid UTF-8"), "Should capture undecodable files"
+        assert results[1]["case_name"] == "Smith v. Jones", "A bad file should not stop the run"
+        
+        from corpus_runner import main
+        with pytest.raises(SystemExit):
+            main([str(directory), str(tmp_path / "out.jsonl"), "--ops", "unknown"])
+        assert main([str(directory), str(tmp_path / "out.jsonl"), "--workers", "1"]) == 0, "Bad files should not fail the run"
+        
+        with pytest.raises(ValueError):
+            iter_results([], ops=("unknown",))
+        
+        with pytest.raises(ValueError):
+            iter_results([], chunk_size=0)
+        
+        test_obj.yakshaAssert("TestCorpusRunnerErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestCorpusRunnerErrors", False, "exception")
+        pytest.fail(f"Corpus runner errors test failed: {str(e)}")
+
+def test_extraction_cache_none(test_obj):
+    """Test that None inputs and extractor errors keep raising and are never cached"""
+    try:
+        for cache in [ExtractionCache(extract_case_name), ExtractionCache(extract_parties, max_bytes=1000)]:
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    cache(None)
+            assert cache.stats()["entries"] == 0, "None should not be cached"
+        
+        def first_party(text):
+            if " v. " not in text:
+                raise ValueError("Not a case name")
+            return text.split(" v. ")[0]
+        for cache, evictions in [(ExtractionCache(first_party, max_entries=2), None),
+                                 (ExtractionCache(first_party, max_entries=2, max_bytes=1000), 0)]:
+            for text in ["A", "B", "C"]:
+                with pytest.raises(ValueError):
+                    cache(text)
+            assert cache("A v. B") == "A", "Should cache a successful extraction"
+            stats = cache.stats()
+            assert (stats["misses"], stats["entries"]) == (4, 1), "Failed extractions should not be cached"
+            assert stats["evictions"] == evictions, "Failed extractions should not count as evictions"
+        
+        with pytest.raises(ValueError):
+            ExtractionCache(extract_case_name, max_entries=0)
+        
+        test_obj.yakshaAssert("TestExtractionCacheNone", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestExtractionCacheNone", False, "exception")
+        pytest.fail(f"Extraction cache None test failed: {str(e)}")
+
+def test_batch_cli_arguments(test_obj):
+    """Test that the command-line interface rejects missing operation arguments"""
+    try:
+        for argv in [["extract", "--op", "client"], ["extract", "--op", "section"],
+                     ["extract", "--op", "string"], ["extract", "--op", "unknown"]]:
+            with pytest.raises(SystemExit):
+                cli(argv)
+        
+        test_obj.yakshaAssert("TestBatchCliArguments", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestBatchCliArguments", False, "exception")
+        pytest.fail(f"Batch CLI arguments test failed: {str(e)}")
+
+def test_async_pipeline_errors(test_obj, tmp_path):
+    """Test that read errors are captured and invalid pipeline settings rejected"""
+    try:
+        from async_pipeline import SimulatedLatencyReader, process_files, process_files_sequentially
+        
+        good = tmp_path / "good.txt"
+        good.write_text("Smith v. Jones")
+        missing = str(tmp_path / "missing.txt")
+        undecodable = tmp_path / "latin1.txt"
+        undecodable.write_bytes(b"caf\xe9")
+        paths = [str(good), missing, str(undecodable)]
+        
+        for results in [process_files(paths), process_files_sequentially(paths)]:
+            assert [result["id"] for result in results] == paths, "Should keep input order"
+            assert "errors" not in results[0], "Readable document should have no errors"
+            assert "read" in results[1]["errors"], "Should capture the read error"
+            assert "utf-8" in results[2]["errors"]["read"], "Should capture the decode error"
+        
+        for kwargs in [{"concurrency": 0}, {"workers": 0}, {"queue_size": 0}, {"ops": ("unknown",)}]:
+            with pytest.raises(ValueError):
+                process_files([str(good)], **kwargs)
+        
+        with pytest.raises(ValueError):
+            process_files(None)
+        
+        with pytest.raises(ValueError):
+            SimulatedLatencyReader(-1)
+        
+        test_obj.yakshaAssert("TestAsyncPipelineErrors", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestAsyncPipelineErrors", False, "exception")
+        pytest.fail(f"Async pipeline errors test failed: {str(e)}")
+
+def test_result_writer_arguments(test_obj, tmp_path):
+    """Test that invalid result writer settings are rejected"""
+    try:
+        from result_writer import ResultWriter
+        
+        output = str(tmp_path / "out.csv")
+        for args in [(None,), (output, "xml"), (output, "csv", ("Client",), 0), ("-", "parquet")]:
+            with pytest.raises(ValueError):
+                ResultWriter(*args)
+        
+        test_obj.yakshaAssert("TestResultWriterArguments", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestResultWriterArguments", False, "exception")
+        pytest.fail(f"Result writer arguments test failed: {str(e)}")
+
+def test_result_cache_arguments(test_obj, tmp_path):
+    """Test that invalid result cache settings are rejected"""
+    try:
+        from result_cache import ResultCache
+        
+        directory = str(tmp_path / "cache")
+        for args in [(None,), (directory, 0), (directory, 1024, 0), (directory, 1024, 257)]:
+            with pytest.raises(ValueError):
+                ResultCache(*args)
+        
+        test_obj.yakshaAssert("TestResultCacheArguments", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestResultCacheArguments", False, "exception")
+        pytest.fail(f"Result cache arguments test failed: {str(e)}")
+
+def test_incremental_document_edits(test_obj):
+    """Test that invalid documents and edits are rejected without changing the text"""
+    try:
+        with pytest.raises(ValueError):
+            IncrementalDocument(None)
+        
+        with pytest.raises(ValueError):
+            IncrementalDocument("text", block_size=0)
+        
+        document = IncrementalDocument("SECTION 1\nText")
+        for offset, deleted, inserted in [(-1, 0, "x"), (0, -1, "x"), (10, 5, "x"), (15, 0, "x"), (0, 0, None)]:
+            with pytest.raises(ValueError):
+                document.edit(offset, deleted, inserted)
+        assert document.text == "SECTION 1\nText", "Rejected edits should not change the text"
+        
+        with pytest.raises(ValueError):
+            document.find_section(None)
+        
+        with pytest.raises(ValueError):
+            document.find_section("")
+        
+        test_obj.yakshaAssert("TestIncrementalDocumentEdits", True, "exception")
+    except Exception as e:
+        test_obj.yakshaAssert("TestIncrementalDocumentEdits", False, "exception")
+        pytest.fail(f"IncrementalDocument edits test failed: {str(e)}")
+
 if __name__ == '__main__':
     pytest.main(['-v'])
\ No newline at end of file
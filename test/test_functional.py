@@ -190,5 +190,693 @@ def test_function_logic(test_obj):
         test_obj.yakshaAssert("test_function_logic", False, "functional")
         pytest.fail(f"Function logic test failed: {str(e)}")
 
+def test_case_names_batch(test_obj):
+    """Test that batch case name extraction matches the per-string functions"""
+    try:
+        citations = [
+            "Smith v. Jones, 123 F.3d 456",
+            "Brown vs. Board, 347 U.S. 483",
+            "Smith, et al. v. Jones Corp., 123 F.3d 456",
+            "Martinez, Plaintiff v. Johnson, Defendant",
+            "No separator here, 1 F.3d 1",
+            "A v. B v. C, 2 F.3d 2",
+            ""
+        ]
+        
+        results = extract_case_names_batch(citations)
+        assert len(results) == len(citations), "Should return one result per citation"
+        
+        for citation, (case_name, parties) in zip(citations, results):
+            assert case_name == extract_case_name(citation), f"Case name mismatch for '{citation}'"
+            assert parties == extract_parties(case_name), f"Parties mismatch for '{citation}'"
+        
+        test_obj.yakshaAssert("test_case_names_batch", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_case_names_batch", False, "functional")
+        pytest.fail(f"Case names batch test failed: {str(e)}")
+
+def test_iter_dates(test_obj):
+    """Test that iter_dates yields every date lazily and agrees with extract_date"""
+    try:
+        text = "Signed 2023-06-15, amended (2023-07-01). Void: 2023/08/01 and 20230901."
+        assert list(iter_dates(text)) == ["2023-06-15", "2023-07-01"], "Should yield every date in order"
+        assert next(iter_dates(text)) == extract_date(text), "First date should match extract_date"
+        
+        long_text = "word " * 1000 + "due 2024-01-31;"
+        assert extract_date(long_text) == "2024-01-31", "Should find a date in a long text"
+        
+        import io
+        stream = io.StringIO(text)
+        assert list(iter_dates(stream, chunk_size=4)) == ["2023-06-15", "2023-07-01"], "Should read file objects in chunks"
+        
+        test_obj.yakshaAssert("test_iter_dates", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_iter_dates", False, "functional")
+        pytest.fail(f"iter_dates test failed: {str(e)}")
+
+def test_extract_all_dates(test_obj):
+    """Test that extract_all_dates returns every date with its offsets and filters while scanning"""
+    try:
+        import datetime
+        
+        _, _, _, legal_document = initialize_legal_samples()
+        dates = extract_all_dates(legal_document)
+        assert [date for date, _, _ in dates] == ["2023-06-15", "2022-11-30"], "Should find every date in order"
+        assert all(legal_document[start:end] == date for date, start, end in dates), "Offsets should locate each date"
+        assert dates[0][0] == extract_date(legal_document), "First date should match extract_date"
+        
+        assert [d for d, _, _ in extract_all_dates(legal_document, since="2023-01-01")] == ["2023-06-15"], "Should drop dates before since"
+        assert [d for d, _, _ in extract_all_dates(legal_document, until=datetime.date(2022, 12, 31))] == ["2022-11-30"], "Should accept date objects"
+        
+        text = "Due 2023-02-30, paid 2024-02-29 and (2023-03-01); ref x2023-04-01"
+        assert [d for d, _, _ in extract_all_dates(text)] == ["2023-02-30", "2024-02-29", "2023-03-01"], "Should match extract_date's rules"
+        assert [d for d, _, _ in extract_all_dates(text, validate=True)] == ["2024-02-29", "2023-03-01"], "Should drop impossible calendar dates"
+        assert extract_all_dates("No dates here") == [], "Should return an empty list without dates"
+        
+        test_obj.yakshaAssert("test_extract_all_dates", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_extract_all_dates", False, "functional")
+        pytest.fail(f"extract_all_dates test failed: {str(e)}")
+
+def test_find_section_in_file(test_obj, tmp_path):
+    """Test that the memory-mapped section finder matches find_section"""
+    try:
+        document = "Intro\nSECTION 1. TERMS\n\nTerms apply.\n\nARTICLE 2. FEES\nFees are due.\nRECITALS\nWHEREAS."
+        path = tmp_path / "contract.txt"
+        path.write_bytes(document.encode("utf-8"))
+        
+        for heading in ["SECTION 1. TERMS", "ARTICLE 2. FEES", "RECITALS", "Intro", "MISSING"]:
+            assert find_section_in_file(str(path), heading) == find_section(document, heading), f"Mismatch for '{heading}'"
+        
+        empty_path = tmp_path / "empty.txt"
+        empty_path.write_bytes(b"")
+        assert find_section_in_file(str(empty_path), "SECTION") == "", "Empty file should return empty section"
+        
+        test_obj.yakshaAssert("test_find_section_in_file", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_find_section_in_file", False, "functional")
+        pytest.fail(f"find_section_in_file test failed: {str(e)}")
+
+def test_section_index(test_obj):
+    """Test that SectionIndex lookups match find_section and follow document updates"""
+    try:
+        document = "SECTION 1. TERMS\nTerms apply.\nARTICLE 2. FEES\nFees are due.\nRECITALSECTION 3\nEnd."
+        index = SectionIndex(document)
+        
+        for heading in ["SECTION 1. TERMS", "ARTICLE 2. FEES", "RECITALS", "Terms", "MISSING"]:
+            assert index.find_section(heading) == find_section(document, heading), f"Mismatch for '{heading}'"
+            assert index.find_section(heading) == find_section(document, heading), f"Cached mismatch for '{heading}'"
+        
+        numbered = "SECTION 10. LATE\nLate.\nSECTION 1\nFirst.\nSECTION 1\nTwice.\nSECTION 1\nThird.\n"
+        index = SectionIndex(numbered)
+        for heading in ["SECTION 1", "SECTION 1\n", "SECTION 1\nTh", "SECTION 10", "SECTION 2", "SECTION"]:
+            assert index.find_section(heading) == find_section(numbered, heading), f"Mismatch for prefix '{heading}'"
+        
+        index = SectionIndex(document)
+        edited = document.replace("Terms apply.", "Terms no longer apply.")
+        assert index.update(edited), "Changed document should rebuild the index"
+        assert not index.update(edited), "Unchanged document should keep the index"
+        assert index.find_section("SECTION 1. TERMS") == "Terms no longer apply.", "Should answer from the new document"
+        
+        test_obj.yakshaAssert("test_section_index", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_section_index", False, "functional")
+        pytest.fail(f"SectionIndex test failed: {str(e)}")
+
+def test_heading_matcher(test_obj):
+    """Test that a custom heading vocabulary ends sections like repeated find calls"""
+    try:
+        headings = ["SECTION", "ARTICLE", "RECITALS", "SCHEDULE", "EXHIBIT", "ANNEX", "WHEREAS", "SCHED"]
+        document = "SECTION 1. TERMS\nTerms apply.\nSCHEDULE A\nFees.\nEXHIBIT B\nWHEREAS the Parties\nANNEX 1\nEnd."
+        matcher = HeadingMatcher(headings)
+        
+        assert find_section(document, "SECTION 1. TERMS", headings) == "Terms apply.", "SCHEDULE should end the section"
+        assert find_section(document, "SECTION 1. TERMS") == "Terms apply.\nSCHEDULE A\nFees.\nEXHIBIT B\nWHEREAS the Parties\nANNEX 1\nEnd.", "Default vocabulary should be unchanged"
+        assert find_section(document, "EXHIBIT B", matcher) == "", "WHEREAS should end the section"
+        assert find_section(document, "ANNEX 1", matcher) == "End.", "Last section should run to the end"
+        assert find_section(document, "SECTION", SECTION_HEADINGS) == find_section(document, "SECTION"), "Default keywords should match"
+        
+        for start in range(len(document) + 1):
+            expected = min([pos for pos in (document.find(h, start) for h in headings) if pos != -1], default=-1)
+            assert matcher.find(document, start) == expected, f"Mismatch from offset {start}"
+        assert matcher.find_all(document) == [0, 30, 47, 57, 77], "Should report every heading offset once"
+        
+        index = SectionIndex(document, headings)
+        for heading in ["SECTION 1. TERMS", "SCHEDULE A", "EXHIBIT B", "Fees", "MISSING"]:
+            assert index.find_section(heading) == find_section(document, heading, headings), f"Index mismatch for '{heading}'"
+        
+        test_obj.yakshaAssert("test_heading_matcher", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_heading_matcher", False, "functional")
+        pytest.fail(f"HeadingMatcher test failed: {str(e)}")
+
+def test_split_sections(test_obj):
+    """Test that split_sections outlines every section as find_section sees it"""
+    try:
+        document = "Preamble.\nSECTION 1. TERMS\nTerms apply.\n\nARTICLE 2. FEES SECTION\nFees are due.\nRECITALS\nSECTION 3"
+        sections = list(split_sections(document))
+        
+        assert [section.heading for section in sections] == ["SECTION 1. TERMS", "ARTICLE 2. FEES SECTION", "RECITALS", "SECTION 3"], "Should find every heading once"
+        for section in sections:
+            heading, start, end, content = section
+            assert content == find_section(document, heading), f"Content mismatch for '{heading}'"
+            assert content == document[start:end].strip(), "Offsets should span the content"
+        assert sections[-1].content == "" and sections[-1].start == len(document), "Heading on the last line has no content"
+        
+        custom = list(split_sections(document, ["Terms", "Fees"]))
+        assert [section.heading for section in custom] == ["Terms apply.", "Fees are due."], "Should use the given vocabulary"
+        assert list(split_sections("No headings here.")) == [], "Document without headings has no sections"
+        
+        test_obj.yakshaAssert("test_split_sections", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_split_sections", False, "functional")
+        pytest.fail(f"split_sections test failed: {str(e)}")
+
+def test_split_sections_parallel(test_obj):
+    """Test that split_sections_parallel returns exactly what split_sections yields"""
+    try:
+        document = "Preamble.\n" + "".join(f"SECTION {number}. CLAUSE ARTICLE\nTerms é{number}.\n\nARTICLE {number}\n" for number in range(200))
+        expected = [tuple(section) for section in split_sections(document)]
+        
+        sections = split_sections_parallel(document, workers=2, chunk_size=500)
+        assert [tuple(section) for section in sections] == expected, "Chunked sections should match split_sections"
+        assert sections[3].content == find_section(document, sections[3].heading), "Content should slice the document"
+        custom = split_sections_parallel(document, ["CLAUSE"], workers=2, chunk_size=500)
+        assert [tuple(section) for section in custom] == [tuple(section) for section in split_sections(document, ["CLAUSE"])], "Should use the given vocabulary"
+        assert [tuple(section) for section in split_sections_parallel(document, workers=1)] == expected, "One worker splits in process"
+        assert split_sections_parallel("No headings here.", workers=2, chunk_size=1) == [], "Document without headings has no sections"
+        
+        test_obj.yakshaAssert("test_split_sections_parallel", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_split_sections_parallel", False, "functional")
+        pytest.fail(f"split_sections_parallel test failed: {str(e)}")
+
+def test_compact_results(test_obj):
+    """Test that compact result containers read back like the batch extractors"""
+    try:
+        citations = ["Smith v. Jones, 123 F.3d 456", "  Doe vs. Roe , 1 F.2d", "In re Estate, 2 F.3d", "No comma", "A v. B vs. C v. D", "X v. v. Y"]
+        results = extract_case_names_compact(citations)
+        assert len(results) == len(citations), "Should hold one record per citation"
+        assert list(results) == extract_case_names_batch(citations), "Records should match extract_case_names_batch"
+        assert results[-1] == extract_case_names_batch(citations)[-1], "Negative indexes should work"
+        assert results.case_name(1) == "Doe vs. Roe" and results.parties(1) == ("Doe", "Roe"), "Accessors should materialize strings"
+        
+        texts = ["Filed on (2023-05-15).", "No date here", "2023-1-15 then 2024-02-29"]
+        dates = extract_dates_compact(texts)
+        assert list(dates) == [extract_date(text) for text in texts], "Dates should match extract_date"
+        assert dates.span(0) == (10, 20) and dates.span(1) is None, "Spans should locate the date in its text"
+        
+        records = ["Client:  John Doe \nDOB: 1980-05-15", "DOB: 1990-01-01", "Client:"]
+        clients = extract_client_info_compact(records, "Client")
+        assert list(clients) == [extract_client_info(text, "Client") for text in records], "Should match extract_client_info"
+        
+        test_obj.yakshaAssert("test_compact_results", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_compact_results", False, "functional")
+        pytest.fail(f"Compact results test failed: {str(e)}")
+
+def test_bytes_extractors(test_obj):
+    """Test that the bytes extractors match the str extractors on UTF-8 input"""
+    try:
+        document = "SECTION 1. TERMS\n\u00a0Résumé — § 4 applies.\u2003\nClient:\u3000José Núñez\nDOB: 1980-05-15\nSigned\u00a0(2023-06-15).\nARTICLE 2\nEnd"
+        for data in [document.encode("utf-8"), memoryview(document.encode("utf-8")), bytearray(document.encode("utf-8"))]:
+            assert extract_date_bytes(data) == extract_date(document) == "1980-05-15", "Date should match extract_date"
+            for field in ["Client", "DOB", "Résumé", "Missing"]:
+                assert extract_client_info_bytes(data, field) == extract_client_info(document, field), f"Mismatch for '{field}'"
+            for heading in ["SECTION 1. TERMS", "Client", "ARTICLE 2", "Missing"]:
+                assert find_section_bytes(data, heading) == find_section(document, heading), f"Mismatch for '{heading}'"
+        
+        for text in ["x2023-01-01 2024-02-02", "２０２３-01-01", "a\x1c2023-01-01\x1c", "2023-01-01é", "((2023-01-01))"]:
+            assert extract_date_bytes(text.encode("utf-8")) == extract_date(text), f"Date mismatch for {text!r}"
+        
+        test_obj.yakshaAssert("test_bytes_extractors", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_bytes_extractors", False, "functional")
+        pytest.fail(f"Bytes extractors test failed: {str(e)}")
+
+def test_incremental_document(test_obj):
+    """Test that random edits keep IncrementalDocument equal to a full recompute"""
+    try:
+        import random
+        
+        rng = random.Random(42)
+        pieces = ["SECTION 1\n", "ARTICLE 2\n", "RECITALS", "SECT", "ION", "2023-01-02", "2023-", "01-02", " ", "\n", "(", ")", "x", "-"]
+        text = "".join(rng.choice(pieces) for _ in range(60))
+        document = IncrementalDocument(text, block_size=8)
+        
+        for step in range(500):
+            # Every tenth edit spans several blocks
+            size = 40 if step % 10 == 0 else 5
+            offset = rng.randint(0, len(text))
+            deleted = rng.randint(0, min(size, len(text) - offset))
+            inserted = "".join(rng.choice(pieces) for _ in range(rng.randint(0, size // 2)))
+            document.edit(offset, deleted, inserted)
+            text = text[:offset] + inserted + text[offset + deleted:]
+            
+            assert document.text == text, "Text should follow the edits"
+            assert document.heading_positions() == SectionIndex(text).heading_positions, "Heading offsets should match a rescan"
+            assert document.extract_date() == extract_date(text), "Date should match extract_date"
+            for heading in ["SECTION 1", "ARTICLE 2", "RECITALS", "SECT", "x", "ION"]:
+                assert document.find_section(heading) == find_section(text, heading), f"Mismatch for '{heading}'"
+        
+        custom = IncrementalDocument("Terms\nA\nFees\nB", headings=["Fees"])
+        custom.edit(0, 0, "Fees\n")
+        assert custom.find_section("Terms") == find_section(custom.text, "Terms", ["Fees"]) == "A", "Should use the given vocabulary"
+        
+        test_obj.yakshaAssert("test_incremental_document", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_incremental_document", False, "functional")
+        pytest.fail(f"IncrementalDocument test failed: {str(e)}")
+
+def test_legal_string_processor(test_obj):
+    """Test that a shared LegalStringProcessor matches the module functions and honours its configuration"""
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        
+        case_citation, client_info, contract_section, legal_document = initialize_legal_samples()
+        processor = LegalStringProcessor()
+        citations = [case_citation, "Roe vs. Wade, 410 U.S. 113", "In re Gault, 387 U.S. 1", "A v. B v. C", "Plain text"]
+        
+        for citation in citations:
+            assert processor.extract_case_name(citation) == extract_case_name(citation), f"Mismatch for {citation!r}"
+            case_name = extract_case_name(citation)
+            assert processor.extract_parties(case_name) == extract_parties(case_name), f"Mismatch for {case_name!r}"
+        assert processor.extract_date(legal_document) == extract_date(legal_document) == "2023-06-15", "Date should match extract_date"
+        assert processor.find_section(contract_section, "SECTION 1. DEFINITIONS") == find_section(contract_section, "SECTION 1. DEFINITIONS"), "Section should match find_section"
+        assert processor.extract_client_info(client_info, "DOB") == "1980-05-15", "Client info should match extract_client_info"
+        
+        assert processor.extract_case_names_batch(citations) == extract_case_names_batch(citations), "Batch should match extract_case_names_batch"
+        assert processor.extract_dates_batch([legal_document, "none"]) == extract_dates_batch([legal_document, "none"]), "Batch should match extract_dates_batch"
+        assert processor.extract_client_info_batch([client_info, "none"], "Client") == ["John Doe", ""], "Batch should match the loop"
+        assert processor.find_sections_batch(contract_section, ["SECTION 1. DEFINITIONS", "Missing"]) == [find_section(contract_section, "SECTION 1. DEFINITIONS"), ""], "Batch should match the loop"
+        
+        versus = LegalStringProcessor(separators=("v.", "vs.", "versus"))
+        assert versus.extract_case_name("Acme Corp. versus Smith, 1 F.3d 2") == "Acme Corp. versus Smith", "Should use the extra separator"
+        assert versus.extract_parties("Acme Corp. versus Smith") == ("Acme Corp.", "Smith"), "Should split on the extra separator"
+        assert versus.extract_case_names_batch(["Acme Corp. versus Smith, 1 F.3d 2"]) == [("Acme Corp. versus Smith", ("Acme Corp.", "Smith"))], "Batch should use the extra separator"
+        
+        custom = LegalStringProcessor(headings=["Fees"])
+        assert custom.find_section("Terms\nA\nFees\nB", "Terms") == "A", "Should use the given headings"
+        
+        with pytest.raises(AttributeError):
+            processor.separators = ("v.",)
+        
+        with ThreadPoolExecutor(4) as pool:
+            shared = list(pool.map(DEFAULT_PROCESSOR.extract_case_names_batch, [citations] * 8))
+        assert all(result == shared[0] for result in shared), "Shared use across threads should give the same results"
+        
+        test_obj.yakshaAssert("test_legal_string_processor", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_legal_string_processor", False, "functional")
+        pytest.fail(f"LegalStringProcessor test failed: {str(e)}")
+
+def test_citation_index(test_obj):
+    """Test that CitationIndex groups citation variants and answers document and top-N queries"""
+    try:
+        index = CitationIndex([
+            ("brief-1", "Smith v. Jones, 123 F.3d 456 (9th Cir. 2023)", 0),
+            ("brief-2", "SMITH  VS.\nJONES, 123 F.3d 456", 120),
+            ("brief-1", "smith versus jones", 400),
+            ("brief-3", "In re Gault, 387 U.S. 1 (1967)", 0),
+            ("brief-3", "Roe v. Wade, 410 U.S. 113", 80),
+            ("brief-4", "roe v wade", 10),
+        ])
+        
+        assert len(index) == 3, "Variants of a case should share one key"
+        assert index.keys() == ["smith v. jones", "in re gault", "roe v. wade"], "Keys should be canonical, in order first cited"
+        assert canonical_case_key("Smith vs. JONES, 1 F.3d 2") == "smith v. jones", "Key should ignore case and separator form"
+        assert index.count("Smith v. Jones") == 3, "Should count every occurrence"
+        assert index.documents_citing("smith vs. jones") == ["brief-1", "brief-2"], "Should list each citing document once"
+        assert index.occurrences("Smith v. Jones") == [("brief-1", 0), ("brief-2", 120), ("brief-1", 400)], "Should keep doc ids and offsets"
+        assert index.most_common(2) == [("smith v. jones", 3), ("roe v. wade", 2)], "Should rank cases by citations"
+        assert index.most_common() == [("smith v. jones", 3), ("roe v. wade", 2), ("in re gault", 1)], "Should rank every case"
+        assert "ROE VS. WADE" in index and "Doe v. Bolton" not in index, "Membership should use canonical keys"
+        assert index.count("Doe v. Bolton") == 0 and index.documents_citing("Doe v. Bolton") == [], "Unknown cases should be empty"
+        
+        for citation in ["Smith v. Jones", "Roe vs. Wade, 410 U.S. 113", "In re Gault"]:
+            case_name = extract_case_name(citation)
+            assert canonical_case_key(citation) == canonical_case_key(case_name), f"Citation and case name should share a key for {citation!r}"
+        
+        test_obj.yakshaAssert("test_citation_index", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_citation_index", False, "functional")
+        pytest.fail(f"CitationIndex test failed: {str(e)}")
+
+def test_parse_client_record(test_obj):
+    """Test single-pass client record parsing and lookups"""
+    try:
+        text = "Client: John Doe\nDOB: 1980-05-15\nCase #: CR-2023-01234\nNote: Former Client: Jane Roe\nClient: Duplicate"
+        record = parse_client_record(text)
+        
+        assert record["Client"] == "John Doe", "First line should win for repeated fields"
+        assert record["DOB"] == "1980-05-15", "Should parse DOB"
+        assert record["Case #"] == "CR-2023-01234", "Should parse fields with spaces and symbols"
+        assert record["Note"] == "Former Client: Jane Roe", "Value should keep later colons"
+        
+        for field in ["Client", "DOB", "Case #", "Note", "Former Client", "ent", "Attorney"]:
+            assert lookup_client_info(text, field, record) == extract_client_info(text, field), f"Lookup mismatch for '{field}'"
+        
+        # "Name:" first matches inside "Attorney Name:" and "DOB:" inside a value
+        text = "Attorney Name: Ann Lee\nName: Bob Roe\nMemo: see DOB: unknown\nDOB: 1980-05-15"
+        record = parse_client_record(text)
+        for field in ["Attorney Name", "Name", "Memo", "DOB"]:
+            assert lookup_client_info(text, field, record) == extract_client_info(text, field), f"Lookup mismatch for '{field}'"
+        assert lookup_client_info(text, "Name", record) == "Ann Lee", "Should match extract_client_info, not the Name line"
+        
+        test_obj.yakshaAssert("test_parse_client_record", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_parse_client_record", False, "functional")
+        pytest.fail(f"parse_client_record test failed: {str(e)}")
+
+def test_client_record_index(test_obj):
+    """Test exact, prefix and date-range queries and updates of ClientRecordIndex"""
+    try:
+        records = [
+            ("r1", "Client: John Doe\nDOB: 1980-05-15\nCase #: CR-2023-01234"),
+            ("r2", "Client: Jane Roe\nDOB: 1975-02-29\nCase #: CR-2023-00077"),
+            ("r3", "Client: Ann Poe\nDOB: 1980-05-01\nCase #: CV-2022-00001"),
+            ("r4", "Client: John Doe\nDOB: 1991-12-31\nCase #: CR-2024-00002"),
+        ]
+        index = ClientRecordIndex(records)
+        
+        assert len(index) == 4 and "r2" in index, "Should index every record"
+        assert index.find("Client", "John Doe") == ["r1", "r4"], "Exact match should return every record"
+        assert index.find_prefix("Case #", "CR-2023-") == ["r2", "r1"], "Prefix match should return records by value"
+        assert index.find_dates("DOB", "1980-05-01", "1980-05-31") == ["r3", "r1"], "Date range should be inclusive"
+        assert index.find_dates("DOB", until="1979-12-31") == [], "1975-02-29 is not a calendar date"
+        assert index.record("r3") == parse_client_record(records[2][1]), "Should keep the indexed fields"
+        
+        index.add("r5", "Client: Lee Moe\nDOB: 1980-05-20\nCase #: CR-2023-09999")
+        index.add("r1", "Client: John Doe\nDOB: 2001-01-01\nCase #: CR-2025-00001")
+        index.remove("r2")
+        assert index.find_prefix("Case #", "CR-2023-") == ["r5"], "Updates should be searchable"
+        assert index.find_dates("DOB", "1980-01-01", "1980-12-31") == ["r3", "r5"], "Replaced values should be gone"
+        assert index.find("Client", "John Doe") == ["r4", "r1"], "Replaced records should move to the end"
+        
+        limited = ClientRecordIndex(records, fields=["Case #"])
+        assert limited.find("Client", "John Doe") == [] and limited.find_prefix("Case #", "CV") == ["r3"], "Should index only the given fields"
+        
+        test_obj.yakshaAssert("test_client_record_index", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_client_record_index", False, "functional")
+        pytest.fail(f"ClientRecordIndex test failed: {str(e)}")
+
+def test_corpus_runner(test_obj, tmp_path):
+    """Test that the corpus runner keeps input order and matches the extractors"""
+    try:
+        import json
+        from corpus_runner import run_corpus
+        
+        texts = [f"Smith {i} v. Jones, 1 F.3d\nClient: Client {i}\nSECTION 1\nFiled 2023-01-{i + 1:02d}.\n" for i in range(20)]
+        source = tmp_path / "docs.jsonl"
+        source.write_text("".join(json.dumps({"id": i, "text": text}) + "\n" for i, text in enumerate(texts)))
+        output = tmp_path / "results.jsonl"
+        
+        count = run_corpus(str(source), str(output), heading="SECTION 1", fields=("Client",), workers=2, chunk_size=3)
+        results = [json.loads(line) for line in output.read_text().splitlines()]
+        
+        assert count == len(texts), "Should process every document"
+        assert [result["id"] for result in results] == list(range(len(texts))), "Output should keep input order"
+        for text, result in zip(texts, results):
+            case_name = extract_case_name(text)
+            assert result["case_name"] == case_name, "Case name should match extract_case_name"
+            assert result["parties"] == list(extract_parties(case_name)), "Parties should match extract_parties"
+            assert result["date"] == extract_date(text), "Date should match extract_date"
+            assert result["section"] == find_section(text, "SECTION 1"), "Section should match find_section"
+            assert result["client_info"] == {"Client": extract_client_info(text, "Client")}, "Client info should match"
+        
+        test_obj.yakshaAssert("test_corpus_runner", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_corpus_runner", False, "functional")
+        pytest.fail(f"Corpus runner test failed: {str(e)}")
+
+def test_result_cache(test_obj, tmp_path):
+    """Test that the result cache answers unchanged documents and is invalidated by version and size"""
+    try:
+        from corpus_runner import iter_results
+        from result_cache import ResultCache
+        
+        documents = [(f"doc-{i}", f"Smith {i % 5} v. Jones\nClient: Client {i % 3}\nSECTION 1\nFiled 2023-01-{i % 9 + 1:02d}.\n") for i in range(30)]
+        documents.append(("missing", None))
+        expected = list(iter_results(documents, workers=1))
+        
+        with ResultCache(str(tmp_path / "cache"), shards=4) as cache:
+            assert list(iter_results(documents, workers=1, chunk_size=4, cache=cache)) == expected, "First run should match uncached results"
+            assert cache.hits == 0 and cache.misses == len(documents), "First run should miss every document"
+        
+        changed = documents[:]
+        changed[0] = ("doc-0", changed[0][1] + "Amended 2024-01-01.\n")
+        with ResultCache(str(tmp_path / "cache"), shards=4) as cache:
+            results = list(iter_results(changed, workers=2, chunk_size=4, cache=cache))
+            assert results == list(iter_results(changed, workers=1)), "Cached results should match uncached results"
+            assert (cache.hits, cache.misses) == (29, 2), "Only the changed document and the one without text should miss"
+            assert 0 < cache.hit_rate() < 1 and cache.seconds_saved > 0, "Should report hit rate and time saved"
+        
+        with ResultCache(str(tmp_path / "cache"), shards=4, version="next") as cache:
+            assert cache.size() == 0, "Another extractor version should empty the cache"
+        
+        with ResultCache(str(tmp_path / "small"), max_bytes=2000, shards=2) as cache:
+            list(iter_results(documents, workers=1, cache=cache))
+            assert 0 < cache.size() <= 2000, "Eviction should keep the cache under its size limit"
+        
+        test_obj.yakshaAssert("test_result_cache", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_result_cache", False, "functional")
+        pytest.fail(f"Result cache test failed: {str(e)}")
+
+def test_extraction_cache(test_obj):
+    """Test LRU caching of citation extractors, its statistics and limits"""
+    try:
+        import threading
+        
+        for cache, evictions in [(ExtractionCache(extract_case_name, max_entries=2), None),
+                                 (ExtractionCache(extract_case_name, max_entries=2, max_bytes=10000), 2)]:
+            for citation in ["A v. B, 1", "A v. B, 1", "C v. D, 2", "E vs. F, 3", "A v. B, 1"]:
+                assert cache(citation) == extract_case_name(citation), "Cached result should match"
+            stats = cache.stats()
+            assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (1, 4, evictions, 2), "LRU stats mismatch"
+        
+        cache.clear()
+        assert cache.stats()["entries"] == 0 and cache.stats()["hits"] == 0, "Clear should empty the cache"
+        
+        byte_cache = ExtractionCache(extract_parties, max_entries=None, max_bytes=400)
+        for case_name in ["A v. B", "C v. D", "E v. F", "G v. H"]:
+            assert byte_cache(case_name) == extract_parties(case_name), "Cached parties should match"
+        assert byte_cache.stats()["bytes"] <= 400, "Should stay within the byte limit"
+        assert byte_cache.stats()["evictions"] > 0, "Should evict to meet the byte limit"
+        
+        shared = ExtractionCache(extract_parties, max_entries=5, max_bytes=10000)
+        def worker():
+            for i in range(200):
+                assert shared(f"P{i % 10} v. D") == (f"P{i % 10}", "D")
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = shared.stats()
+        assert stats["hits"] + stats["misses"] == 800 and stats["entries"] <= 5, "Threaded stats mismatch"
+        
+        test_obj.yakshaAssert("test_extraction_cache", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_extraction_cache", False, "functional")
+        pytest.fail(f"Extraction cache test failed: {str(e)}")
+
+def test_batch_cli(test_obj, tmp_path):
+    """Test the non-interactive command-line interface"""
+    try:
+        import json
+        
+        source = tmp_path / "docs.jsonl"
+        records = [{"id": "a", "text": "Client: John Doe\nDOB: 1980-05-15"}, {"id": "b", "text": None}]
+        source.write_text("".join(json.dumps(record) + "\n" for record in records))
+        output = tmp_path / "results.jsonl"
+        
+        assert cli(["extract", "--op", "client", "--field", "DOB", "--in", str(source), "--out", str(output)]) == 0, "Should exit cleanly"
+        results = [json.loads(line) for line in output.read_text().splitlines()]
+        assert results == [{"id": "a", "result": "1980-05-15"}, {"id": "b", "error": "Text and field cannot be None"}], "Unexpected client results"
+        
+        source.write_text('{"id": "n", "text": 42}\nnot json\n{"id": "a", "text": "smith v. jones"}\n')
+        for argv in (["--op", "case"], ["--op", "string", "--string-op", "upper"]):
+            cli(["extract", *argv, "--in", str(source), "--out", str(output)])
+            results = [json.loads(line) for line in output.read_text().splitlines()]
+            assert results[0] == {"id": "n", "error": "Text must be a string, not int"}, "Non-string text should be an error row"
+            assert results[1]["id"] == 2 and results[1]["error"].startswith("Invalid JSON"), "Invalid JSON should be an error row"
+            assert "result" in results[2], "Bad records should not end the stream"
+        
+        text_source = tmp_path / "citations.txt"
+        text_source.write_text("Smith v. Jones, 1 F.3d\nBrown vs. Board, 347 U.S. 483\n")
+        cli(["extract", "--op", "case", "--format", "text", "--in", str(text_source), "--out", str(output)])
+        results = [json.loads(line)["result"] for line in output.read_text().splitlines()]
+        assert results[1] == {"case_name": "Brown vs. Board", "plaintiff": "Brown", "defendant": "Board"}, "Unexpected case results"
+        
+        cli(["extract", "--op", "string", "--string-op", "replace", "--old", "v.", "--new", "versus",
+             "--format", "text", "--in", str(text_source), "--out", str(output)])
+        assert json.loads(output.read_text().splitlines()[0])["result"] == "Smith versus Jones, 1 F.3d", "Unexpected replace result"
+        
+        test_obj.yakshaAssert("test_batch_cli", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_batch_cli", False, "functional")
+        pytest.fail(f"Batch CLI test failed: {str(e)}")
+
+def test_dates_batch_engines(test_obj):
+    """Test that every date engine matches extract_date"""
+    try:
+        texts = ["Filed on 2023-05-15.", "No dates here", "(2022-01-01) and 2023-12-31", "",
+                 "Meeting on 20230515", "Due: 2024-02-29;", "Non-ASCII \u00a02021-03-04\u00a0",
+                 "See ((((((((((2020-02-02.)))))))))) and 2021-01-01", "x2020-01-01 caf\u00e9 2020-03-03"]
+        expected = [extract_date(text) for text in texts]
+        assert extract_dates_batch(texts) == expected, "Python engine should match extract_date"
+        
+        pytest.importorskip("numpy")
+        assert extract_dates_batch(texts, engine="numpy") == expected, "NumPy engine should match extract_date"
+        assert extract_dates_batch(texts, engine="numpy", batch_size=2) == expected, "Batching should not change results"
+        
+        test_obj.yakshaAssert("test_dates_batch_engines", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_dates_batch_engines", False, "functional")
+        pytest.fail(f"Dates batch engines test failed: {str(e)}")
+
+def test_instrumentation(test_obj):
+    """Test opt-in instrumentation of the extractors"""
+    try:
+        import json
+        import legal_string_processor
+        
+        original = legal_string_processor.extract_date
+        with instrumented() as stats:
+            legal_string_processor.extract_date("Filed on 2023-05-15")
+            legal_string_processor.find_section("SECTION 1\nContent", "SECTION 1")
+            with pytest.raises(ValueError):
+                legal_string_processor.extract_client_info(None, "Client")
+        
+        assert legal_string_processor.extract_date is original, "Leaving the block should restore the extractor"
+        assert not hasattr(original, "__wrapped__"), "Extractors should not be wrapped while instrumentation is off"
+        assert "_timed_call" not in original.__code__.co_names, "Leaving the block should restore the extractor code"
+        assert get_instrumentation() is None, "Instrumentation should be disabled afterwards"
+        
+        snapshot = json.loads(stats.to_json())
+        assert snapshot["extract_date"]["calls"] == 1, "Should count calls"
+        assert snapshot["extract_date"]["input_sizes"] == {"32": 1}, "Should bucket input sizes"
+        assert snapshot["extract_client_info"]["errors"] == 1, "Should count failed calls"
+        assert snapshot["find_section"]["p50_seconds"] > 0, "Should record latencies"
+        assert snapshot["extract_parties"]["calls"] == 0, "Uncalled extractors should be empty"
+        
+        import threading
+        import corpus_runner
+        with instrumented() as stats:
+            corpus_runner.process_document(1, "Client: John Doe\nSmith v. Jones, filed 2023-05-15")
+            DEFAULT_PROCESSOR.extract_case_name("Smith v. Jones, 123 F.3d 456")
+            other = threading.Thread(target=extract_date, args=("Filed on 2023-05-15",))
+            other.start()
+            other.join()
+        snapshot = stats.snapshot()
+        assert snapshot["extract_case_name"]["calls"] == 2, "Names imported elsewhere and methods should be counted"
+        assert snapshot["find_section"]["calls"] == 1 and snapshot["extract_client_info"]["calls"] >= 1, "Every operation should be counted"
+        assert snapshot["extract_date"]["calls"] == 1, "Calls in other threads should not be counted"
+        
+        test_obj.yakshaAssert("test_instrumentation", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_instrumentation", False, "functional")
+        pytest.fail(f"Instrumentation test failed: {str(e)}")
+
+def test_async_pipeline(test_obj, tmp_path):
+    """Test that the async pipeline keeps input order and matches process_document"""
+    try:
+        from async_pipeline import SimulatedLatencyReader, process_files, process_files_sequentially
+        from corpus_runner import process_document
+        
+        paths = []
+        for i in range(30):
+            path = tmp_path / f"doc{i:02d}.txt"
+            path.write_text(f"Smith {i} v. Jones, 1 F.3d\nClient: Client {i}\nSECTION 1\nFiled 2023-01-{i % 28 + 1:02d}.\n")
+            paths.append(str(path))
+        
+        expected = [process_document(path, open(path, encoding="utf-8").read()) for path in paths]
+        results = process_files(paths, reader=SimulatedLatencyReader(0.001), concurrency=5, workers=2, queue_size=2)
+        assert results == expected, "Pipeline results should match process_document in input order"
+        assert process_files_sequentially(paths) == expected, "Sequential results should match process_document"
+        assert process_files([]) == [], "No paths should give no results"
+        
+        test_obj.yakshaAssert("test_async_pipeline", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_async_pipeline", False, "functional")
+        pytest.fail(f"Async pipeline test failed: {str(e)}")
+
+def test_async_pipeline_instrumentation(test_obj, tmp_path):
+    """Test that instrumentation counts extractions the async pipeline runs in its executor"""
+    try:
+        from async_pipeline import process_files
+        
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"doc{i}.txt"
+            path.write_text(f"Smith {i} v. Jones, 1 F.3d\nFiled 2023-01-0{i + 1}.\n")
+            paths.append(str(path))
+        
+        with instrumented() as stats:
+            process_files(paths, workers=2)
+        snapshot = stats.snapshot()
+        assert snapshot["extract_case_name"]["calls"] == 5, "Executor extractions should be counted"
+        assert snapshot["extract_date"]["calls"] == 5, "Every operation should be counted"
+        assert get_instrumentation() is None, "Instrumentation should be disabled afterwards"
+        
+        test_obj.yakshaAssert("test_async_pipeline_instrumentation", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_async_pipeline_instrumentation", False, "functional")
+        pytest.fail(f"Async pipeline instrumentation test failed: {str(e)}")
+
+def test_result_writer(test_obj, tmp_path):
+    """Test that buffered CSV and JSONL output holds every result in order"""
+    try:
+        import csv
+        import json
+        from corpus_runner import iter_results, run_corpus
+        from result_writer import ResultWriter, result_columns
+        
+        documents = [(i, f"Smith {i} v. Jones\nClient: \"Client\", {i}\nSECTION 1\nLine one\nLine two") for i in range(10)] + [("bad", None)]
+        results = list(iter_results(documents, workers=1))
+        
+        with ResultWriter(str(tmp_path / "out.jsonl"), buffer_rows=3) as writer:
+            assert writer.write_many(results) == len(results), "Should count every result"
+        assert writer.rows_written == len(results), "Closing should flush the last block"
+        rows = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert list(rows[0]) == list(result_columns()), "Rows should have every column"
+        for result, row in zip(results, rows):
+            assert row["id"] == result["id"] and row["errors"] == result.get("errors"), "Row should keep id and errors"
+            assert [row["plaintiff"], row["defendant"]] == result.get("parties", [None, None]), "Row should hold the parties"
+            assert row["section"] == result.get("section") and row["client_info:Client"] == result.get("client_info", {}).get("Client"), "Row should hold the values"
+        
+        count = run_corpus(str(tmp_path / "out.jsonl"), str(tmp_path / "out.csv"), workers=1, output_format="csv", buffer_rows=4)
+        with open(tmp_path / "out.csv", newline="", encoding="utf-8") as file:
+            table = list(csv.reader(file))
+        assert count == len(rows) and len(table) == count + 1, "CSV should have a header and one row per document"
+        assert table[0] == list(result_columns()), "CSV header should list the columns"
+        
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet
+        with ResultWriter(str(tmp_path / "out.parquet"), "parquet", buffer_rows=4) as writer:
+            writer.write_many(results)
+        assert pyarrow.parquet.read_table(str(tmp_path / "out.parquet")).column("section").to_pylist() == [result.get("section") for result in results], "Parquet should hold the values"
+        
+        test_obj.yakshaAssert("test_result_writer", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_result_writer", False, "functional")
+        pytest.fail(f"Result writer test failed: {str(e)}")
+
+def test_import_budget(test_obj):
+    """Test that the entry points import within budget without loading the optional engines"""
+    try:
+        from benchmarks.bench_import import budget_failures, measure
+        
+        results = measure(runs=5)
+        failures = budget_failures(results)
+        assert not failures, "; ".join(failures)
+        
+        test_obj.yakshaAssert("test_import_budget", True, "functional")
+    except Exception as e:
+        test_obj.yakshaAssert("test_import_budget", False, "functional")
+        pytest.fail(f"Import budget test failed: {str(e)}")
+
 if __name__ == '__main__':
     pytest.main(['-v'])
\ No newline at end of file